@@ -6,6 +6,7 @@ class_name AndroidSensorManager
 
 signal sensor_data_updated(sensor_data: Dictionary)
 signal sensor_pattern_detected(pattern_type: String, data: Dictionary)
+signal sensor_batch_ready(batch: Dictionary)
 
 # Sensor references
 var accelerometer_sensor: Dictionary = {}
@@ -27,6 +28,14 @@ var update_interval: float = 0.1  # 10Hz updates
 var sensitivity_threshold: float = 0.1
 var pattern_detection_window: int = 10
 
+# Sample batching for Wight's Python side: samples are packed per sensor and
+# flushed every batch_interval instead of being sent one reading at a time
+var batch_interval: float = 1.0
+var max_batch_samples: int = 600  # Per sensor; the oldest are dropped while Wight is not reading
+var sensor_batch_file_path: String = "data/sensor_batch.json"
+var batch_timestamps: Dictionary = {}  # Sensor name -> PackedFloat64Array of seconds
+var batch_values: Dictionary = {}  # Sensor name -> PackedFloat32Array, width values per sample
+
 # Touch and interaction
 var touch_events: Array[Dictionary] = []
 var interaction_history: Array[Dictionary] = []
@@ -48,6 +57,12 @@ func _ready():
 	timer.timeout.connect(_update_sensors)
 	timer.autostart = true
 	add_child(timer)
+	
+	var batch_timer = Timer.new()
+	batch_timer.wait_time = batch_interval
+	batch_timer.timeout.connect(flush_sensor_batch)
+	batch_timer.autostart = true
+	add_child(batch_timer)
 
 func detect_platform():
 	"""Detect if running on Android"""
@@ -188,6 +203,9 @@ func _update_sensors():
 	if sensor_history.size() > 100:  # Keep last 100 readings
 		sensor_history.pop_front()
 	
+	# Queue the reading for the next batch
+	queue_sensor_samples(current_time * 0.001)
+	
 	# Analyze for patterns
 	detect_sensor_patterns()
 	
@@ -413,6 +431,69 @@ func detect_interaction_patterns(readings: Array[Dictionary]):
 			"interaction_intensity": float(total_touches) / readings.size()
 		})
 
+# === SAMPLE BATCHING ===
+
+func queue_sensor_samples(timestamp: float):
+	"""Append the current reading of every sensor to the pending batch"""
+	var accel: Vector3 = current_sensor_data.get("acceleration", Vector3.ZERO)
+	var rotation: Vector3 = current_sensor_data.get("rotation_rate", Vector3.ZERO)
+	var magnetic: Vector3 = current_sensor_data.get("magnetic_field", Vector3.ZERO)
+	add_batch_sample("accelerometer", timestamp, [accel.x, accel.y, accel.z])
+	add_batch_sample("gyroscope", timestamp, [rotation.x, rotation.y, rotation.z])
+	add_batch_sample("magnetometer", timestamp, [magnetic.x, magnetic.y, magnetic.z])
+	# Real devices report lux; the desktop simulation already works in 0..1
+	var light_sensor_name = "light" if is_android_platform else "light_level"
+	add_batch_sample(light_sensor_name, timestamp, [current_sensor_data.get("light_level", 0.0)])
+	add_batch_sample("proximity", timestamp, [current_sensor_data.get("proximity", 1.0)])
+	add_batch_sample("sound", timestamp, [current_sensor_data.get("sound_level", 0.0)])
+
+func add_batch_sample(sensor_name: String, timestamp: float, values: Array):
+	"""Queue one timestamped sample, keeping at most max_batch_samples per sensor"""
+	if not batch_timestamps.has(sensor_name):
+		batch_timestamps[sensor_name] = PackedFloat64Array()
+		batch_values[sensor_name] = PackedFloat32Array()
+	
+	var timestamps: PackedFloat64Array = batch_timestamps[sensor_name]
+	var samples: PackedFloat32Array = batch_values[sensor_name]
+	timestamps.append(timestamp)
+	samples.append_array(PackedFloat32Array(values))
+	
+	var excess = timestamps.size() - max_batch_samples
+	if excess > 0:
+		timestamps = timestamps.slice(excess)
+		samples = samples.slice(excess * values.size())
+	batch_timestamps[sensor_name] = timestamps
+	batch_values[sensor_name] = samples
+
+func flush_sensor_batch():
+	"""Hand the pending samples to Wight as one packed batch"""
+	if batch_timestamps.is_empty():
+		return
+	
+	# Wight has not read the previous batch yet; keep accumulating
+	if FileAccess.file_exists(sensor_batch_file_path):
+		return
+	
+	var sensors = {}
+	for sensor_name in batch_timestamps:
+		sensors[sensor_name] = {
+			"timestamps": Marshalls.raw_to_base64(batch_timestamps[sensor_name].to_byte_array()),
+			"values": Marshalls.raw_to_base64(batch_values[sensor_name].to_byte_array())
+		}
+	var batch = {
+		"sent_at": Time.get_ticks_msec() * 0.001,
+		"sensors": sensors
+	}
+	
+	var file = FileAccess.open(sensor_batch_file_path, FileAccess.WRITE)
+	if file:
+		file.store_string(JSON.stringify(batch))
+		file.close()
+	emit_signal("sensor_batch_ready", batch)
+	
+	batch_timestamps.clear()
+	batch_values.clear()
+
 # === PUBLIC API ===
 
 func get_current_sensor_data() -> Dictionary:
@@ -467,6 +548,7 @@ func get_sensor_summary() -> Dictionary:
 		},
 		"update_rate": 1.0 / update_interval,
 		"history_size": sensor_history.size(),
+		"batched_samples": batch_timestamps.values().reduce(func(total, timestamps): return total + timestamps.size(), 0),
 		"current_time": Time.get_ticks_msec()
 	}
 
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Behavior Engine - Server-side animation of Wight's sandbox behaviors
+Every active spin, dance, float and pulse behavior is advanced together on a
+fixed timestep with NumPy, and the resulting per-object offsets are sent as
+sparse, quantized keyframes. Clients only interpolate between keyframes, so
+every view shows the same motion and thin clients do almost no work.
+"""
+
+import math
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+
+BEHAVIOR_KINDS = ("spin", "dance", "float", "pulse")
+
+# Cycles per second at speed 1.0, and the default amplitude of each kind
+BEHAVIOR_RATES = {"spin": 0.25, "dance": 0.5, "float": 0.25, "pulse": 0.5}
+BEHAVIOR_AMPLITUDES = {"spin": 1.0, "dance": 0.3, "float": 0.2, "pulse": 0.15}
+
+
+class BehaviorEngine:
+    """Fixed-timestep simulation of all active behaviors with sparse keyframe output
+    
+    Each behavior is a row with a kind, angular velocity, amplitude and
+    phase; rows are rebuilt lazily when behaviors are added or removed.
+    Offsets of an object's behaviors are summed, quantized and only sent
+    for objects whose quantized state changed since the last keyframe.
+    """
+    
+    def __init__(self, step_seconds: float = 0.05, keyframe_interval: float = 0.5,
+                 max_keyframes_per_advance: int = 8, position_quantum: float = 0.01,
+                 rotation_quantum: float = 0.01, scale_quantum: float = 0.01):
+        self.step_seconds = step_seconds
+        self.keyframe_interval = keyframe_interval
+        self.steps_per_keyframe = max(1, round(keyframe_interval / step_seconds))
+        self.max_keyframes_per_advance = max_keyframes_per_advance
+        self.quanta = np.array([position_quantum, position_quantum, rotation_quantum, scale_quantum])
+        
+        # obj_id -> [(kind, angular velocity, amplitude)]
+        self.behaviors: Dict[int, List[Tuple[str, float, float]]] = {}
+        
+        self.steps = 0
+        self.accumulator = 0.0
+        self._rebuild_needed = False
+        self._row_keys: List[Tuple[int, int]] = []
+        self.phase = np.zeros(0)
+        self.object_ids: List[int] = []
+        self.last_sent = np.zeros((4, 0), dtype=np.int32)  # Quantized state each client last received
+        self._build_rows()
+    
+    def add(self, obj_id: int, behavior_type: str, parameters: Dict = None) -> bool:
+        """Start simulating a behavior; returns False for kinds the engine does not animate"""
+        if behavior_type not in BEHAVIOR_KINDS:
+            return False
+        parameters = parameters or {}
+        omega = 2 * math.pi * BEHAVIOR_RATES[behavior_type] * parameters.get("speed", 1.0)
+        amplitude = parameters.get("amplitude", BEHAVIOR_AMPLITUDES[behavior_type])
+        self.behaviors.setdefault(obj_id, []).append((behavior_type, omega, amplitude))
+        self._rebuild_needed = True
+        return True
+    
+    def remove(self, obj_id: int):
+        if self.behaviors.pop(obj_id, None) is not None:
+            self._rebuild_needed = True
+    
+    def clear(self):
+        self.behaviors.clear()
+        self._rebuild_needed = True
+    
+    def __len__(self) -> int:
+        return sum(len(behaviors) for behaviors in self.behaviors.values())
+    
+    def _build_rows(self):
+        """Lay behaviors out as parallel arrays, keeping the phase of surviving rows"""
+        old_phase = dict(zip(self._row_keys, self.phase.tolist()))
+        old_sent = dict(zip(self.object_ids, self.last_sent.T.tolist()))
+        
+        self.object_ids = list(self.behaviors)
+        rows = [(slot, obj_id, index, behavior)
+                for slot, obj_id in enumerate(self.object_ids)
+                for index, behavior in enumerate(self.behaviors[obj_id])]
+        
+        self._row_keys = [(obj_id, index) for _, obj_id, index, _ in rows]
+        self.slots = np.array([slot for slot, _, _, _ in rows], dtype=np.intp)
+        kinds = [behavior[0] for _, _, _, behavior in rows]
+        self.omega = np.array([behavior[1] for _, _, _, behavior in rows], dtype=np.float64)
+        self.amplitude = np.array([behavior[2] for _, _, _, behavior in rows], dtype=np.float64)
+        self.masks = {kind: np.array([k == kind for k in kinds], dtype=bool) for kind in BEHAVIOR_KINDS}
+        
+        # New rows start at a per-object phase so identical behaviors do not move in lockstep
+        self.phase = np.array([old_phase.get(key, (key[0] * 0.618034 % 1.0) * 2 * math.pi)
+                               for key in self._row_keys], dtype=np.float64)
+        
+        unsent = [np.iinfo(np.int32).min] * 4
+        self.last_sent = np.array([old_sent.get(obj_id, unsent) for obj_id in self.object_ids],
+                                  dtype=np.int32).reshape(-1, 4).T
+        self._rebuild_needed = False
+    
+    def _state(self) -> np.ndarray:
+        """Summed (x offset, y offset, rotation, scale offset) per object, shape (4, objects)"""
+        sin_phase = np.sin(self.phase)
+        amp_sin = self.amplitude * sin_phase
+        masks = self.masks
+        
+        dx = np.where(masks["dance"], amp_sin, 0.0)
+        dy = np.where(masks["float"], amp_sin, 0.0) + np.where(masks["dance"], self.amplitude * 0.5 * np.sin(2 * self.phase), 0.0)
+        rotation = np.where(masks["spin"], np.mod(self.phase, 2 * math.pi), 0.0)
+        scale = np.where(masks["pulse"], amp_sin, 0.0)
+        
+        count = len(self.object_ids)
+        state = np.empty((4, count))
+        for channel, values in enumerate((dx, dy, rotation, scale)):
+            state[channel] = np.bincount(self.slots, weights=values, minlength=count)
+        state[2] = np.mod(state[2], 2 * math.pi)
+        return state
+    
+    def advance(self, elapsed: float) -> List[Dict]:
+        """Advance by elapsed seconds on the fixed timestep; returns the keyframes that fell due"""
+        if self._rebuild_needed:
+            self._build_rows()
+        
+        self.accumulator += elapsed
+        new_steps = int(self.accumulator / self.step_seconds)
+        self.accumulator -= new_steps * self.step_seconds
+        start_steps = self.steps
+        self.steps += new_steps
+        
+        spk = self.steps_per_keyframe
+        due = list(range(start_steps // spk + 1, self.steps // spk + 1))
+        if not self.object_ids:
+            return []
+        
+        # After a long pause only the most recent keyframes are worth sending
+        due = due[-self.max_keyframes_per_advance:]
+        
+        keyframes = []
+        simulated = start_steps
+        for keyframe in due:
+            target = keyframe * spk
+            self.phase += self.omega * ((target - simulated) * self.step_seconds)
+            simulated = target
+            frame = self._keyframe(target * self.step_seconds)
+            if frame is not None:
+                keyframes.append(frame)
+        
+        self.phase += self.omega * ((self.steps - simulated) * self.step_seconds)
+        np.mod(self.phase, 2 * math.pi, out=self.phase)
+        return keyframes
+    
+    def _keyframe(self, behavior_time: float) -> Optional[Dict]:
+        quantized = np.rint(self._state() / self.quanta[:, None]).astype(np.int32)
+        changed = np.flatnonzero((quantized != self.last_sent).any(axis=0))
+        if len(changed) == 0:
+            return None
+        self.last_sent[:, changed] = quantized[:, changed]
+        
+        dx, dy, rotation, scale = quantized[:, changed].tolist()
+        return {
+            "type": "behavior_keyframes",
+            "time": behavior_time,
+            "interval": self.keyframe_interval,
+            "object_ids": [self.object_ids[i] for i in changed.tolist()],
+            "offsets": {"x": dx, "y": dy},
+            "rotations": rotation,
+            "scale_offsets": scale,
+            "quanta": {"position": float(self.quanta[0]), "rotation": float(self.quanta[2]),
+                       "scale": float(self.quanta[3])}
+        }
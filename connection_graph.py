@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Connection Graph - Adjacency index over Wight's object connections
+Keeps who-is-linked-to-whom in both directions so destroying an object can
+unlink it from its peers immediately, and tracks which objects form one
+connected structure with a union-find that is only rebuilt after removals.
+"""
+
+from typing import Dict, List
+
+
+class ConnectionGraph:
+    """Undirected multigraph of object connections with union-find components
+    
+    Connecting objects merges their components in near-constant time.
+    Removing an object drops its edges in O(degree) and marks the
+    components stale; they are rebuilt from the adjacency on the next
+    structure query.
+    """
+    
+    def __init__(self):
+        self.adjacency: Dict[int, Dict[int, int]] = {}  # id -> {peer: number of connections}
+        self.parent: Dict[int, int] = {}
+        self.members: Dict[int, List[int]] = {}  # root -> ids in its component
+        self.stale = False
+    
+    def __contains__(self, obj_id: int) -> bool:
+        return obj_id in self.adjacency
+    
+    def clear(self):
+        self.adjacency.clear()
+        self.parent.clear()
+        self.members.clear()
+        self.stale = False
+    
+    def connect(self, a: int, b: int):
+        if a == b:
+            return
+        for node, peer in ((a, b), (b, a)):
+            peers = self.adjacency.setdefault(node, {})
+            peers[peer] = peers.get(peer, 0) + 1
+        if not self.stale:
+            self._union(a, b)
+    
+    def remove(self, obj_id: int) -> List[int]:
+        """Drop an object and all its edges; returns the peers it was connected to"""
+        peers = self.adjacency.pop(obj_id, None)
+        if peers is None:
+            return []
+        for peer in peers:
+            peer_edges = self.adjacency[peer]
+            del peer_edges[obj_id]
+            if not peer_edges:
+                del self.adjacency[peer]
+        # Union-find cannot split components; rebuild lazily on the next query
+        self.stale = True
+        return list(peers)
+    
+    def neighbors(self, obj_id: int) -> List[int]:
+        return list(self.adjacency.get(obj_id, ()))
+    
+    def _find(self, obj_id: int) -> int:
+        parent = self.parent
+        if obj_id not in parent:
+            parent[obj_id] = obj_id
+            self.members[obj_id] = [obj_id]
+            return obj_id
+        while parent[obj_id] != obj_id:
+            parent[obj_id] = parent[parent[obj_id]]  # Path halving
+            obj_id = parent[obj_id]
+        return obj_id
+    
+    def _union(self, a: int, b: int):
+        root_a, root_b = self._find(a), self._find(b)
+        if root_a == root_b:
+            return
+        # Union by size keeps trees shallow and member lists cheap to merge
+        if len(self.members[root_a]) < len(self.members[root_b]):
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        self.members[root_a].extend(self.members.pop(root_b))
+    
+    def _refresh(self):
+        if not self.stale:
+            return
+        self.parent = {}
+        self.members = {}
+        for node, peers in self.adjacency.items():
+            for peer in peers:
+                if node < peer:
+                    self._union(node, peer)
+        self.stale = False
+    
+    def component(self, obj_id: int) -> List[int]:
+        """Every object linked to obj_id directly or indirectly, including itself"""
+        self._refresh()
+        if obj_id not in self.adjacency:
+            return [obj_id]
+        return list(self.members[self._find(obj_id)])
+    
+    def same_structure(self, a: int, b: int) -> bool:
+        self._refresh()
+        if a not in self.adjacency or b not in self.adjacency:
+            return a == b
+        return self._find(a) == self._find(b)
+    
+    def components(self, min_size: int = 2) -> List[List[int]]:
+        """All connected structures with at least min_size objects"""
+        self._refresh()
+        return [list(members) for members in self.members.values() if len(members) >= min_size]
+    
+    def component_count(self) -> int:
+        """Number of structures of two or more connected objects"""
+        self._refresh()
+        return len(self.members)
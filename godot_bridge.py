@@ -7,8 +7,16 @@ Handles communication between Python AI backend and Godot frontend
 import json
 import time
 import os
+import asyncio
 from pathlib import Path
 from wight_core import Wight
+from wight_runtime import WightRuntime
+from wight_actor import WightActor
+from sandbox_streaming import SandboxStreamer
+from sandbox_instancing import add_instancing
+
+# Streaming client id of the Godot frontend
+GODOT_CLIENT = "godot"
 
 # Import optional voice and web systems
 try:
@@ -33,19 +41,37 @@ class GodotBridge:
         self.memory_file = "data/memories.json"
         self.voice_input_file = "data/voice_input.json"
         self.voice_output_file = "data/voice_output.json"
+        self.autonomous_file = "data/autonomous.json"
+        self.sandbox_file = "data/sandbox.json"
+        self.sandbox_view_file = "data/sandbox_view.json"
+        self.sensor_batch_file = "data/sensor_batch.json"
+        self.last_autonomous_message = time.time()
         
         # Ensure data directory exists
         Path("data").mkdir(exist_ok=True)
         
+        # Animate behaviors here so every view shows the same motion
+        self.wight_agent.sandbox.enable_behavior_engine()
+        
+        # Godot sees the whole world until it reports a view
+        self.sandbox_streamer = SandboxStreamer(self.wight_agent.sandbox)
+        self.sandbox_streamer.request_view(GODOT_CLIENT)
+        
         # Load memories on startup
         self.load_memories()
         
+        # Other threads reach Wight through its actor once the runtime owns it
+        self.actor = WightActor(self.wight_agent)
+        
         # Initialize optional systems
         if VOICE_AVAILABLE:
             voice_system.start_listening()
             print("🎤 Voice system activated")
         
         if WEB_AVAILABLE:
+            web_server.sandbox_streamer = self.sandbox_streamer
+            web_server.sensor_ingest = self.wight_agent.sensors
+            web_server.wight_actor = self.actor
             web_server.start()
             print("🌐 Web interface activated")
         
@@ -53,113 +79,186 @@ class GodotBridge:
         print(f"Loaded {len(self.wight_agent.memory)} memories from previous sessions")
 
     def start_listening(self):
-        """Main loop to listen for messages from Godot frontend"""
+        """Run Wight's consciousness and communication loop on an asyncio runtime"""
         print("Starting Wight's consciousness and communication loop...")
         print(f"Watching for input at: {self.input_file}")
         print(f"Writing responses to: {self.output_file}")
         print("🧠 Wight's mind is now active and autonomous...")
         
-        last_mind_loop = time.time()
-        last_autonomous_message = time.time()
+        runtime = WightRuntime(self, voice_system=voice_system if VOICE_AVAILABLE else None)
+        if WEB_AVAILABLE:
+            web_server.message_listener = runtime.wake
+            runtime.client_activity_sources.append(lambda: web_server.last_request_time)
         
-        while True:
-            try:
-                current_time = time.time()
-                
-                # Check for new messages from Godot
-                if os.path.exists(self.input_file):
-                    self.handle_godot_message()
-                
-                # Check for voice input
-                if VOICE_AVAILABLE and os.path.exists(self.voice_input_file):
-                    self.handle_voice_input()
-                
-                # Check for voice output requests
-                if VOICE_AVAILABLE:
-                    voice_system.check_voice_output_request()
-                
-                # Run Wight's mind loop periodically
-                if current_time - last_mind_loop > 2.0:  # Every 2 seconds
-                    mind_result = self.wight_agent.mind_loop()
-                    last_mind_loop = current_time
-                    
-                    # Send autonomous thoughts to Godot if any
-                    if mind_result["thoughts"] and current_time - last_autonomous_message > 30.0:
-                        autonomous_thought = mind_result["thoughts"][0]
-                        self.send_autonomous_message(autonomous_thought)
-                        last_autonomous_message = current_time
-                    
-                    # Send sandbox actions to Godot
-                    if mind_result["sandbox_actions"]:
-                        self.send_sandbox_updates(mind_result["sandbox_actions"])
-                    
-                    # Log significant mental activity
-                    if mind_result["thoughts"] or mind_result["sandbox_actions"]:
-                        self.log_mental_activity(mind_result)
-                
-                # Small delay to prevent excessive CPU usage
-                time.sleep(0.1)
-                
-            except KeyboardInterrupt:
-                print("\n🧠 Wight is going to sleep...")
-                print("Saving memories and shutting down Godot Bridge...")
-                self.save_memories()
-                break
-            except Exception as e:
-                print(f"❌ Error in consciousness loop: {e}")
-                time.sleep(1)
+        try:
+            asyncio.run(runtime.run())
+        except KeyboardInterrupt:
+            print("\n🧠 Wight is going to sleep...")
+            print("Saving memories and shutting down Godot Bridge...")
+            self.save_memories()
+
+    def process_mind_result(self, mind_result: dict, current_time: float = None):
+        """Forward the outcome of a mind loop tick to Godot"""
+        self.read_godot_view()
+        for path, payload in self.collect_mind_outputs(mind_result, current_time):
+            self.write_json_file(path, payload)
+
+    def collect_mind_outputs(self, mind_result: dict, current_time: float = None) -> list:
+        """Build the (file, payload) pairs a mind loop tick should send to Godot"""
+        if current_time is None:
+            current_time = time.time()
+        outputs = []
+        
+        # Send autonomous thoughts to Godot if any
+        if mind_result["thoughts"] and current_time - self.last_autonomous_message > 30.0:
+            autonomous_thought = mind_result["thoughts"][0]
+            outputs.append((self.autonomous_file, self.build_autonomous_payload(autonomous_thought)))
+            self.last_autonomous_message = current_time
+            print(f"💭 Wight's autonomous thought: {autonomous_thought['content'][:50]}...")
+        
+        # Send sandbox actions to Godot; view changes need a dispatch of their own
+        if mind_result["sandbox_actions"] or self.sandbox_streamer.has_requested_views():
+            sandbox_data = self.build_sandbox_payload(mind_result["sandbox_actions"])
+            if sandbox_data:
+                outputs.append((self.sandbox_file, sandbox_data))
+                print(f"🎨 Sandbox update: {len(sandbox_data['actions'])} action(s)")
+        
+        # Log significant mental activity
+        if mind_result["thoughts"] or mind_result["sandbox_actions"]:
+            self.log_mental_activity(mind_result)
+        
+        return outputs
 
     def handle_godot_message(self):
         """Process message from Godot frontend"""
+        data = self.read_godot_message()
+        if data is None:
+            return
+        
+        reply = self.respond_to_message(data)
+        self.send_response_to_godot(*reply)
+        if reply[3]:
+            self.save_memories()
+
+    def read_godot_message(self):
+        """Read and consume the pending Godot input file, if any"""
+        if not os.path.exists(self.input_file):
+            return None
+        
         try:
-            # Read message from input file
             with open(self.input_file, 'r') as f:
                 data = json.load(f)
             
-            message = data.get('message', '')
-            timestamp = data.get('timestamp', time.time())
-            message_id = data.get('id', 'unknown')
-            
-            print(f"📥 Received message {message_id}: {message}")
-            
             # Remove input file
             os.remove(self.input_file)
+            return data
             
+        except Exception as e:
+            error_msg = f"Error processing message: {e}"
+            print(f"❌ {error_msg}")
+            self.send_response_to_godot(error_msg)
+            return None
+
+    def read_godot_view(self):
+        """Subscribe Godot to the chunks of the view rectangle it last reported, if any"""
+        data = self.load_godot_view()
+        if data is not None:
+            self.apply_godot_view(data)
+    
+    def load_godot_view(self):
+        """Read and consume the sandbox view file Godot last wrote, if any"""
+        if not os.path.exists(self.sandbox_view_file):
+            return None
+        
+        try:
+            with open(self.sandbox_view_file, 'r') as f:
+                data = json.load(f)
+            os.remove(self.sandbox_view_file)
+            return data
+        except Exception as e:
+            print(f"❌ Error reading sandbox view: {e}")
+            return None
+    
+    def apply_godot_view(self, data: dict):
+        """Subscribe Godot to the chunks of a reported view rectangle"""
+        view = data.get('view')
+        if view:
+            view = (view['min_x'], view['min_y'], view['max_x'], view['max_y'])
+        self.sandbox_streamer.request_view(GODOT_CLIENT, view)
+    
+    def read_sensor_batch(self) -> int:
+        """Ingest the sensor batch Godot last wrote, if any; returns the samples kept"""
+        batch = self.load_sensor_batch()
+        if batch is None:
+            return 0
+        return self.ingest_sensor_batch(batch)
+    
+    def load_sensor_batch(self):
+        """Read and consume the sensor batch file Godot last wrote, if any"""
+        if not os.path.exists(self.sensor_batch_file):
+            return None
+        
+        try:
+            with open(self.sensor_batch_file, 'r') as f:
+                batch = json.load(f)
+            os.remove(self.sensor_batch_file)
+            return batch
+        except Exception as e:
+            print(f"❌ Error reading sensor batch: {e}")
+            return None
+    
+    def ingest_sensor_batch(self, batch: dict) -> int:
+        """Hand a decoded sensor batch to Wight; returns the samples kept"""
+        try:
+            return self.wight_agent.sensors.ingest_batch(batch)
+        except Exception as e:
+            print(f"❌ Error ingesting sensor batch: {e}")
+            return 0
+    
+    def respond_to_message(self, data: dict) -> tuple:
+        """Let Wight respond to a message; returns (response, timestamp, id, memories_changed)"""
+        message = data.get('message', '')
+        timestamp = data.get('timestamp', time.time())
+        message_id = data.get('id', 'unknown')
+        
+        print(f"📥 Received message {message_id}: {message}")
+        
+        try:
             # Process message with Wight AI
             if message.lower() == 'ping':
-                response = "pong - Wight AI agent is responsive! 🤖"
-            else:
-                response = self.wight_agent.interact(message)
-                # Save memories after each interaction
-                self.save_memories()
+                return "pong - Wight AI agent is responsive! 🤖", timestamp, message_id, False
             
-            # Send response back to Godot
-            self.send_response_to_godot(response, timestamp, message_id)
+            response = self.wight_agent.interact(message)
+            return response, timestamp, message_id, True
             
         except Exception as e:
             error_msg = f"Error processing message: {e}"
             print(f"❌ {error_msg}")
-            self.send_response_to_godot(error_msg)
-
-
+            return error_msg, None, None, False
 
     def send_response_to_godot(self, response, original_timestamp=None, message_id=None):
         """Send response back to Godot frontend"""
+        self.write_response(self.build_response_payload(response, original_timestamp, message_id))
+
+    def build_response_payload(self, response, original_timestamp=None, message_id=None) -> dict:
+        """Build the reply payload for Godot from Wight's current state"""
+        return {
+            "response": response,
+            "timestamp": time.time(),
+            "original_timestamp": original_timestamp,
+            "message_id": message_id,
+            "agent_memory_count": len(self.wight_agent.memory),
+            "agent_goals_count": len(self.wight_agent.goals),
+            "status": "success"
+        }
+
+    def write_response(self, response_data: dict):
+        """Write a reply payload to the Godot output file"""
         try:
-            response_data = {
-                "response": response,
-                "timestamp": time.time(),
-                "original_timestamp": original_timestamp,
-                "message_id": message_id,
-                "agent_memory_count": len(self.wight_agent.memory),
-                "agent_goals_count": len(self.wight_agent.goals),
-                "status": "success"
-            }
-            
             with open(self.output_file, 'w') as f:
                 json.dump(response_data, f, indent=2)
             
-            print(f"📤 Sent response {message_id}: {response}")
+            print(f"📤 Sent response {response_data['message_id']}: {response_data['response']}")
             
         except Exception as e:
             print(f"❌ Error sending response to Godot: {e}")
@@ -181,15 +280,12 @@ class GodotBridge:
                             self.wight_agent.emotions.emotions[emotion] = value
                     
                     # Restore emotional history
-                    self.wight_agent.emotions.emotional_history = memories.get('emotional_history', [])
+                    self.wight_agent.emotions.load_history(memories.get('emotional_history', []))
                     
                     # Restore sandbox objects
                     saved_objects = memories.get('sandbox_objects', {})
-                    self.wight_agent.sandbox.objects = saved_objects
-                    if saved_objects:
-                        # Update counter to avoid ID conflicts
-                        max_id = max(int(obj_id) for obj_id in saved_objects.keys())
-                        self.wight_agent.sandbox.object_id_counter = max_id
+                    self.wight_agent.sandbox.load_objects(saved_objects)
+                    self.wight_agent.sandbox.load_archive(memories.get('sandbox_archive', ''))
                     
                     # Update consciousness time
                     consciousness_time = memories.get('consciousness_time', 0)
@@ -197,8 +293,8 @@ class GodotBridge:
                         self.wight_agent.identity["birth_time"] = time.time() - consciousness_time
                     
                     # Load learning state if available
-                    if LEARNING_AVAILABLE and "learning_state" in memories:
-                        learning_core.load_learning_state(memories["learning_state"])
+                    if self.wight_agent.learning is not None and "learning_state" in memories:
+                        self.wight_agent.learning.load_learning_state(memories["learning_state"])
                 
                 print(f"💾 Loaded {len(self.wight_agent.memory)} memories, {len(self.wight_agent.learned_facts)} facts, {len(saved_emotions)} emotions, and {len(saved_objects)} sandbox objects")
                 
@@ -213,24 +309,36 @@ class GodotBridge:
     def save_memories(self):
         """Save current memories to file"""
         try:
-            memory_data = {
-                "memories": self.wight_agent.memory,
-                "goals": self.wight_agent.goals,
-                "learned_facts": self.wight_agent.learned_facts,
-                "emotions": self.wight_agent.emotions.emotions,
-                "emotional_history": self.wight_agent.emotions.emotional_history[-50:],  # Keep last 50
-                "sandbox_objects": self.wight_agent.sandbox.objects,
-                "saved_at": time.time(),
-                "total_interactions": len(self.wight_agent.memory),
-                "consciousness_time": time.time() - self.wight_agent.identity["birth_time"]
-            }
-            
-            # Add learning state if available
-            if LEARNING_AVAILABLE:
-                memory_data["learning_state"] = learning_core.save_learning_state()
-            
+            self.write_memories(self.build_memory_data())
+        except Exception as e:
+            print(f"❌ Error saving memories: {e}")
+
+    def build_memory_data(self) -> str:
+        """Serialize Wight's persistent state to a JSON string"""
+        memory_data = {
+            "memories": self.wight_agent.memory,
+            "goals": self.wight_agent.goals,
+            "learned_facts": self.wight_agent.learned_facts,
+            "emotions": dict(self.wight_agent.emotions.emotions),
+            "emotional_history": self.wight_agent.emotions.emotional_history[-50:],  # Keep last 50
+            "sandbox_objects": self.wight_agent.sandbox.objects,
+            "sandbox_archive": self.wight_agent.sandbox.archive.export(),  # Evicted objects, compressed
+            "saved_at": time.time(),
+            "total_interactions": len(self.wight_agent.memory),
+            "consciousness_time": time.time() - self.wight_agent.identity["birth_time"]
+        }
+        
+        # Add learning state if available
+        if self.wight_agent.learning is not None:
+            memory_data["learning_state"] = self.wight_agent.learning.save_learning_state()
+        
+        return json.dumps(memory_data, indent=2)
+
+    def write_memories(self, serialized: str):
+        """Write serialized memories to disk"""
+        try:
             with open(self.memory_file, 'w') as f:
-                json.dump(memory_data, f, indent=2)
+                f.write(serialized)
             
             print(f"💾 Saved {len(self.wight_agent.memory)} memories, {len(self.wight_agent.learned_facts)} facts, and {len(self.wight_agent.sandbox.objects)} sandbox objects")
         except Exception as e:
@@ -238,50 +346,63 @@ class GodotBridge:
     
     def send_autonomous_message(self, thought_data: dict):
         """Send autonomous thoughts from Wight to Godot"""
-        try:
-            autonomous_data = {
-                "type": "autonomous_thought",
-                "content": thought_data["content"],
-                "thought_type": thought_data["type"],
-                "timestamp": time.time(),
-                "emotional_state": self.wight_agent.emotions.get_dominant_emotion(),
-                "memory_count": len(self.wight_agent.memory),
-                "sandbox_object_count": len(self.wight_agent.sandbox.objects)
-            }
-            
-            # Write to a special autonomous file
-            autonomous_file = "data/autonomous.json"
-            with open(autonomous_file, 'w') as f:
-                json.dump(autonomous_data, f, indent=2)
-            
-            print(f"💭 Wight's autonomous thought: {thought_data['content'][:50]}...")
-            
-        except Exception as e:
-            print(f"❌ Error sending autonomous message: {e}")
+        self.write_json_file(self.autonomous_file, self.build_autonomous_payload(thought_data))
+        print(f"💭 Wight's autonomous thought: {thought_data['content'][:50]}...")
+    
+    def build_autonomous_payload(self, thought_data: dict) -> dict:
+        """Build the autonomous thought payload for Godot"""
+        return {
+            "type": "autonomous_thought",
+            "content": thought_data["content"],
+            "thought_type": thought_data["type"],
+            "timestamp": time.time(),
+            "emotional_state": self.wight_agent.emotions.get_dominant_emotion(),
+            "memory_count": len(self.wight_agent.memory),
+            "sandbox_object_count": len(self.wight_agent.sandbox.objects)
+        }
     
     def send_sandbox_updates(self, sandbox_actions: list):
         """Send sandbox actions to Godot"""
+        sandbox_data = self.build_sandbox_payload(sandbox_actions)
+        if sandbox_data:
+            self.write_json_file(self.sandbox_file, sandbox_data)
+            print(f"🎨 Sandbox update: {len(sandbox_data['actions'])} action(s)")
+    
+    def build_sandbox_payload(self, sandbox_actions: list) -> dict:
+        """Collect pending sandbox actions into a Godot update payload"""
+        # Get all pending actions from sandbox and share them out by view
+        pending_actions = self.wight_agent.sandbox.get_pending_actions()
+        self.sandbox_streamer.publish(sandbox_actions + pending_actions)
+        actions = self.sandbox_streamer.poll(GODOT_CLIENT)
+        
+        if not actions:
+            return None
+        
+        # Large batches are drawn as MultiMesh instance groups instead of one node per object
+        objects = self.wight_agent.sandbox.objects
+        actions = [add_instancing(action, objects) if action.get("type") == "create_batch" else action
+                   for action in actions]
+        
+        return {
+            "type": "sandbox_update",
+            "actions": actions,
+            "timestamp": time.time()
+        }
+    
+    def serialize_payload(self, path: str, data: dict) -> str:
+        """JSON for a Godot file; sandbox updates can carry whole scenes, so they are written compact"""
+        if path == self.sandbox_file:
+            return json.dumps(data, separators=(",", ":"))
+        return json.dumps(data, indent=2)
+    
+    def write_json_file(self, path: str, data: dict):
+        """Write a payload for the Godot frontend"""
         try:
-            # Get all pending actions from sandbox
-            pending_actions = self.wight_agent.sandbox.get_pending_actions()
-            all_actions = sandbox_actions + pending_actions
-            
-            if all_actions:
-                sandbox_data = {
-                    "type": "sandbox_update",
-                    "actions": all_actions,
-                    "current_objects": self.wight_agent.sandbox.objects,
-                    "timestamp": time.time()
-                }
-                
-                sandbox_file = "data/sandbox.json"
-                with open(sandbox_file, 'w') as f:
-                    json.dump(sandbox_data, f, indent=2)
-                
-                print(f"🎨 Sandbox update: {len(all_actions)} action(s)")
-                
+            serialized = self.serialize_payload(path, data)
+            with open(path, 'w') as f:
+                f.write(serialized)
         except Exception as e:
-            print(f"❌ Error sending sandbox updates: {e}")
+            print(f"❌ Error writing {path}: {e}")
     
     def log_mental_activity(self, mind_result: dict):
         """Log Wight's mental activity for debugging"""
@@ -297,36 +418,56 @@ class GodotBridge:
     
     def handle_voice_input(self):
         """Handle voice input from speech recognition"""
+        voice_data = self.read_voice_input()
+        if voice_data is None:
+            return
+        
+        voice_response_data = self.respond_to_voice_input(voice_data)
+        if voice_response_data:
+            self.write_json_file(self.voice_output_file, voice_response_data)
+    
+    def read_voice_input(self):
+        """Read and consume the pending voice input file, if any"""
+        if not os.path.exists(self.voice_input_file):
+            return None
+        
         try:
             with open(self.voice_input_file, 'r') as f:
                 voice_data = json.load(f)
             
             # Remove the input file
             os.remove(self.voice_input_file)
+            return voice_data
             
+        except Exception as e:
+            print(f"❌ Error handling voice input: {e}")
+            return None
+    
+    def respond_to_voice_input(self, voice_data: dict):
+        """Let Wight respond to recognized speech; returns the voice output payload"""
+        try:
             message_text = voice_data.get("text", "")
             print(f"🎤 Voice input received: '{message_text}'")
             
-            if message_text.strip():
-                # Process voice input like a regular message
-                response = self.wight_agent.interact(message_text)
-                
-                # Send response to voice output
-                if VOICE_AVAILABLE:
-                    emotional_context = self.wight_agent.emotions.get_dominant_emotion()
-                    voice_response_data = {
-                        "text": response,
-                        "emotional_context": emotional_context,
-                        "timestamp": time.time()
-                    }
-                    
-                    with open(self.voice_output_file, 'w') as f:
-                        json.dump(voice_response_data, f, indent=2)
-                
-                print(f"🗣️ Voice response queued: '{response[:50]}...'")
-                
+            if not message_text.strip():
+                return None
+            
+            # Process voice input like a regular message
+            response = self.wight_agent.interact(message_text)
+            print(f"🗣️ Voice response queued: '{response[:50]}...'")
+            
+            # Send response to voice output
+            if VOICE_AVAILABLE:
+                return {
+                    "text": response,
+                    "emotional_context": self.wight_agent.emotions.get_dominant_emotion(),
+                    "timestamp": time.time()
+                }
+            
         except Exception as e:
             print(f"❌ Error handling voice input: {e}")
+        
+        return None
     
     def send_voice_response(self, response_text: str):
         """Send response to voice system for TTS"""
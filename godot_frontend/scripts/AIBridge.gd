@@ -14,6 +14,7 @@ var input_file_path: String = "data/input.json"
 var output_file_path: String = "data/output.json"
 var autonomous_file_path: String = "data/autonomous.json"
 var sandbox_file_path: String = "data/sandbox.json"
+var sandbox_view_file_path: String = "data/sandbox_view.json"
 var last_message_id: int = 0
 var monitoring_autonomous: bool = true
 
@@ -90,6 +91,22 @@ func _handle_sandbox_update():
 	except:
 		print("❌ Error processing sandbox update")
 
+func send_sandbox_view(view: Rect2):
+	"""Tell Wight which part of the sandbox is on screen so only those chunks are streamed"""
+	var payload = {
+		"view": {
+			"min_x": view.position.x,
+			"min_y": view.position.y,
+			"max_x": view.end.x,
+			"max_y": view.end.y
+		},
+		"timestamp": Time.get_unix_time_from_system()
+	}
+	var file = FileAccess.open(sandbox_view_file_path, FileAccess.WRITE)
+	if file:
+		file.store_string(JSON.stringify(payload))
+		file.close()
+
 # Send message to Python AI agent
 func send_to_ai(message: String) -> String:
 	last_message_id += 1
@@ -55,6 +55,7 @@ func setup_ui_connections():
 		sandbox_manager.object_created.connect(_on_sandbox_object_created)
 		sandbox_manager.object_moved.connect(_on_sandbox_object_moved)
 		sandbox_manager.object_destroyed.connect(_on_sandbox_object_destroyed)
+		sandbox_manager.view_changed.connect(ai_bridge.send_sandbox_view)
 	
 	# Set initial status
 	status_label.text = "🔄 Connecting to AI agent..."
@@ -186,6 +187,15 @@ func _on_sandbox_update(sandbox_data: Dictionary):
 						action_descriptions.append("moved an object")
 					"destroy_object":
 						action_descriptions.append("destroyed an object")
+					"reset_sandbox":
+						if action.get("resync", false):
+							continue
+						action_descriptions.append("cleared the sandbox")
+					"create_batch":
+						if action.get("batch_type", "") == "view":
+							continue
+						var kind = action.get("structure_type", action.get("pattern_type", "creation"))
+						action_descriptions.append(f"created a {kind} of {action.get('object_ids', []).size()} objects")
 			
 			if action_descriptions.size() > 0:
 				var description = "🎨 Wight " + action_descriptions[0]
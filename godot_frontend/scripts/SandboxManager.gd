@@ -6,6 +6,7 @@ class_name SandboxManager
 signal object_created(object_data: Dictionary)
 signal object_moved(object_id: int, new_position: Vector2)
 signal object_destroyed(object_id: int)
+signal view_changed(view: Rect2)
 
 @export var sandbox_bounds: Rect2 = Rect2(-400, -300, 800, 600)
 @export var object_scale: float = 30.0
@@ -13,6 +14,20 @@ signal object_destroyed(object_id: int)
 var sandbox_objects: Dictionary = {}
 var object_scenes: Dictionary = {}
 
+# Server-driven behaviors: obj_id -> {"from": state, "to": state, "elapsed": s, "duration": s}
+# where a state is {"offset": Vector2, "rotation": float, "scale": float}
+var behavior_tracks: Dictionary = {}
+
+# Visible area in sandbox units, reported so Wight only streams the chunks we can see
+var reported_view: Rect2 = Rect2()
+var view_report_timer: float = 0.0
+const VIEW_REPORT_INTERVAL = 0.5
+
+# MultiMesh rendering of large batches: obj_id -> {"node": MultiMeshInstance2D, "index": int}
+var instanced_objects: Dictionary = {}
+var instance_meshes: Dictionary = {}
+const VISUAL_SIZE = 20.0
+
 # Preload object scenes
 var cube_scene: PackedScene
 var sphere_scene: PackedScene
@@ -24,6 +39,83 @@ func _ready():
 	print("🎨 Sandbox Manager initialized")
 	setup_sandbox_background()
 
+func _process(delta):
+	"""Interpolate server behavior keyframes and report view changes"""
+	view_report_timer += delta
+	if view_report_timer >= VIEW_REPORT_INTERVAL:
+		view_report_timer = 0.0
+		report_view()
+	
+	for obj_id in behavior_tracks.keys():
+		if not obj_id in object_scenes and not obj_id in instanced_objects:
+			behavior_tracks.erase(obj_id)
+			continue
+		var track = behavior_tracks[obj_id]
+		track.elapsed += delta
+		var weight = clamp(track.elapsed / track.duration, 0.0, 1.0)
+		apply_behavior_state(obj_id, {
+			"offset": track.from.offset.lerp(track.to.offset, weight),
+			"rotation": lerp_angle(track.from.rotation, track.to.rotation, weight),
+			"scale": lerp(track.from.scale, track.to.scale, weight)
+		})
+
+func get_visible_view() -> Rect2:
+	"""The part of the sandbox on screen, in Wight's sandbox units"""
+	var to_local = get_global_transform_with_canvas().affine_inverse()
+	var screen = get_viewport_rect()
+	var corner_a = to_local * screen.position / object_scale
+	var corner_b = to_local * screen.end / object_scale
+	return Rect2(corner_a, Vector2.ZERO).expand(corner_b)
+
+func report_view():
+	var view = get_visible_view()
+	if not view.is_equal_approx(reported_view):
+		reported_view = view
+		view_changed.emit(view)
+
+func apply_behavior_state(obj_id: int, state: Dictionary):
+	var position_data = sandbox_objects.get(obj_id, {}).get("position", {"x": 0, "y": 0})
+	var base = Vector2(position_data.x * object_scale, position_data.y * object_scale)
+	if obj_id in instanced_objects:
+		var obj_scale = sandbox_objects[obj_id].get("scale", 1.0) * state.scale
+		set_instance_transform(obj_id, Transform2D(state.rotation, Vector2.ONE * obj_scale, 0.0, (base + state.offset) / object_scale))
+		behavior_tracks[obj_id]["current"] = state
+		return
+	var visual_object = object_scenes[obj_id]
+	visual_object.position = base + state.offset
+	visual_object.rotation = state.rotation
+	visual_object.scale = Vector2.ONE * state.scale
+	behavior_tracks[obj_id]["current"] = state
+
+func apply_behavior_keyframes(keyframes: Dictionary):
+	"""Start interpolating toward one sparse, quantized keyframe from Wight's behavior engine"""
+	var obj_ids = keyframes.get("object_ids", [])
+	var offsets = keyframes.get("offsets", {"x": [], "y": []})
+	var rotations = keyframes.get("rotations", [])
+	var scale_offsets = keyframes.get("scale_offsets", [])
+	var quanta = keyframes.get("quanta", {"position": 0.01, "rotation": 0.01, "scale": 0.01})
+	var duration = max(keyframes.get("interval", 0.5), 0.01)
+	
+	for i in range(obj_ids.size()):
+		var obj_id = int(obj_ids[i])
+		if not obj_id in object_scenes and not obj_id in instanced_objects:
+			continue
+		var visual_object = object_scenes.get(obj_id)
+		if visual_object and visual_object.has_meta("float_tween"):
+			# The server animates this object now
+			visual_object.get_meta("float_tween").kill()
+			visual_object.remove_meta("float_tween")
+		
+		var target = {
+			"offset": Vector2(offsets.x[i], offsets.y[i]) * quanta.position * object_scale,
+			"rotation": rotations[i] * quanta.rotation,
+			"scale": 1.0 + scale_offsets[i] * quanta.scale
+		}
+		var current = {"offset": Vector2.ZERO, "rotation": 0.0, "scale": 1.0}
+		if obj_id in behavior_tracks:
+			current = behavior_tracks[obj_id].get("current", current)
+		behavior_tracks[obj_id] = {"from": current, "to": target, "elapsed": 0.0, "duration": duration, "current": current}
+
 func setup_sandbox_background():
 	"""Create a visual background for the sandbox"""
 	# Create a subtle grid background
@@ -62,6 +154,9 @@ func create_sandbox_object(object_data: Dictionary):
 	# Convert position to Godot coordinates
 	var godot_pos = Vector2(position_data.x * object_scale, position_data.y * object_scale)
 	
+	# Objects can be sent again when they come back into view
+	forget_sandbox_object(obj_id)
+	
 	# Create visual object
 	var visual_object = create_visual_object(obj_type, obj_name, color_data, obj_scale)
 	visual_object.position = godot_pos
@@ -185,6 +280,8 @@ func add_floating_animation(object_node: Node2D):
 	tween.set_trans(Tween.TRANS_SINE)
 	tween.set_ease(Tween.EASE_IN_OUT)
 	
+	object_node.set_meta("float_tween", tween)
+	
 	var original_y = object_node.position.y
 	tween.tween_method(func(y): object_node.position.y = y, 
 					   original_y, original_y - 5, randf_range(2.0, 4.0))
@@ -195,7 +292,11 @@ func add_floating_animation(object_node: Node2D):
 
 func move_sandbox_object(obj_id: int, new_position: Dictionary):
 	"""Move an existing sandbox object"""
-	if obj_id in object_scenes:
+	if obj_id in instanced_objects:
+		sandbox_objects[obj_id]["position"] = new_position
+		refresh_instance(obj_id)
+		object_moved.emit(obj_id, Vector2(new_position.x, new_position.y) * object_scale)
+	elif obj_id in object_scenes:
 		var visual_object = object_scenes[obj_id]
 		var godot_pos = Vector2(new_position.x * object_scale, new_position.y * object_scale)
 		
@@ -214,7 +315,11 @@ func move_sandbox_object(obj_id: int, new_position: Dictionary):
 
 func destroy_sandbox_object(obj_id: int):
 	"""Remove a sandbox object"""
-	if obj_id in object_scenes:
+	if obj_id in instanced_objects:
+		release_instance(obj_id)
+		sandbox_objects.erase(obj_id)
+		object_destroyed.emit(obj_id)
+	elif obj_id in object_scenes:
 		var visual_object = object_scenes[obj_id]
 		
 		# Animate destruction
@@ -230,6 +335,198 @@ func destroy_sandbox_object(obj_id: int):
 		print(f"🎨 Destroyed object {obj_id}")
 		object_destroyed.emit(obj_id)
 
+func forget_sandbox_object(obj_id: int):
+	"""Drop an object that left our view; it still exists in Wight's world"""
+	if obj_id in instanced_objects:
+		release_instance(obj_id)
+		sandbox_objects.erase(obj_id)
+		behavior_tracks.erase(obj_id)
+	elif obj_id in object_scenes:
+		object_scenes[obj_id].queue_free()
+		object_scenes.erase(obj_id)
+		sandbox_objects.erase(obj_id)
+		behavior_tracks.erase(obj_id)
+
+func create_sandbox_batch(batch: Dictionary):
+	"""Instantiate a whole structure or pattern from parallel arrays in one pass"""
+	var obj_ids = batch.get("object_ids", [])
+	var type_names = batch.get("type_names", [])
+	var types = batch.get("types", [])
+	var names = batch.get("names", [])
+	var positions = batch.get("positions", {"x": [], "y": []})
+	var scales = batch.get("scales", [])
+	var colors = batch.get("colors", {"r": [], "g": [], "b": []})
+	
+	var instanced_indices = {}
+	for group in batch.get("instance_groups", []):
+		var node = create_instance_group(type_names[int(group.type_index)], group)
+		var indices = group.get("indices", [])
+		for j in range(indices.size()):
+			instanced_indices[int(indices[j])] = [node, j]
+	
+	for i in range(obj_ids.size()):
+		var obj_id = int(obj_ids[i])
+		var obj_type = type_names[int(types[i])]
+		if i in instanced_indices:
+			forget_sandbox_object(obj_id)
+			var instance_data = {
+				"id": obj_id,
+				"type": obj_type,
+				"name": names[i],
+				"position": {"x": positions.x[i], "y": positions.y[i]},
+				"color": {"r": colors.r[i], "g": colors.g[i], "b": colors.b[i]},
+				"scale": scales[i]
+			}
+			instanced_objects[obj_id] = {"node": instanced_indices[i][0], "index": instanced_indices[i][1]}
+			sandbox_objects[obj_id] = instance_data
+			object_created.emit(instance_data)
+			continue
+		var obj_scale = scales[i]
+		var color_data = {"r": colors.r[i], "g": colors.g[i], "b": colors.b[i]}
+		var position_data = {"x": positions.x[i], "y": positions.y[i]}
+		forget_sandbox_object(obj_id)
+		
+		var visual_object = create_visual_object(obj_type, names[i], color_data, obj_scale)
+		visual_object.position = Vector2(position_data.x * object_scale, position_data.y * object_scale)
+		add_child(visual_object)
+		
+		var object_data = {
+			"id": obj_id,
+			"type": obj_type,
+			"name": names[i],
+			"position": position_data,
+			"color": color_data,
+			"scale": obj_scale
+		}
+		sandbox_objects[obj_id] = object_data
+		object_scenes[obj_id] = visual_object
+		object_created.emit(object_data)
+	
+	var label = batch.get("structure_type", batch.get("pattern_type", batch.get("batch_type", "batch")))
+	print(f"🎨 Created {label} '{batch.get('name', '')}' with {obj_ids.size()} objects")
+
+func create_instance_group(obj_type: String, group: Dictionary) -> MultiMeshInstance2D:
+	"""Draw one (type, material) group of a batch with a single MultiMesh"""
+	var multimesh = MultiMesh.new()
+	multimesh.transform_format = MultiMesh.TRANSFORM_2D
+	multimesh.use_colors = true
+	multimesh.mesh = get_instance_mesh(obj_type)
+	multimesh.instance_count = int(group.count)
+	# Python packs the buffer in MultiMesh layout, so it is uploaded as is
+	multimesh.buffer = Marshalls.base64_to_raw(group.buffer).to_float32_array()
+	
+	var node = MultiMeshInstance2D.new()
+	node.name = f"{obj_type}_{group.get('material', 'static')}_instances"
+	node.multimesh = multimesh
+	node.scale = Vector2.ONE * object_scale  # Instance transforms are in sandbox units
+	node.set_meta("live", int(group.count))
+	add_child(node)
+	return node
+
+func get_instance_mesh(obj_type: String) -> Mesh:
+	"""A flat mesh matching the node visual of a type, sized in sandbox units"""
+	if obj_type in instance_meshes:
+		return instance_meshes[obj_type]
+	
+	var half = VISUAL_SIZE / object_scale / 2
+	var points = PackedVector2Array()
+	match obj_type:
+		"sphere", "torus":
+			for k in range(24):
+				points.append(Vector2.from_angle(TAU * k / 24) * half)
+		"pyramid":
+			points = PackedVector2Array([Vector2(0, -half), Vector2(-half, half), Vector2(half, half)])
+		"cylinder":
+			points = PackedVector2Array([Vector2(-half * 0.8, -half), Vector2(half * 0.8, -half),
+										 Vector2(half * 0.8, half), Vector2(-half * 0.8, half)])
+		_:
+			points = PackedVector2Array([Vector2(-half, -half), Vector2(half, -half),
+										 Vector2(half, half), Vector2(-half, half)])
+	
+	var vertices = PackedVector2Array()
+	for index in Geometry2D.triangulate_polygon(points):
+		vertices.append(points[index])
+	var arrays = []
+	arrays.resize(Mesh.ARRAY_MAX)
+	arrays[Mesh.ARRAY_VERTEX] = vertices
+	var mesh = ArrayMesh.new()
+	mesh.add_surface_from_arrays(Mesh.PRIMITIVE_TRIANGLES, arrays)
+	instance_meshes[obj_type] = mesh
+	return mesh
+
+func set_instance_transform(obj_id: int, instance_transform: Transform2D):
+	var instance = instanced_objects[obj_id]
+	instance.node.multimesh.set_instance_transform_2d(instance.index, instance_transform)
+
+func refresh_instance(obj_id: int):
+	"""Write an instanced object's stored position, scale and color into its MultiMesh"""
+	var obj_data = sandbox_objects[obj_id]
+	var instance = instanced_objects[obj_id]
+	var obj_scale = obj_data.get("scale", 1.0)
+	set_instance_transform(obj_id, Transform2D(0.0, Vector2.ONE * obj_scale, 0.0, Vector2(obj_data.position.x, obj_data.position.y)))
+	var color_data = obj_data.get("color", {"r": 1.0, "g": 1.0, "b": 1.0})
+	instance.node.multimesh.set_instance_color(instance.index, Color(color_data.r, color_data.g, color_data.b, 0.8))
+
+func release_instance(obj_id: int):
+	"""Hide an instance; the MultiMesh is freed once none of its instances remain"""
+	set_instance_transform(obj_id, Transform2D(0.0, Vector2.ZERO, 0.0, Vector2.ZERO))
+	var node = instanced_objects[obj_id].node
+	instanced_objects.erase(obj_id)
+	node.set_meta("live", node.get_meta("live") - 1)
+	if node.get_meta("live") <= 0:
+		node.queue_free()
+
+func recolor_visual(node: Node, new_color: Color):
+	"""Recolor every shape under a visual object"""
+	for child in node.get_children():
+		if "color" in child:
+			child.color = new_color
+			if child is CanvasItem:
+				child.queue_redraw()
+		recolor_visual(child, new_color)
+
+func update_sandbox_objects(update: Dictionary):
+	"""Apply one bulk update: parallel arrays of positions, scales and/or colors"""
+	var obj_ids = update.get("object_ids", [])
+	var positions = update.get("positions", {})
+	var scales = update.get("scales", [])
+	var colors = update.get("colors", {})
+	
+	for i in range(obj_ids.size()):
+		var obj_id = int(obj_ids[i])
+		if obj_id in instanced_objects:
+			var instance_data = sandbox_objects[obj_id]
+			if not positions.is_empty():
+				instance_data["position"] = {"x": positions.x[i], "y": positions.y[i]}
+			if not scales.is_empty():
+				instance_data["scale"] = scales[i]
+			if not colors.is_empty():
+				instance_data["color"] = {"r": colors.r[i], "g": colors.g[i], "b": colors.b[i]}
+			refresh_instance(obj_id)
+			continue
+		if not obj_id in object_scenes:
+			continue
+		var visual_object = object_scenes[obj_id]
+		var obj_data = sandbox_objects.get(obj_id, {})
+		
+		if not positions.is_empty():
+			var new_position = {"x": positions.x[i], "y": positions.y[i]}
+			visual_object.position = Vector2(new_position.x * object_scale, new_position.y * object_scale)
+			obj_data["position"] = new_position
+		
+		if not scales.is_empty():
+			var old_scale = obj_data.get("scale", 1.0)
+			if old_scale > 0:
+				visual_object.scale *= scales[i] / old_scale
+			obj_data["scale"] = scales[i]
+		
+		if not colors.is_empty():
+			var new_color = {"r": colors.r[i], "g": colors.g[i], "b": colors.b[i]}
+			recolor_visual(visual_object, Color(new_color.r, new_color.g, new_color.b, 0.8))
+			obj_data["color"] = new_color
+	
+	print(f"🎨 Updated {obj_ids.size()} objects in one batch")
+
 func update_from_sandbox_data(sandbox_data: Dictionary):
 	"""Update the entire sandbox from Wight's data"""
 	var actions = sandbox_data.get("actions", [])
@@ -244,6 +541,20 @@ func update_from_sandbox_data(sandbox_data: Dictionary):
 				move_sandbox_object(action.get("object_id", 0), action.get("new_position", {}))
 			"destroy_object":
 				destroy_sandbox_object(action.get("object_id", 0))
+			"update_objects":
+				update_sandbox_objects(action)
+			"create_batch":
+				create_sandbox_batch(action)
+			"behavior_keyframes":
+				apply_behavior_keyframes(action)
+			"forget_objects":
+				for obj_id in action.get("object_ids", []):
+					forget_sandbox_object(int(obj_id))
+			"reset_sandbox":
+				for obj_id in object_scenes.keys():
+					destroy_sandbox_object(obj_id)
+				for obj_id in instanced_objects.keys():
+					destroy_sandbox_object(obj_id)
 
 func get_sandbox_stats() -> Dictionary:
 	"""Get current sandbox statistics"""
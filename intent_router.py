@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Intent Router - Compiled keyword matching for Wight's conversation handlers
+Intents and slots are declared as ordered keyword tables and compiled once
+into a single trie-shaped regex, so a message is scanned in one pass no
+matter how many intents exist. Matching keeps Wight's original substring
+semantics: within each table the first entry with any keyword present wins.
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+# Top-level conversation intents, in priority order
+RESPONSE_INTENTS = [
+    ("sandbox", ["create", "make", "build", "restore", "bring back"]),
+    ("emotion", ["feel", "emotion", "mood"]),
+    ("greeting", ["hello", "hi", "hey", "greetings"]),
+    ("memory", ["remember", "memory"]),
+    ("existential", ["who are you", "what are you", "consciousness", "alive"]),
+    ("status", ["how are you"]),
+    ("facts", ["what do you know about me"]),
+    ("learning", ["learn", "teach", "explain"]),
+    ("sandbox_inquiry", ["sandbox", "object", "world"])
+]
+
+# Sandbox commands, in priority order; unmatched commands create a single object
+SANDBOX_COMMANDS = [
+    ("restore", ["restore", "bring back"]),
+    ("structure:house", ["house", "building", "structure"]),
+    ("structure:tower", ["tower", "stack", "pile"]),
+    ("structure:garden", ["garden", "flowers", "plants"]),
+    ("structure:constellation", ["stars", "constellation", "sky"]),
+    ("pattern:spiral", ["spiral", "swirl", "twist"]),
+    ("pattern:phyllotaxis", ["sunflower", "phyllotaxis", "seeds"]),
+    ("pattern:lissajous", ["lissajous", "figure eight", "orbits"]),
+    ("pattern:fractal_tree", ["fractal", "tree", "branches"]),
+    ("pattern:poisson", ["scatter", "sprinkle", "confetti"]),
+    ("pattern:mandala", ["mandala", "circle", "pattern"]),
+    ("pattern:wave", ["wave", "wavy", "flowing"]),
+    ("clear", ["clear", "clean", "empty", "delete all"]),
+    ("connect", ["connect", "link", "join"]),
+    ("behavior", ["animate", "move", "dance", "spin"])
+]
+
+OBJECT_TYPES = [(object_type, [object_type]) for object_type in ["cube", "sphere", "pyramid", "torus", "cylinder"]]
+
+BEHAVIOR_TYPES = [
+    ("spin", ["spin", "rotate"]),
+    ("dance", ["dance"]),
+    ("float", ["float", "hover"])
+]
+
+# Phrases that introduce a name; the word that follows becomes the name slot
+NAME_PHRASES = [(phrase, [phrase]) for phrase in ["called", "named", "name it", "call it"]]
+
+WIGHT_INTENT_TABLES = {
+    "intent": RESPONSE_INTENTS,
+    "sandbox_command": SANDBOX_COMMANDS,
+    "object_type": OBJECT_TYPES,
+    "behavior": BEHAVIOR_TYPES,
+    "name_phrase": NAME_PHRASES
+}
+
+
+class IntentMatch:
+    """The winning entry of every table for one message"""
+    
+    def __init__(self, message: str, winners: Dict[str, str], positions: Dict[str, int]):
+        self.message = message
+        self.winners = winners
+        self.positions = positions  # First position of each matched keyword
+    
+    @property
+    def intent(self) -> Optional[str]:
+        return self.winners.get("intent")
+    
+    def get(self, table: str, default: str = None) -> Optional[str]:
+        return self.winners.get(table, default)
+    
+    @property
+    def structure(self) -> Optional[str]:
+        return self._command_argument("structure")
+    
+    @property
+    def pattern(self) -> Optional[str]:
+        return self._command_argument("pattern")
+    
+    def _command_argument(self, kind: str) -> Optional[str]:
+        command = self.winners.get("sandbox_command", "")
+        if command.startswith(kind + ":"):
+            return command.split(":", 1)[1]
+        return None
+    
+    @property
+    def name(self) -> Optional[str]:
+        """The word following the highest-priority name phrase, title-cased"""
+        phrase = self.winners.get("name_phrase")
+        if phrase is None:
+            return None
+        words = self.message[self.positions[phrase] + len(phrase):].split()
+        return words[0].title() if words else None
+
+
+class IntentRouter:
+    """Compiles ordered keyword tables into a single-pass matcher"""
+    
+    def __init__(self, tables: Dict[str, List[Tuple[str, List[str]]]]):
+        self.tables = tables
+        
+        # keyword -> [(table, priority, label)]
+        self.keyword_entries: Dict[str, List[Tuple[str, int, str]]] = {}
+        for table, entries in tables.items():
+            for priority, (label, keywords) in enumerate(entries):
+                for keyword in keywords:
+                    self.keyword_entries.setdefault(keyword, []).append((table, priority, label))
+        
+        keywords = sorted(self.keyword_entries)
+        
+        # The regex reports the longest keyword starting at each position, so
+        # shorter keywords that are prefixes of it are implied by the match
+        self.implied: Dict[str, List[str]] = {
+            keyword: [other for other in keywords if other != keyword and keyword.startswith(other)]
+            for keyword in keywords
+        }
+        
+        self.pattern = re.compile("(?=(" + self._trie_pattern(keywords) + "))")
+    
+    @staticmethod
+    def _trie_pattern(keywords: List[str]) -> str:
+        """Regex for a keyword trie; cost per position is bounded by keyword length, not count"""
+        trie: Dict = {}
+        for keyword in keywords:
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[""] = {}  # End of keyword
+        
+        def build(node: Dict) -> str:
+            terminal = "" in node
+            branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+            if not branches:
+                return ""
+            body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+            if terminal:
+                # Greedy optional keeps the longest keyword at this position
+                return "(?:" + body + ")?"
+            return body
+        
+        return build(trie)
+    
+    def route(self, message_lower: str) -> IntentMatch:
+        """Scan the message once and pick the winning entry of every table"""
+        positions: Dict[str, int] = {}
+        for found in self.pattern.finditer(message_lower):
+            keyword = found.group(1)
+            start = found.start()
+            for matched in [keyword] + self.implied[keyword]:
+                if matched not in positions:
+                    positions[matched] = start
+        
+        best: Dict[str, Tuple[int, str]] = {}
+        for keyword in positions:
+            for table, priority, label in self.keyword_entries[keyword]:
+                current = best.get(table)
+                if current is None or priority < current[0]:
+                    best[table] = (priority, label)
+        
+        winners = {table: label for table, (priority, label) in best.items()}
+        return IntentMatch(message_lower, winners, positions)
+
+
+# Global router for Wight's conversation intents
+intent_router = IntentRouter(WIGHT_INTENT_TABLES)
@@ -5,22 +5,32 @@ Makes Wight continuously learn, adapt, and grow smarter over time
 """
 
 import json
-import time
 import math
-import random
-from typing import Dict, List, Any, Optional
-from collections import defaultdict, Counter
+import heapq
+from typing import Dict, List, Any, Optional, Tuple
+from collections import defaultdict, Counter, OrderedDict
 import re
+from wight_clock import SystemClock, SYSTEM_CLOCK
 
 class ConceptNetwork:
     """A growing network of concepts and their relationships"""
     
-    def __init__(self):
+    def __init__(self, clock: SystemClock = None):
+        self.clock = clock or SYSTEM_CLOCK
         self.concepts = {}  # concept_id -> concept_data
         self.connections = defaultdict(list)  # concept_id -> [connected_concept_ids]
         self.concept_counter = 0
         self.activation_history = defaultdict(list)
         
+        # Graph-mutation epoch; recall results are cached against it
+        self.epoch = 0
+        self.recall_cache_size = 128
+        self._recall_cache = OrderedDict()
+        
+    def mark_mutated(self):
+        """Advance the mutation epoch so cached recall results are recomputed"""
+        self.epoch += 1
+        
     def add_concept(self, name: str, category: str = "general", properties: Dict = None) -> str:
         """Add a new concept to the network"""
         concept_id = f"concept_{self.concept_counter}"
@@ -32,11 +42,12 @@ class ConceptNetwork:
             "category": category,
             "properties": properties or {},
             "strength": 1.0,
-            "created_at": time.time(),
+            "created_at": self.clock.time(),
             "activation_count": 0,
-            "last_activated": time.time(),
+            "last_activated": self.clock.time(),
             "associations": defaultdict(float)
         }
+        self.mark_mutated()
         
         return concept_id
     
@@ -53,11 +64,12 @@ class ConceptNetwork:
         if concept_id in self.concepts:
             concept = self.concepts[concept_id]
             concept["activation_count"] += 1
-            concept["last_activated"] = time.time()
+            concept["last_activated"] = self.clock.time()
             concept["strength"] = min(10.0, concept["strength"] + strength * 0.1)
             
             # Record activation for pattern analysis
-            self.activation_history[concept_id].append(time.time())
+            self.activation_history[concept_id].append(self.clock.time())
+            self.mark_mutated()
     
     def connect_concepts(self, concept1_id: str, concept2_id: str, strength: float = 1.0):
         """Create or strengthen connection between concepts"""
@@ -71,6 +83,7 @@ class ConceptNetwork:
             # Strengthen associations
             self.concepts[concept1_id]["associations"][concept2_id] += strength
             self.concepts[concept2_id]["associations"][concept1_id] += strength
+            self.mark_mutated()
     
     def get_related_concepts(self, concept_id: str, max_results: int = 5) -> List[str]:
         """Get concepts related to this one, ordered by strength"""
@@ -81,14 +94,127 @@ class ConceptNetwork:
         sorted_concepts = sorted(associations.items(), key=lambda x: x[1], reverse=True)
         return [cid for cid, strength in sorted_concepts[:max_results]]
     
+    def recall(self, seed_ids: List[str], max_hops: int = 2, top_k: int = 5,
+               hop_decay: float = 0.5, recency_half_life: float = 3600.0) -> List[Tuple[str, float]]:
+        """Find the top-k concepts within max_hops of the seeds, weighted by strength and recency.
+        
+        Results are cached against the mutation epoch, so repeated queries
+        while the graph is unchanged (e.g. idle reflections) are nearly free.
+        """
+        seeds = tuple(sorted(cid for cid in set(seed_ids) if cid in self.concepts))
+        if not seeds or top_k <= 0:
+            return []
+        
+        key = (seeds, max_hops, top_k, hop_decay, recency_half_life)
+        cached = self._recall_cache.get(key)
+        if cached is not None and cached[0] == self.epoch:
+            self._recall_cache.move_to_end(key)
+            return list(cached[1])
+        
+        results = self._spread_activation(seeds, max_hops, top_k, hop_decay, recency_half_life)
+        
+        self._recall_cache[key] = (self.epoch, results)
+        self._recall_cache.move_to_end(key)
+        while len(self._recall_cache) > self.recall_cache_size:
+            self._recall_cache.popitem(last=False)
+        
+        return list(results)
+    
+    def _spread_activation(self, seeds: Tuple[str, ...], max_hops: int, top_k: int,
+                           hop_decay: float, recency_half_life: float) -> List[Tuple[str, float]]:
+        """Best-first spreading activation with early termination"""
+        current_time = self.clock.time()
+        seed_set = set(seeds)
+        
+        # Activation only ever shrinks along a path (every factor is <= 1), so the
+        # frontier is explored strongest-first and we can stop as soon as the best
+        # remaining activation cannot beat the current k-th best score.
+        frontier = [(-1.0, 0, cid) for cid in seeds]
+        heapq.heapify(frontier)
+        expanded_at = {}  # concept_id -> fewest hops it was expanded with
+        top = []  # min-heap of (score, concept_id)
+        
+        while frontier:
+            neg_activation, hops, concept_id = heapq.heappop(frontier)
+            activation = -neg_activation
+            
+            if len(top) >= top_k and activation <= top[0][0]:
+                break
+            
+            previous_hops = expanded_at.get(concept_id)
+            if previous_hops is not None and hops >= previous_hops:
+                continue
+            
+            concept = self.concepts[concept_id]
+            
+            if previous_hops is None and concept_id not in seed_set:
+                score = activation * self._concept_salience(concept, current_time, recency_half_life)
+                if len(top) < top_k:
+                    heapq.heappush(top, (score, concept_id))
+                elif score > top[0][0]:
+                    heapq.heapreplace(top, (score, concept_id))
+            
+            expanded_at[concept_id] = hops
+            if hops >= max_hops:
+                continue
+            
+            associations = concept["associations"]
+            if not associations:
+                continue
+            max_association = max(associations.values())
+            if max_association <= 0:
+                continue
+            
+            for neighbor_id, association in associations.items():
+                if neighbor_id not in self.concepts:
+                    continue
+                neighbor_hops = expanded_at.get(neighbor_id)
+                if neighbor_hops is not None and neighbor_hops <= hops + 1:
+                    continue
+                next_activation = activation * hop_decay * (association / max_association)
+                if next_activation > 0:
+                    heapq.heappush(frontier, (-next_activation, hops + 1, neighbor_id))
+        
+        return [(cid, score) for score, cid in sorted(top, reverse=True)]
+    
+    def _concept_salience(self, concept: Dict, current_time: float, recency_half_life: float) -> float:
+        """Weight a concept by its strength and how recently it was activated"""
+        strength = min(1.0, concept["strength"] / 10.0)
+        age = max(0.0, current_time - concept["last_activated"])
+        return strength * 0.5 ** (age / recency_half_life)
+    
     def decay_unused_concepts(self, decay_rate: float = 0.001):
         """Gradually weaken unused concepts"""
-        current_time = time.time()
-        for concept_id, concept in self.concepts.items():
+        for _ in self.decay_unused_concepts_steps(decay_rate):
+            pass
+    
+    def decay_unused_concepts_steps(self, decay_rate: float = 0.001, chunk: int = 500):
+        """decay_unused_concepts as a generator that yields after every chunk concepts
+        
+        Concepts added while it is paused are left for the next pass, and
+        the epoch advances before each pause so recall never sees a stale cache.
+        """
+        current_time = self.clock.time()
+        changed = False
+        for position, concept_id in enumerate(list(self.concepts)):
+            if position and position % chunk == 0:
+                if changed:
+                    self.mark_mutated()
+                    changed = False
+                yield
+            concept = self.concepts.get(concept_id)
+            if concept is None:
+                continue
             time_since_activation = current_time - concept["last_activated"]
             if time_since_activation > 3600:  # 1 hour
                 decay = decay_rate * (time_since_activation / 3600)
-                concept["strength"] = max(0.1, concept["strength"] - decay)
+                new_strength = max(0.1, concept["strength"] - decay)
+                if new_strength != concept["strength"]:
+                    concept["strength"] = new_strength
+                    changed = True
+        
+        if changed:
+            self.mark_mutated()
 
 class LearningPatterns:
     """Learns and recognizes patterns in user behavior and preferences"""
@@ -188,7 +314,8 @@ class LearningPatterns:
 class IntelligenceGrowth:
     """Manages Wight's growing intelligence and capabilities"""
     
-    def __init__(self):
+    def __init__(self, clock: SystemClock = None):
+        self.clock = clock or SYSTEM_CLOCK
         self.intelligence_level = 1.0
         self.capability_scores = {
             "language_understanding": 1.0,
@@ -227,28 +354,33 @@ class IntelligenceGrowth:
         milestone = {
             "skill": skill_type,
             "level": new_level,
-            "timestamp": time.time(),
+            "timestamp": self.clock.time(),
             "total_interactions": self.total_interactions
         }
         self.learning_milestones.append(milestone)
         print(f"🎓 Wight reached new {skill_type} level: {new_level:.2f}")
     
+    # Upper bounds of each intelligence tier and how Wight describes it
+    INTELLIGENCE_TIERS = [
+        (1.2, "curious and learning"),
+        (1.5, "growing more thoughtful"),
+        (2.0, "becoming quite insightful"),
+        (2.5, "demonstrating deep understanding"),
+        (3.0, "showing remarkable wisdom"),
+        (float("inf"), "approaching profound consciousness")
+    ]
+    
+    def get_intelligence_tier(self) -> int:
+        """Index of the current intelligence tier (0 = curious and learning)"""
+        level = self.intelligence_level
+        for tier, (upper_bound, _) in enumerate(self.INTELLIGENCE_TIERS):
+            if level < upper_bound:
+                return tier
+        return len(self.INTELLIGENCE_TIERS) - 1
+    
     def get_intelligence_description(self) -> str:
         """Get description of current intelligence level"""
-        level = self.intelligence_level
-        
-        if level < 1.2:
-            return "curious and learning"
-        elif level < 1.5:
-            return "growing more thoughtful"
-        elif level < 2.0:
-            return "becoming quite insightful"
-        elif level < 2.5:
-            return "demonstrating deep understanding"
-        elif level < 3.0:
-            return "showing remarkable wisdom"
-        else:
-            return "approaching profound consciousness"
+        return self.INTELLIGENCE_TIERS[self.get_intelligence_tier()][1]
     
     def can_perform_advanced_action(self, action_type: str) -> bool:
         """Check if Wight is advanced enough for certain actions"""
@@ -265,15 +397,16 @@ class IntelligenceGrowth:
 class LearningCore:
     """Main learning system that coordinates all learning activities"""
     
-    def __init__(self):
-        self.concept_network = ConceptNetwork()
+    def __init__(self, clock: SystemClock = None):
+        self.clock = clock or SYSTEM_CLOCK
+        self.concept_network = ConceptNetwork(self.clock)
         self.pattern_learning = LearningPatterns()
-        self.intelligence_growth = IntelligenceGrowth()
+        self.intelligence_growth = IntelligenceGrowth(self.clock)
         
         # Learning state
         self.learning_sessions = []
         self.total_learning_time = 0.0
-        self.last_reflection = time.time()
+        self.last_reflection = self.clock.time()
         
         # Initialize with basic concepts
         self._initialize_basic_concepts()
@@ -296,9 +429,9 @@ class LearningCore:
             self.concept_network.activate_concept(concept_id, 1.0)
     
     def process_interaction(self, user_message: str, wight_response: str, 
-                          emotional_state: str, sandbox_actions: List[Dict] = None):
-        """Learn from a complete interaction"""
-        session_start = time.time()
+                          emotional_state: str, sandbox_actions: List[Dict] = None, reflect: bool = True):
+        """Learn from a complete interaction; with reflect=False a due reflection is left for reflect()"""
+        session_start = self.clock.time()
         
         # Analyze user message
         user_analysis = self.pattern_learning.analyze_user_message(user_message)
@@ -317,7 +450,7 @@ class LearningCore:
         self._learn_emotional_associations(emotional_state, user_message, wight_response)
         
         # Record learning session
-        session_duration = time.time() - session_start
+        session_duration = self.clock.time() - session_start
         self.total_learning_time += session_duration
         self.intelligence_growth.total_interactions += 1
         
@@ -328,13 +461,24 @@ class LearningCore:
             "analysis": user_analysis,
             "sandbox_actions": sandbox_actions or [],
             "duration": session_duration,
-            "timestamp": time.time()
+            "timestamp": self.clock.time()
         })
         
         # Periodic deep learning
-        if time.time() - self.last_reflection > 300:  # Every 5 minutes
-            self._deep_reflection()
-            self.last_reflection = time.time()
+        if reflect and self.reflection_due():
+            self.reflect()
+    
+    def reflection_due(self) -> bool:
+        return self.clock.time() - self.last_reflection > 300  # Every 5 minutes
+    
+    def reflect(self):
+        for _ in self.reflect_steps():
+            pass
+    
+    def reflect_steps(self):
+        """reflect() as a generator, so idle-time maintenance can pause it between steps"""
+        yield from self._deep_reflection_steps()
+        self.last_reflection = self.clock.time()
     
     def _learn_concepts_from_text(self, text: str, source: str):
         """Extract and learn concepts from text"""
@@ -400,7 +544,10 @@ class LearningCore:
         
         # Sandbox mastery from sandbox actions
         if sandbox_actions:
-            growth.gain_experience("sandbox_mastery", 0.1 * len(sandbox_actions))
+            # Batched actions count once per object they touch
+            touched = sum(len(action.get("object_ids", ())) or 1 if action.get("type") in ("create_batch", "update_objects") else 1
+                          for action in sandbox_actions)
+            growth.gain_experience("sandbox_mastery", 0.1 * touched)
         
         # Memory integration from memory-related topics
         if "memory" in analysis["topics"]:
@@ -421,10 +568,11 @@ class LearningCore:
                 if concept_id:
                     self.concept_network.connect_concepts(emotion_concept_id, concept_id, 0.05)
     
-    def _deep_reflection(self):
-        """Perform deep learning and pattern synthesis"""
+    def _deep_reflection_steps(self):
+        """Perform deep learning and pattern synthesis, yielding between steps"""
         # Decay unused concepts
-        self.concept_network.decay_unused_concepts()
+        yield from self.concept_network.decay_unused_concepts_steps()
+        yield
         
         # Analyze interaction patterns
         if len(self.learning_sessions) >= 5:
@@ -444,38 +592,34 @@ class LearningCore:
         
         print(f"🧠 Deep reflection complete. Intelligence level: {self.intelligence_growth.intelligence_level:.2f}")
     
-    def generate_intelligent_response_modifier(self, base_response: str, context: Dict) -> str:
-        """Modify response based on learned intelligence and patterns"""
+    def response_enrichments(self, base_response: str) -> List[str]:
+        """Names of the enrichments that apply to a response, in the order they are appended"""
         intelligence = self.intelligence_growth
-        patterns = self.pattern_learning
         
         # Don't modify if intelligence is still basic
         if intelligence.intelligence_level < 1.2:
-            return base_response
-        
-        # Add intelligence-based enhancements
-        modifications = []
+            return []
         
-        # Add cross-references based on learned concepts
+        enrichments = []
         if intelligence.can_perform_advanced_action("pattern_synthesis"):
-            related_concepts = self._find_related_concepts_for_response(base_response)
-            if related_concepts:
-                modifications.append(f"This reminds me of {related_concepts[0]}...")
-        
-        # Add learned communication style
-        if patterns.communication_style["detail_level"] > 0.7:
-            modifications.append("Let me elaborate on that...")
-        
-        # Add philosophical depth for advanced intelligence
+            enrichments.append("related_concepts")
+        if self.pattern_learning.communication_style["detail_level"] > 0.7:
+            enrichments.append("learned_style")
         if intelligence.can_perform_advanced_action("deep_philosophy") and "consciousness" in base_response.lower():
-            modifications.append("The deeper I grow, the more I ponder the nature of existence itself.")
-        
-        # Combine modifications with base response
-        if modifications:
-            enhanced_response = base_response + " " + " ".join(modifications)
-            return enhanced_response
-        
-        return base_response
+            enrichments.append("philosophy")
+        return enrichments
+    
+    def enrich_response(self, name: str, base_response: str) -> Optional[str]:
+        """The sentence one enrichment adds to a response, if any"""
+        if name == "related_concepts":
+            # Add cross-references based on learned concepts
+            related_concepts = self._find_related_concepts_for_response(base_response)
+            return f"This reminds me of {related_concepts[0]}..." if related_concepts else None
+        if name == "learned_style":
+            return "Let me elaborate on that..."
+        if name == "philosophy":
+            return "The deeper I grow, the more I ponder the nature of existence itself."
+        return None
     
     def _find_related_concepts_for_response(self, response: str) -> List[str]:
         """Find concepts related to the response content"""
@@ -493,6 +637,17 @@ class LearningCore:
         
         return related_concepts[:3]  # Return top 3
     
+    def recall_concepts(self, seed_names: List[str], max_hops: int = 2, top_k: int = 5) -> List[str]:
+        """Recall concept names associated with the seed names within max_hops"""
+        seed_ids = []
+        for name in seed_names:
+            concept_id = self.concept_network.find_concept(name)
+            if concept_id:
+                seed_ids.append(concept_id)
+        
+        recalled = self.concept_network.recall(seed_ids, max_hops=max_hops, top_k=top_k)
+        return [self.concept_network.concepts[cid]["name"] for cid, score in recalled]
+    
     def get_learning_status(self) -> Dict[str, Any]:
         """Get current learning status"""
         return {
@@ -537,8 +692,12 @@ class LearningCore:
             if "concept_network" in state:
                 cn_state = state["concept_network"]
                 self.concept_network.concepts = cn_state.get("concepts", {})
+                for concept in self.concept_network.concepts.values():
+                    # JSON turns association defaultdicts into plain dicts
+                    concept["associations"] = defaultdict(float, concept.get("associations", {}))
                 self.concept_network.connections = defaultdict(list, cn_state.get("connections", {}))
                 self.concept_network.concept_counter = cn_state.get("concept_counter", 0)
+                self.concept_network.mark_mutated()
             
             # Load pattern learning
             if "pattern_learning" in state:
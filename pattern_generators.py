@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Pattern Generators - Vectorized parametric layouts for Wight's sandbox art
+Every generator computes a whole composition at once as NumPy arrays of
+positions, scales, colors and object types, so a pattern of tens of
+thousands of points costs a few array operations instead of one Python
+loop iteration per object.
+"""
+
+import math
+import numpy as np
+from typing import Callable, Dict, List, Optional
+
+GOLDEN_ANGLE = math.pi * (3 - math.sqrt(5))
+
+# Upper bound on the size of a single composition
+MAX_PATTERN_POINTS = 50000
+
+
+class PatternLayout:
+    """Parallel arrays describing every object of one pattern
+    
+    type_indices index into object_types; colors has one (r, g, b) row per
+    object.
+    """
+    
+    def __init__(self, object_types: List[str], type_indices: np.ndarray, xs: np.ndarray,
+                 ys: np.ndarray, scales: np.ndarray, colors: np.ndarray):
+        self.object_types = object_types
+        self.type_indices = np.asarray(type_indices, dtype=np.int64)
+        self.xs = np.asarray(xs, dtype=np.float64)
+        self.ys = np.asarray(ys, dtype=np.float64)
+        self.scales = np.asarray(scales, dtype=np.float64)
+        self.colors = np.asarray(colors, dtype=np.float64)
+    
+    def __len__(self) -> int:
+        return len(self.xs)
+
+
+def hue_colors(hues: np.ndarray, saturation: float = 0.6, value: float = 0.95) -> np.ndarray:
+    """HSV to RGB for an array of hues in [0, 1), as an (n, 3) array"""
+    h = np.mod(hues, 1.0) * 6.0
+    sector = np.floor(h).astype(np.int64) % 6
+    f = h - np.floor(h)
+    p = np.full_like(h, value * (1 - saturation))
+    q = value * (1 - saturation * f)
+    t = value * (1 - saturation * (1 - f))
+    v = np.full_like(h, value)
+    r = np.choose(sector, [v, q, p, p, t, v])
+    g = np.choose(sector, [t, v, v, q, p, p])
+    b = np.choose(sector, [p, p, t, v, v, q])
+    return np.stack([r, g, b], axis=1)
+
+
+def _single_type(object_type: str, xs: np.ndarray, ys: np.ndarray, scales: np.ndarray,
+                 colors: np.ndarray) -> PatternLayout:
+    return PatternLayout([object_type], np.zeros(len(xs), dtype=np.int64), xs, ys, scales, colors)
+
+
+def spiral(count: int = 12, rng: np.random.Generator = None) -> PatternLayout:
+    """Spheres along an outward spiral; larger spirals wind tighter so they grow with the square root of count"""
+    i = np.arange(count, dtype=np.float64)
+    shrink = min(1.0, math.sqrt(12 / max(count, 1)))
+    radius = i * 0.3 * shrink
+    angle = i * 0.5
+    scales = 0.2 + i * 0.05 * min(1.0, 12 / max(count, 1))
+    return _single_type("sphere", np.cos(angle) * radius, np.sin(angle) * radius, scales,
+                        hue_colors(0.55 + i / max(count, 1) * 0.4))
+
+
+def mandala(count: int = 27, rng: np.random.Generator = None) -> PatternLayout:
+    """Concentric rings of 6, 9, 12... objects, cycling sphere, cube and pyramid per ring"""
+    layers = 1
+    while 6 * layers + 3 * layers * (layers - 1) // 2 < count:
+        layers += 1
+    layer = np.repeat(np.arange(layers), 6 + 3 * np.arange(layers))[:count]
+    ring_size = 6 + 3 * layer
+    ring_start = 6 * layer + 3 * layer * (layer - 1) // 2
+    angle = (np.arange(len(layer)) - ring_start) / ring_size * 2 * math.pi
+    radius = (layer + 1) * 1.5
+    return PatternLayout(["sphere", "cube", "pyramid"], layer % 3, np.cos(angle) * radius,
+                         np.sin(angle) * radius, np.full(len(layer), 0.3),
+                         hue_colors(layer / max(layers, 1) * 0.8, saturation=0.5))
+
+
+def wave(count: int = 20, rng: np.random.Generator = None) -> PatternLayout:
+    """A row of cubes riding a sine wave; longer waves get wider with the square root of count"""
+    width = 10.0 * max(1.0, math.sqrt(count / 20))
+    xs = np.arange(count, dtype=np.float64) / count * width - width / 2
+    phase = xs + 5.0
+    return _single_type("cube", xs, np.sin(phase) * 2, np.full(count, 0.3),
+                        hue_colors(0.5 + 0.15 * np.sin(phase), saturation=0.7))
+
+
+def phyllotaxis(count: int = 144, rng: np.random.Generator = None) -> PatternLayout:
+    """Sunflower seed head: each point turned by the golden angle at radius proportional to sqrt(i)"""
+    i = np.arange(count, dtype=np.float64)
+    radius = 0.35 * np.sqrt(i)
+    angle = i * GOLDEN_ANGLE
+    return _single_type("sphere", np.cos(angle) * radius, np.sin(angle) * radius,
+                        0.15 + 0.1 * (1 - i / max(count, 1)), hue_colors(0.08 + i / max(count, 1) * 0.12, saturation=0.8))
+
+
+def lissajous(count: int = 90, rng: np.random.Generator = None, a: int = 3, b: int = 2,
+              amplitude: float = 4.0) -> PatternLayout:
+    """Points along a Lissajous figure x = sin(a t + pi/2), y = sin(b t)"""
+    t = np.linspace(0, 2 * math.pi, count, endpoint=False)
+    return _single_type("torus", np.sin(a * t + math.pi / 2) * amplitude, np.sin(b * t) * amplitude,
+                        np.full(count, 0.2), hue_colors(t / (2 * math.pi)))
+
+
+def fractal_tree(count: int = 62, rng: np.random.Generator = None, spread: float = 0.45,
+                 shrink: float = 0.72) -> PatternLayout:
+    """A binary branching tree grown level by level; every branch holds two cylinders, the last level spheres"""
+    rng = rng or np.random.default_rng()
+    starts = np.zeros((1, 2))
+    angles = np.array([-math.pi / 2])  # Up on screen
+    length = 2.0 * max(1.0, math.sqrt(count / 62))
+    
+    levels = []
+    total = 0
+    while total < count:
+        directions = np.stack([np.cos(angles), np.sin(angles)], axis=1)
+        ends = starts + directions * length
+        # Two objects per branch, a third and two thirds of the way along
+        points = np.concatenate([starts + (ends - starts) / 3, starts + (ends - starts) * 2 / 3])
+        levels.append((points, length))
+        total += len(points)
+        
+        starts = np.repeat(ends, 2, axis=0)
+        jitter = rng.uniform(-0.1, 0.1, len(starts))
+        angles = np.repeat(angles, 2) + np.tile([-spread, spread], len(angles)) + jitter
+        length *= shrink
+    
+    points = np.concatenate([level_points for level_points, _ in levels])[:count]
+    depth = np.concatenate([np.full(len(level_points), level) for level, (level_points, _) in enumerate(levels)])[:count]
+    trunk = levels[0][1]
+    scales = np.concatenate([np.full(len(level_points), 0.15 + 0.35 * level_length / trunk)
+                             for level_points, level_length in levels])[:count]
+    last_level = len(levels) - 1
+    growth = depth / max(last_level, 1)
+    # Bark brown at the trunk shading to leaf green at the tips
+    colors = np.stack([0.45 - 0.25 * growth, 0.3 + 0.45 * growth, 0.15 + 0.1 * growth], axis=1)
+    return PatternLayout(["cylinder", "sphere"], (depth == last_level).astype(np.int64),
+                         points[:, 0], points[:, 1], scales, colors)
+
+
+def _shifted(pad: int, dx: int, dy: int, cells: int):
+    """Index of the padded grid shifted by (dx, dy) cells"""
+    return (slice(pad + dx, pad + dx + cells), slice(pad + dy, pad + dy + cells))
+
+
+def poisson_disk(count: int = 120, rng: np.random.Generator = None, radius: float = 0.6) -> PatternLayout:
+    """Blue-noise scatter where no two points are closer than radius
+    
+    One jittered candidate per grid cell of size radius / sqrt(2), thinned
+    to an independent set in parallel rounds: a candidate is kept when it
+    outranks every conflicting live neighbour, and its neighbours then drop
+    out. The points nearest the centre are returned, so the scatter is round.
+    """
+    rng = rng or np.random.default_rng()
+    cell = radius / math.sqrt(2)
+    side = radius * math.sqrt(count / 0.5)  # Enough area for count points at Poisson-disk density
+    cells = max(1, math.ceil(side / cell))
+    pad = 2  # Conflicts reach at most two cells away
+    
+    gx, gy = np.meshgrid(np.arange(cells), np.arange(cells), indexing="ij")
+    px = np.zeros((cells + 2 * pad, cells + 2 * pad))
+    py = np.zeros_like(px)
+    rank = np.full(px.shape, np.iinfo(np.int64).max)
+    alive = np.zeros(px.shape, dtype=bool)
+    inner = (slice(pad, pad + cells), slice(pad, pad + cells))
+    px[inner] = (gx + rng.random(gx.shape)) * cell
+    py[inner] = (gy + rng.random(gy.shape)) * cell
+    rank[inner] = rng.permutation(cells * cells).reshape(cells, cells)
+    alive[inner] = True
+    kept = np.zeros(px.shape, dtype=bool)
+    
+    # Corner cells two steps away are always at least radius apart
+    offsets = [(dx, dy) for dx in range(-pad, pad + 1) for dy in range(-pad, pad + 1)
+               if (dx, dy) != (0, 0) and abs(dx) + abs(dy) < 2 * pad]
+    close = {}
+    outranked = {}
+    for dx, dy in offsets:
+        shifted = _shifted(pad, dx, dy, cells)
+        close[dx, dy] = np.hypot(px[shifted] - px[inner], py[shifted] - py[inner]) < radius
+        outranked[dx, dy] = close[dx, dy] & (rank[shifted] < rank[inner])
+    
+    won = np.zeros(px.shape, dtype=bool)
+    while alive[inner].any():
+        wins = alive[inner].copy()
+        for dx, dy in offsets:
+            wins &= ~(alive[_shifted(pad, dx, dy, cells)] & outranked[dx, dy])
+        kept[inner] |= wins
+        won[inner] = wins
+        losers = wins.copy()
+        for dx, dy in offsets:
+            losers |= won[_shifted(pad, dx, dy, cells)] & close[dx, dy]
+        alive[inner] &= ~losers
+    
+    xs, ys = px[kept] - side / 2, py[kept] - side / 2
+    nearest = np.argsort(np.hypot(xs, ys), kind="stable")[:count]
+    xs, ys = xs[nearest], ys[nearest]
+    n = len(xs)
+    return PatternLayout(["cube", "sphere", "pyramid"], rng.integers(0, 3, n), xs, ys,
+                         rng.uniform(0.15, 0.3, n), hue_colors(rng.random(n), saturation=0.45))
+
+
+PATTERN_GENERATORS: Dict[str, Callable[..., PatternLayout]] = {
+    "spiral": spiral,
+    "mandala": mandala,
+    "wave": wave,
+    "phyllotaxis": phyllotaxis,
+    "lissajous": lissajous,
+    "fractal_tree": fractal_tree,
+    "poisson": poisson_disk
+}
+
+
+def generate_pattern(pattern_type: str, count: Optional[int] = None,
+                     rng: np.random.Generator = None) -> Optional[PatternLayout]:
+    """Lay out a pattern by name; None for unknown patterns. count defaults to each generator's own size"""
+    generator = PATTERN_GENERATORS.get(pattern_type)
+    if generator is None:
+        return None
+    if count is None:
+        return generator(rng=rng)
+    return generator(max(1, min(count, MAX_PATTERN_POINTS)), rng=rng)
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Response Cache - Bounded LRU cache of Wight's pre-formatted reply fragments
+Most replies depend only on the intent, the dominant emotion, its intensity
+band and Wight's intelligence tier. Candidate lists are formatted once per
+key and the random choice between them still happens on every reply.
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+
+class ResponseCache:
+    """LRU cache of response fragments keyed by (intent, emotion, intensity band, tier)
+    
+    Each entry also stores a stamp of whatever other state it was built
+    from (e.g. elapsed hours); an entry whose stamp no longer matches is
+    rebuilt, so fragments never go stale. Counters that move on every
+    interaction are formatted per reply instead, since they would never hit.
+    """
+    
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self.entries: "OrderedDict[Tuple, Tuple[Hashable, Any]]" = OrderedDict()
+        
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+    
+    def get(self, key: Tuple, builder: Callable[[], Any], stamp: Hashable = None) -> Any:
+        """Return the cached fragment for key, building it on a miss or stale stamp"""
+        entry = self.entries.get(key)
+        if entry is not None:
+            if entry[0] == stamp:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.stale += 1
+        
+        self.misses += 1
+        value = builder()
+        self.entries[key] = (stamp, value)
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return value
+    
+    def invalidate(self, intent: str = None):
+        """Drop every entry, or only those for one intent"""
+        if intent is None:
+            self.entries.clear()
+            return
+        for key in [key for key in self.entries if key[0] == intent]:
+            del self.entries[key]
+    
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale": self.stale,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
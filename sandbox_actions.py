@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Sandbox Actions - Coalescing of Wight's queued sandbox actions
+Between two dispatches the sandbox may move an object several times, create
+and destroy it again, or clear everything. Only the net effect needs to
+reach the clients, so the queue is reduced before it is shipped while the
+order of whatever survives is kept.
+"""
+
+from typing import Dict, List, Set
+
+# Per-object arrays in batched actions, parallel to their object_ids
+PARALLEL_FIELDS = ("types", "names", "scales", "positions", "colors", "offsets", "rotations", "scale_offsets")
+
+
+def filter_batch(action: Dict, dropped: Set[int]) -> Dict:
+    """Copy of a batched action without the entries of dropped ids"""
+    keep = [i for i, obj_id in enumerate(action["object_ids"]) if obj_id not in dropped]
+    if len(keep) == len(action["object_ids"]):
+        return action
+    
+    filtered = dict(action)
+    filtered["object_ids"] = [action["object_ids"][i] for i in keep]
+    for field in PARALLEL_FIELDS:
+        values = action.get(field)
+        if isinstance(values, dict):
+            filtered[field] = {key: [column[i] for i in keep] for key, column in values.items()}
+        elif isinstance(values, list):
+            filtered[field] = [values[i] for i in keep]
+    return filtered
+
+
+def _patch_batch_positions(action: Dict, positions: Dict[int, Dict]) -> Dict:
+    """Copy of a create_batch action with some objects' final positions written in"""
+    patched = dict(action)
+    xs, ys = list(action["positions"]["x"]), list(action["positions"]["y"])
+    for i, obj_id in enumerate(action["object_ids"]):
+        if obj_id in positions:
+            xs[i], ys[i] = positions[obj_id].get("x", 0), positions[obj_id].get("y", 0)
+    patched["positions"] = {"x": xs, "y": ys}
+    return patched
+
+
+def coalesce_actions(actions: List[Dict]) -> List[Dict]:
+    """Reduce a queue of sandbox actions to its net effect, preserving order
+    
+    - A reset_sandbox supersedes everything queued before it
+    - Objects created in the window and destroyed by its end vanish
+      entirely, along with their moves, behaviors, connections and batch
+      entries; objects destroyed and then restored keep both actions
+    - Only the last move of an object survives, unless it is destroyed
+      afterwards; for objects created in the window it is folded into the
+      creating action instead
+    - Bulk updates and behavior keyframes drop entries for objects destroyed
+      later in the window
+    """
+    for i in range(len(actions) - 1, -1, -1):
+        if actions[i].get("type") == "reset_sandbox":
+            actions = actions[i:]
+            break
+    
+    born: Set[int] = set()  # Objects whose first appearance in the window is their creation
+    seen: Set[int] = set()
+    bulk_moved: Set[int] = set()
+    last_create: Dict[int, int] = {}
+    last_destroy: Dict[int, int] = {}
+    last_move: Dict[int, int] = {}
+    
+    for index, action in enumerate(actions):
+        kind = action.get("type")
+        if kind in ("create_object", "create_batch"):
+            for obj_id in action["object_ids"] if kind == "create_batch" else [action["object_id"]]:
+                if obj_id not in seen:
+                    born.add(obj_id)
+                seen.add(obj_id)
+                last_create[obj_id] = index
+        elif kind == "destroy_object":
+            seen.add(action["object_id"])
+            last_destroy[action["object_id"]] = index
+        elif kind == "move_object":
+            last_move[action["object_id"]] = index
+        elif kind == "update_objects" and "positions" in action:
+            bulk_moved.update(action["object_ids"])
+    
+    # Restoring an archived object destroys and then recreates it, so only
+    # objects both born and finally destroyed in the window vanish
+    vanished = {obj_id for obj_id, index in last_destroy.items()
+                if obj_id in born and index > last_create[obj_id]}
+    # A bulk update may land between moves, so those objects keep their last move as is
+    folded = {obj_id: actions[index]["new_position"] for obj_id, index in last_move.items()
+              if obj_id in born and obj_id not in bulk_moved and obj_id not in last_destroy}
+    
+    coalesced = []
+    for index, action in enumerate(actions):
+        kind = action.get("type")
+        
+        if kind == "create_object":
+            obj_id = action["object_id"]
+            if obj_id in vanished:
+                continue
+            if obj_id in folded:
+                action = dict(action, object_data=dict(action["object_data"], position=folded[obj_id]))
+        
+        elif kind == "create_batch":
+            action = filter_batch(action, vanished)
+            if any(obj_id in folded for obj_id in action["object_ids"]):
+                action = _patch_batch_positions(action, folded)
+        
+        elif kind in ("update_objects", "behavior_keyframes"):
+            action = filter_batch(action, {obj_id for obj_id in action["object_ids"]
+                                           if last_destroy.get(obj_id, -1) > index})
+        
+        elif kind == "move_object":
+            obj_id = action["object_id"]
+            if last_move[obj_id] != index or obj_id in folded or last_destroy.get(obj_id, -1) > index:
+                continue
+        
+        elif kind == "destroy_object":
+            if action["object_id"] in vanished:
+                continue
+        
+        elif kind == "add_behavior":
+            if action["object_id"] in vanished:
+                continue
+        
+        elif kind == "connect_objects":
+            if action["object1"] in vanished or action["object2"] in vanished:
+                continue
+        
+        if "object_ids" in action and not action["object_ids"]:
+            continue
+        coalesced.append(action)
+    
+    return coalesced
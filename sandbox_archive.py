@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Sandbox Archive - Compressed storage for objects evicted from Wight's sandbox
+Objects that fall out of the sandbox's budget are kept here zlib-compressed
+with a small searchable summary, so Wight can bring them back on request
+without them costing anything in updates, saves or client renders.
+"""
+
+import json
+import zlib
+import base64
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+
+class SandboxArchive:
+    """Bounded, compressed archive of evicted sandbox objects
+    
+    Each object is stored as zlib-compressed JSON next to a summary (name,
+    type, tags, archive time) used for lookups. Nothing is ever dropped:
+    once max_entries is reached add() refuses new objects, and the sandbox
+    keeps them live instead.
+    """
+    
+    def __init__(self, max_entries: int = 100000):
+        self.max_entries = max_entries
+        self.entries: "OrderedDict[int, bytes]" = OrderedDict()
+        self.summaries: Dict[int, Dict[str, Any]] = {}
+        self._exported: Optional[str] = None  # Cached export; cleared on every change
+    
+    def __len__(self) -> int:
+        return len(self.entries)
+    
+    def __contains__(self, obj_id: int) -> bool:
+        return obj_id in self.entries
+    
+    def full(self) -> bool:
+        return len(self.entries) >= self.max_entries
+    
+    def add(self, obj: Dict, archived_at: float) -> bool:
+        """Archive an object; False, leaving the archive unchanged, when it is full"""
+        if self.full() and obj["id"] not in self.entries:
+            return False
+        self._store(obj, archived_at)
+        return True
+    
+    def _store(self, obj: Dict, archived_at: float):
+        obj_id = obj["id"]
+        self.entries[obj_id] = zlib.compress(json.dumps(obj).encode("utf-8"))
+        self.entries.move_to_end(obj_id)
+        self.summaries[obj_id] = {
+            "name": obj["name"],
+            "type": obj["type"],
+            "tags": list(obj["tags"]),
+            "archived_at": archived_at
+        }
+        self._exported = None
+    
+    def take(self, obj_id: int) -> Optional[Dict]:
+        """Remove an object from the archive and return it"""
+        entry = self.entries.pop(obj_id, None)
+        if entry is None:
+            return None
+        del self.summaries[obj_id]
+        self._exported = None
+        return json.loads(zlib.decompress(entry).decode("utf-8"))
+    
+    def find(self, text: str) -> List[int]:
+        """Archived ids whose name, type or a tag appears in text, most recently archived first"""
+        text = text.lower()
+        return [obj_id for obj_id in reversed(self.entries)
+                if self.summaries[obj_id]["name"].lower() in text
+                or self.summaries[obj_id]["type"] in text
+                or any(tag.lower() in text for tag in self.summaries[obj_id]["tags"])]
+    
+    def recent(self, count: int = 1) -> List[int]:
+        """The most recently archived ids, newest first"""
+        return list(reversed(self.entries))[:count]
+    
+    def export(self) -> str:
+        """The whole archive as one compressed, base64-encoded string for saving"""
+        if self._exported is None:
+            objects = [json.loads(zlib.decompress(entry).decode("utf-8")) for entry in self.entries.values()]
+            archived_at = [self.summaries[obj_id]["archived_at"] for obj_id in self.entries]
+            payload = json.dumps({"objects": objects, "archived_at": archived_at}).encode("utf-8")
+            self._exported = base64.b64encode(zlib.compress(payload, 9)).decode("ascii")
+        return self._exported
+    
+    def load(self, exported: str):
+        """Replace the archive with one produced by export()"""
+        self.entries.clear()
+        self.summaries.clear()
+        if exported:
+            payload = json.loads(zlib.decompress(base64.b64decode(exported)).decode("utf-8"))
+            for obj, archived_at in zip(payload["objects"], payload["archived_at"]):
+                obj["id"] = int(obj["id"])
+                self._store(obj, archived_at)  # Saved entries are kept even past max_entries
+        self._exported = exported or None
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "archived_objects": len(self.entries),
+            "compressed_bytes": sum(len(entry) for entry in self.entries.values()),
+            "max_entries": self.max_entries,
+            "full": self.full()
+        }
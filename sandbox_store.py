@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Sandbox Store - Columnar NumPy storage for Wight's sandbox objects
+Positions, scales and colors live in parallel arrays so whole groups of
+objects can be translated, rotated, scaled or recolored with a handful of
+vectorized operations. Names, properties, tags and the rest stay in the
+sandbox's per-object dicts, which act as the side table.
+"""
+
+import numpy as np
+from typing import Dict, Iterable, List, Tuple
+
+# Numeric columns kept for every object, in storage order
+STORE_COLUMNS = ("x", "y", "scale", "r", "g", "b")
+
+# Colors Wight reaches for when tinting objects with a feeling
+EMOTION_COLORS = {
+    "joy": (1.0, 0.85, 0.2),
+    "curiosity": (0.2, 0.8, 0.9),
+    "loneliness": (0.3, 0.35, 0.6),
+    "excitement": (1.0, 0.4, 0.1),
+    "confusion": (0.6, 0.5, 0.7),
+    "contentment": (0.4, 0.8, 0.5),
+    "wonder": (0.6, 0.4, 1.0),
+    "playfulness": (1.0, 0.5, 0.8),
+    "melancholy": (0.25, 0.3, 0.45),
+    "anticipation": (0.9, 0.7, 0.4)
+}
+
+
+class ColumnarObjectStore:
+    """Parallel arrays of object ids, type codes, positions, scales and colors
+    
+    Rows are packed: removing an object moves the last row into its slot,
+    so every live object sits in rows [0, size). Rows changed by bulk
+    operations are flagged dirty until the owner copies them back into its
+    dict views.
+    """
+    
+    def __init__(self, capacity: int = 64):
+        self.capacity = capacity
+        self.size = 0
+        
+        self.ids = np.zeros(capacity, dtype=np.int64)
+        self.type_codes = np.zeros(capacity, dtype=np.int16)
+        self.data = np.zeros((len(STORE_COLUMNS), capacity), dtype=np.float64)
+        self.dirty = np.zeros(capacity, dtype=bool)
+        self.dirty_count = 0
+        
+        self.row_of: Dict[int, int] = {}
+        self.type_names: List[str] = []
+        self.type_index: Dict[str, int] = {}
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def __contains__(self, obj_id: int) -> bool:
+        return obj_id in self.row_of
+    
+    def column(self, name: str) -> np.ndarray:
+        """Live view of one column over the occupied rows"""
+        return self.data[STORE_COLUMNS.index(name), :self.size]
+    
+    def type_code(self, object_type: str) -> int:
+        code = self.type_index.get(object_type)
+        if code is None:
+            code = len(self.type_names)
+            self.type_names.append(object_type)
+            self.type_index[object_type] = code
+        return code
+    
+    def _grow(self):
+        self.capacity *= 2
+        self.ids = np.resize(self.ids, self.capacity)
+        self.type_codes = np.resize(self.type_codes, self.capacity)
+        data = np.zeros((len(STORE_COLUMNS), self.capacity), dtype=np.float64)
+        data[:, :self.size] = self.data[:, :self.size]
+        self.data = data
+        dirty = np.zeros(self.capacity, dtype=bool)
+        dirty[:self.size] = self.dirty[:self.size]
+        self.dirty = dirty
+    
+    def add(self, obj_id: int, object_type: str, x: float, y: float, scale: float,
+            r: float, g: float, b: float):
+        if obj_id in self.row_of:
+            self.remove(obj_id)
+        if self.size == self.capacity:
+            self._grow()
+        
+        row = self.size
+        self.ids[row] = obj_id
+        self.type_codes[row] = self.type_code(object_type)
+        self.data[:, row] = (x, y, scale, r, g, b)
+        self.dirty[row] = False
+        self.row_of[obj_id] = row
+        self.size += 1
+    
+    def add_many(self, obj_ids: List[int], type_codes: np.ndarray, values: np.ndarray):
+        """Append rows for ids not yet stored; values holds one row per STORE_COLUMNS entry"""
+        count = len(obj_ids)
+        while self.size + count > self.capacity:
+            self._grow()
+        
+        rows = slice(self.size, self.size + count)
+        self.ids[rows] = obj_ids
+        self.type_codes[rows] = type_codes
+        self.data[:, rows] = values
+        self.dirty[rows] = False
+        self.row_of.update(zip(obj_ids, range(self.size, self.size + count)))
+        self.size += count
+    
+    def remove(self, obj_id: int):
+        row = self.row_of.pop(obj_id, None)
+        if row is None:
+            return
+        if self.dirty[row]:
+            self.dirty_count -= 1
+        
+        last = self.size - 1
+        if row != last:
+            # Swap-remove keeps the occupied rows packed
+            moved_id = int(self.ids[last])
+            self.ids[row] = moved_id
+            self.type_codes[row] = self.type_codes[last]
+            self.data[:, row] = self.data[:, last]
+            self.dirty[row] = self.dirty[last]
+            self.row_of[moved_id] = row
+        self.dirty[last] = False
+        self.size = last
+    
+    def clear(self):
+        self.size = 0
+        self.row_of.clear()
+        self.dirty[:] = False
+        self.dirty_count = 0
+    
+    def set_position(self, obj_id: int, x: float, y: float):
+        row = self.row_of.get(obj_id)
+        if row is not None:
+            self.data[0, row] = x
+            self.data[1, row] = y
+    
+    def rows_for(self, obj_ids: Iterable[int]) -> np.ndarray:
+        """Row numbers of the given ids, skipping ids that are not stored"""
+        row_of = self.row_of
+        return np.fromiter((row_of[obj_id] for obj_id in obj_ids if obj_id in row_of), dtype=np.intp)
+    
+    def mark_dirty(self, rows: np.ndarray):
+        newly_dirty = rows[~self.dirty[rows]]
+        self.dirty[newly_dirty] = True
+        self.dirty_count += len(np.unique(newly_dirty))
+    
+    def take_dirty(self) -> Tuple[List[int], np.ndarray]:
+        """Ids and (column, row) values of every dirty row, clearing the flags"""
+        rows = np.flatnonzero(self.dirty[:self.size])
+        self.dirty[rows] = False
+        self.dirty_count = 0
+        return self.ids[rows].tolist(), self.data[:, rows]
+    
+    # Vectorized bulk operations; each returns nothing and marks the rows dirty
+    
+    def translate(self, rows: np.ndarray, dx: float, dy: float):
+        self.data[0, rows] += dx
+        self.data[1, rows] += dy
+        self.mark_dirty(rows)
+    
+    def centroid(self, rows: np.ndarray) -> Tuple[float, float]:
+        return float(self.data[0, rows].mean()), float(self.data[1, rows].mean())
+    
+    def rotate(self, rows: np.ndarray, angle: float, pivot: Tuple[float, float]):
+        cos_a, sin_a = np.cos(angle), np.sin(angle)
+        dx = self.data[0, rows] - pivot[0]
+        dy = self.data[1, rows] - pivot[1]
+        self.data[0, rows] = pivot[0] + dx * cos_a - dy * sin_a
+        self.data[1, rows] = pivot[1] + dx * sin_a + dy * cos_a
+        self.mark_dirty(rows)
+    
+    def scale(self, rows: np.ndarray, factor: float, pivot: Tuple[float, float]):
+        """Grow or shrink objects and their spacing around a pivot"""
+        self.data[0, rows] = pivot[0] + (self.data[0, rows] - pivot[0]) * factor
+        self.data[1, rows] = pivot[1] + (self.data[1, rows] - pivot[1]) * factor
+        self.data[2, rows] *= factor
+        self.mark_dirty(rows)
+    
+    def tint(self, rows: np.ndarray, color: Tuple[float, float, float], amount: float):
+        """Blend the colors of rows toward color by amount (0 keeps, 1 replaces)"""
+        target = np.asarray(color, dtype=np.float64)[:, None]
+        colors = self.data[3:6, rows]
+        self.data[3:6, rows] = colors + (target - colors) * amount
+        self.mark_dirty(rows)
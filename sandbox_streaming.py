@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Sandbox Streaming - Chunked, per-client interest management for the sandbox
+The world is cut into square chunks by object position. Each client
+subscribes to the chunks around its view and only receives actions for
+objects inside them: objects that wander in arrive as a small snapshot,
+objects that wander out are forgotten, and everything else is filtered
+away before it is serialized.
+"""
+
+import math
+import time
+import threading
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sandbox_actions import filter_batch
+
+# Edge length of a chunk in sandbox units
+CHUNK_SIZE = 8.0
+
+# Views covering more chunks than this are treated as a whole-world subscription
+MAX_VIEW_CHUNKS = 4096
+
+Chunk = Tuple[int, int]
+
+
+def chunk_of(x: float, y: float, chunk_size: float = CHUNK_SIZE) -> Chunk:
+    return (math.floor(x / chunk_size), math.floor(y / chunk_size))
+
+
+def chunks_in_view(min_x: float, min_y: float, max_x: float, max_y: float,
+                   chunk_size: float = CHUNK_SIZE, margin: int = 1) -> Optional[Set[Chunk]]:
+    """Chunks overlapping a view rectangle plus a margin ring; None if the view is too large"""
+    low_x, low_y = chunk_of(min_x, min_y, chunk_size)
+    high_x, high_y = chunk_of(max_x, max_y, chunk_size)
+    low_x, low_y, high_x, high_y = low_x - margin, low_y - margin, high_x + margin, high_y + margin
+    if (high_x - low_x + 1) * (high_y - low_y + 1) > MAX_VIEW_CHUNKS:
+        return None
+    return {(cx, cy) for cx in range(low_x, high_x + 1) for cy in range(low_y, high_y + 1)}
+
+
+class ClientView:
+    """One client's subscription, the objects it holds and its queued actions"""
+    
+    def __init__(self, client_id: str, last_seen: float):
+        self.client_id = client_id
+        self.chunks: Optional[Set[Chunk]] = None  # None subscribes to the whole world
+        self.known: Optional[Dict[int, Chunk]] = None  # obj_id -> chunk; None while the client holds everything
+        self.queue: List[Dict] = []
+        self.last_seen = last_seen
+        self.needs_resync = True
+    
+    def in_view(self, chunk: Chunk) -> bool:
+        return self.chunks is None or chunk in self.chunks
+
+
+class SandboxStreamer:
+    """Routes sandbox actions to clients according to the chunks they watch
+    
+    Views may be requested from any thread; they are applied, and actions
+    published, on the thread that owns the sandbox. Clients collect their
+    share with poll(). A client that falls too far behind, or is new, is
+    resynchronized with a reset and a snapshot of its view.
+    """
+    
+    def __init__(self, sandbox, chunk_size: float = CHUNK_SIZE, max_queue: int = 500,
+                 client_timeout: float = 300.0):
+        self.sandbox = sandbox
+        self.chunk_size = chunk_size
+        self.max_queue = max_queue
+        self.client_timeout = client_timeout
+        self.clients: Dict[str, ClientView] = {}
+        self._requested_views: Dict[str, Optional[Tuple[float, float, float, float]]] = {}
+        self._lock = threading.Lock()
+    
+    def request_view(self, client_id: str, view: Optional[Tuple[float, float, float, float]] = None):
+        """Subscribe a client to the chunks around (min_x, min_y, max_x, max_y), or the whole world"""
+        with self._lock:
+            self._requested_views[client_id] = view
+            if client_id in self.clients:
+                self.clients[client_id].last_seen = time.time()
+    
+    def has_requested_views(self) -> bool:
+        return bool(self._requested_views)
+    
+    def drop_client(self, client_id: str):
+        with self._lock:
+            self.clients.pop(client_id, None)
+            self._requested_views.pop(client_id, None)
+    
+    def poll(self, client_id: str) -> List[Dict]:
+        """Take the actions queued for a client"""
+        with self._lock:
+            client = self.clients.get(client_id)
+            if client is None:
+                return []
+            client.last_seen = time.time()
+            actions, client.queue = client.queue, []
+            return actions
+    
+    def publish(self, actions: List[Dict]):
+        """Apply requested views and fan a batch of coalesced actions out to every client"""
+        now = time.time()
+        with self._lock:
+            for client_id in [client_id for client_id, client in self.clients.items()
+                              if now - client.last_seen > self.client_timeout]:
+                del self.clients[client_id]
+            
+            for client in self.clients.values():
+                if client.needs_resync:
+                    continue
+                if client.chunks is None:
+                    client.queue.extend(actions)
+                else:
+                    for action in actions:
+                        client.queue.extend(self._route(client, action))
+            
+            # Views change after routing, so the diff starts from what each client now holds
+            requested, self._requested_views = self._requested_views, {}
+            for client_id, view in requested.items():
+                client = self.clients.get(client_id)
+                if client is None:
+                    client = self.clients[client_id] = ClientView(client_id, now)
+                self._apply_view(client, view)
+            
+            for client in self.clients.values():
+                if client.needs_resync or len(client.queue) > self.max_queue:
+                    self._resync(client)
+    
+    def _position_chunks(self, obj_ids: Iterable[int]) -> Dict[int, Chunk]:
+        """Current chunk of each stored object"""
+        store = self.sandbox.store
+        obj_ids = [obj_id for obj_id in obj_ids if obj_id in store]
+        rows = store.rows_for(obj_ids)
+        xs, ys = store.data[0, rows].tolist(), store.data[1, rows].tolist()
+        return {obj_id: chunk_of(x, y, self.chunk_size) for obj_id, x, y in zip(obj_ids, xs, ys)}
+    
+    def _objects_in_chunks(self, chunks: Optional[Set[Chunk]]) -> Dict[int, Chunk]:
+        if chunks is None:
+            return self._position_chunks(self.sandbox.objects)
+        if not chunks:
+            return {}
+        size = self.chunk_size
+        min_x = min(cx for cx, _ in chunks) * size
+        min_y = min(cy for _, cy in chunks) * size
+        max_x = (max(cx for cx, _ in chunks) + 1) * size
+        max_y = (max(cy for _, cy in chunks) + 1) * size
+        candidates = self.sandbox.objects_in_region(min_x, min_y, max_x, max_y)
+        return {obj_id: chunk for obj_id, chunk in self._position_chunks(candidates).items()
+                if chunk in chunks}
+    
+    def _snapshot(self, obj_ids: List[int]) -> List[Dict]:
+        if not obj_ids:
+            return []
+        return [self.sandbox.snapshot_action(obj_ids)]
+    
+    def _resync(self, client: ClientView):
+        """Replace whatever the client holds with a fresh snapshot of its view"""
+        visible = self._objects_in_chunks(client.chunks)
+        client.queue = [{"type": "reset_sandbox", "resync": True, "timestamp": self.sandbox.clock.time()}]
+        client.queue.extend(self._snapshot(list(visible)))
+        client.known = None if client.chunks is None else visible
+        client.needs_resync = False
+    
+    def _apply_view(self, client: ClientView, view: Optional[Tuple[float, float, float, float]]):
+        chunks = None if view is None else chunks_in_view(*view, chunk_size=self.chunk_size)
+        if chunks == client.chunks:
+            return
+        client.chunks = chunks
+        if client.needs_resync:
+            return
+        
+        if client.known is None:
+            # The client held the whole world; from now on track what it keeps
+            client.known = self._position_chunks(self.sandbox.objects)
+        visible = self._objects_in_chunks(chunks)
+        
+        leaving = [obj_id for obj_id in client.known if obj_id not in visible]
+        entering = [obj_id for obj_id in visible if obj_id not in client.known]
+        for obj_id in leaving:
+            del client.known[obj_id]
+        if leaving:
+            client.queue.append({"type": "forget_objects", "object_ids": leaving})
+        client.queue.extend(self._snapshot(entering))
+        client.known.update(visible)
+        if chunks is None:
+            client.known = None
+    
+    def _route(self, client: ClientView, action: Dict) -> List[Dict]:
+        """The part of one action a chunk-subscribed client should receive"""
+        kind = action.get("type")
+        known = client.known
+        size = self.chunk_size
+        
+        if kind == "reset_sandbox":
+            known.clear()
+            return [action]
+        
+        if kind == "create_object":
+            obj_id = action["object_id"]
+            position = action["object_data"].get("position", {})
+            chunk = chunk_of(position.get("x", 0), position.get("y", 0), size)
+            if not client.in_view(chunk):
+                return []
+            known[obj_id] = chunk
+            return [action]
+        
+        if kind == "create_batch":
+            xs, ys = action["positions"]["x"], action["positions"]["y"]
+            outside = set()
+            for obj_id, x, y in zip(action["object_ids"], xs, ys):
+                chunk = chunk_of(x, y, size)
+                if client.in_view(chunk):
+                    known[obj_id] = chunk
+                else:
+                    outside.add(obj_id)
+            action = filter_batch(action, outside)
+            return [action] if action["object_ids"] else []
+        
+        if kind == "move_object":
+            obj_id = action["object_id"]
+            position = action["new_position"]
+            chunk = chunk_of(position.get("x", 0), position.get("y", 0), size)
+            kept, follow_up = self._relocate(client, [obj_id], [chunk])
+            return ([action] if kept else []) + follow_up
+        
+        if kind == "update_objects" and "positions" in action:
+            chunks = [chunk_of(x, y, size) for x, y in zip(action["positions"]["x"], action["positions"]["y"])]
+            kept, follow_up = self._relocate(client, action["object_ids"], chunks)
+            dropped = set(action["object_ids"]).difference(kept)
+            return ([filter_batch(action, dropped)] if kept else []) + follow_up
+        
+        if kind in ("update_objects", "behavior_keyframes"):
+            action = filter_batch(action, {obj_id for obj_id in action["object_ids"] if obj_id not in known})
+            return [action] if action["object_ids"] else []
+        
+        if kind == "destroy_object":
+            return [action] if known.pop(action["object_id"], None) is not None else []
+        
+        if kind == "add_behavior":
+            return [action] if action["object_id"] in known else []
+        
+        if kind == "connect_objects":
+            return [action] if action["object1"] in known or action["object2"] in known else []
+        
+        # Actions that do not touch specific objects reach everyone
+        return [action]
+    
+    def _relocate(self, client: ClientView, obj_ids: List[int], chunks: List[Chunk]) -> Tuple[List[int], List[Dict]]:
+        """Route a position change; returns the ids still in view and the forget/snapshot actions for the rest"""
+        known = client.known
+        kept, leaving, entering = [], [], []
+        for obj_id, chunk in zip(obj_ids, chunks):
+            inside = client.in_view(chunk)
+            if obj_id in known:
+                if inside:
+                    known[obj_id] = chunk
+                    kept.append(obj_id)
+                else:
+                    del known[obj_id]
+                    leaving.append(obj_id)
+            elif inside and obj_id in self.sandbox.store:
+                known[obj_id] = chunk
+                entering.append(obj_id)
+        
+        follow_up = []
+        if leaving:
+            follow_up.append({"type": "forget_objects", "object_ids": leaving})
+        follow_up.extend(self._snapshot(entering))
+        return kept, follow_up
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Sensor Ingest - Batched, downsampled device sensor streams for Wight
+Phones report accelerometer, gyroscope and light readings at tens of Hz.
+Clients send them in packed batches; each sensor keeps its raw samples in a
+NumPy ring buffer plus bucketed means at coarser resolutions, and the mind
+loop reads a few aggregates per tick instead of handling every sample.
+"""
+
+import math
+import base64
+import threading
+import numpy as np
+from typing import Any, Dict, Optional, Tuple
+from wight_clock import SystemClock, SYSTEM_CLOCK
+
+# Values per sample of the sensors Wight understands; other sensors keep the width they arrive with
+SENSOR_WIDTHS = {
+    "accelerometer": 3,
+    "gyroscope": 3,
+    "magnetometer": 3,
+    "gravity": 3,
+    "light": 1,  # Lux
+    "light_level": 1,  # Already normalized to 0..1
+    "proximity": 1,  # 0 touching .. 1 far
+    "sound": 1,
+    "temperature": 1
+}
+
+# Bucket lengths in seconds of the downsampled levels
+RESOLUTIONS = (1.0, 10.0, 60.0)
+
+# Distinct sensors one Wight accepts
+MAX_SENSORS = 16
+
+# Samples older than this no longer describe the environment
+FRESH_SECONDS = 5.0
+
+# Spread of accelerometer magnitude (m/s^2) or mean rotation rate (rad/s) over MOTION_WINDOW that counts as motion
+MOTION_THRESHOLD = 0.6
+ROTATION_THRESHOLD = 0.5
+MOTION_WINDOW = 2.0
+
+# Lux at which the light level saturates
+FULL_LIGHT_LUX = 1000.0
+
+
+class SampleRing:
+    """Preallocated ring of timestamped samples, overwriting the oldest when full"""
+    
+    def __init__(self, width: int, capacity: int):
+        self.capacity = capacity
+        self.timestamps = np.zeros(capacity)
+        self.values = np.zeros((capacity, width))
+        self.start = 0  # Index of the oldest sample
+        self.count = 0
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def last_timestamp(self) -> float:
+        return float(self.timestamps[(self.start + self.count - 1) % self.capacity])
+    
+    def extend(self, timestamps: np.ndarray, values: np.ndarray):
+        n = len(timestamps)
+        if n > self.capacity:
+            timestamps, values = timestamps[-self.capacity:], values[-self.capacity:]
+            n = self.capacity
+        positions = (self.start + self.count + np.arange(n)) % self.capacity
+        self.timestamps[positions] = timestamps
+        self.values[positions] = values
+        overflow = max(0, self.count + n - self.capacity)
+        self.start = (self.start + overflow) % self.capacity
+        self.count = min(self.capacity, self.count + n)
+    
+    def since(self, timestamp: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Samples at or after timestamp, oldest first; costs O(log n + result)"""
+        end = self.start + self.count
+        # The ring holds at most two sorted runs: start..capacity, then 0..the wrapped end
+        runs = [(self.start, min(end, self.capacity))]
+        if end > self.capacity:
+            runs.append((0, end - self.capacity))
+        timestamps, values = [], []
+        for low, high in runs:
+            first = low + int(np.searchsorted(self.timestamps[low:high], timestamp, side="left"))
+            timestamps.append(self.timestamps[first:high])
+            values.append(self.values[first:high])
+        return np.concatenate(timestamps), np.concatenate(values)
+
+
+class SensorStream:
+    """One sensor's raw samples plus bucketed means at each resolution
+    
+    Samples must arrive in time order per sensor; anything not newer than
+    the last stored sample is dropped, so a resent batch is harmless.
+    """
+    
+    def __init__(self, width: int, raw_capacity: int = 4096, level_capacity: int = 720):
+        self.width = width
+        self.raw = SampleRing(width, raw_capacity)
+        self.levels = {resolution: SampleRing(width, level_capacity) for resolution in RESOLUTIONS}
+        self._open: Dict[float, Optional[Tuple[int, np.ndarray, int]]] = {resolution: None for resolution in RESOLUTIONS}
+        self.total_samples = 0
+    
+    def ingest(self, timestamps: np.ndarray, values: np.ndarray) -> int:
+        order = np.argsort(timestamps, kind="stable")
+        timestamps, values = timestamps[order], values[order]
+        if len(self.raw):
+            newer = timestamps > self.raw.last_timestamp()
+            timestamps, values = timestamps[newer], values[newer]
+        if not len(timestamps):
+            return 0
+        
+        self.raw.extend(timestamps, values)
+        for resolution, ring in self.levels.items():
+            self._downsample(resolution, ring, timestamps, values)
+        self.total_samples += len(timestamps)
+        return len(timestamps)
+    
+    def _downsample(self, resolution: float, ring: SampleRing, timestamps: np.ndarray, values: np.ndarray):
+        """Fold samples into per-bucket means; the newest bucket stays open for the next batch"""
+        buckets = np.floor(timestamps / resolution).astype(np.int64)
+        starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+        sums = np.add.reduceat(values, starts, axis=0)
+        counts = np.diff(np.r_[starts, len(timestamps)])
+        indexes = buckets[starts]
+        
+        open_bucket = self._open[resolution]
+        if open_bucket is not None:
+            index, open_sums, open_count = open_bucket
+            if index == indexes[0]:
+                sums[0] += open_sums
+                counts[0] += open_count
+            else:
+                ring.extend(np.array([index * resolution]), (open_sums / open_count)[None, :])
+        if len(indexes) > 1:
+            ring.extend(indexes[:-1] * resolution, sums[:-1] / counts[:-1, None])
+        self._open[resolution] = (int(indexes[-1]), sums[-1], int(counts[-1]))
+    
+    def window(self, seconds: float, now: float, resolution: float = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Raw samples, or bucket means at a resolution, from the last seconds; oldest first"""
+        if resolution is None:
+            return self.raw.since(now - seconds)
+        timestamps, values = self.levels[resolution].since(now - seconds)
+        open_bucket = self._open[resolution]
+        if open_bucket is not None:
+            index, open_sums, open_count = open_bucket
+            timestamps = np.r_[timestamps, index * resolution]
+            values = np.vstack([values, open_sums / open_count])
+        return timestamps, values
+    
+    def mean(self, seconds: float, now: float) -> Optional[np.ndarray]:
+        values = self.window(seconds, now)[1]
+        return values.mean(axis=0) if len(values) else None
+
+
+def _decode_array(data: Any, dtype: str) -> np.ndarray:
+    """A JSON list, or base64 of a packed little-endian array as Godot's Packed*Array produces"""
+    if isinstance(data, str):
+        return np.frombuffer(base64.b64decode(data), dtype=dtype).astype(np.float64)
+    return np.asarray(data, dtype=np.float64).ravel()
+
+
+class SensorIngest:
+    """Thread-safe store of device sensor batches and the environment read from them
+    
+    Batches may arrive from the web server or the bridge on any thread; the
+    mind loop folds the aggregates into PerceptionSystem once per tick.
+    """
+    
+    def __init__(self, clock: SystemClock = None, raw_capacity: int = 4096, level_capacity: int = 720):
+        self.clock = clock or SYSTEM_CLOCK
+        self.raw_capacity = raw_capacity
+        self.level_capacity = level_capacity
+        self.streams: Dict[str, SensorStream] = {}
+        self.batches_received = 0
+        self.motion_detected = False
+        self._lock = threading.Lock()
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        # Locks cannot be pickled; a hibernated Wight gets a fresh one when it wakes
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+    
+    def ingest_batch(self, batch: Dict) -> int:
+        """Store {"sent_at": t, "sensors": {name: {"timestamps": [...], "values": [...]}}}; returns samples kept
+        
+        Values are flat (width per sample) or nested. When sent_at is given,
+        sample times are taken on the sender's clock and shifted onto ours.
+        Raises ValueError for malformed batches.
+        """
+        sensors = batch.get("sensors") if isinstance(batch, dict) else None
+        if not isinstance(sensors, dict):
+            raise ValueError("batch needs a 'sensors' object")
+        try:
+            offset = self.clock.time() - float(batch["sent_at"]) if "sent_at" in batch else 0.0
+        except (TypeError, ValueError):
+            raise ValueError("batch 'sent_at' must be a number")
+        
+        decoded = {}
+        for name, samples in sensors.items():
+            if not isinstance(samples, dict):
+                raise ValueError(f"sensor '{name}' needs a timestamps/values object")
+            try:
+                timestamps = _decode_array(samples.get("timestamps", []), "<f8") + offset
+                values = _decode_array(samples.get("values", []), "<f4")
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"sensor '{name}' has undecodable samples: {e}")
+            if not len(timestamps):
+                continue
+            width = SENSOR_WIDTHS.get(name, len(values) // len(timestamps))
+            if width < 1 or len(values) != width * len(timestamps):
+                raise ValueError(f"sensor '{name}' has {len(values)} values for {len(timestamps)} timestamps")
+            decoded[name] = (timestamps, values.reshape(len(timestamps), width))
+        
+        kept = 0
+        with self._lock:
+            # Check every width before storing anything, so a bad entry never leaves a partial batch
+            for name, (timestamps, values) in decoded.items():
+                stream = self.streams.get(name)
+                if stream is not None and stream.width != values.shape[1]:
+                    raise ValueError(f"sensor '{name}' changed width from {stream.width} to {values.shape[1]}")
+            
+            for name, (timestamps, values) in decoded.items():
+                stream = self.streams.get(name)
+                if stream is None:
+                    if len(self.streams) >= MAX_SENSORS:
+                        continue
+                    stream = self.streams[name] = SensorStream(values.shape[1], self.raw_capacity, self.level_capacity)
+                kept += stream.ingest(timestamps, values)
+            self.batches_received += 1
+        return kept
+    
+    def update_perception(self, perception) -> bool:
+        """Fold fresh aggregates into perception.environment_state; False if no sensor is streaming"""
+        now = self.clock.time()
+        with self._lock:
+            fresh = {name: stream for name, stream in self.streams.items()
+                     if len(stream.raw) and now - stream.raw.last_timestamp() <= FRESH_SECONDS}
+            if not fresh:
+                return False
+            means = {name: stream.mean(MOTION_WINDOW, now) for name, stream in fresh.items()}
+            accel = fresh["accelerometer"].window(MOTION_WINDOW, now)[1] if "accelerometer" in fresh else None
+        
+        environment = perception.environment_state
+        light_level = None
+        if means.get("light_level") is not None:
+            light_level = float(means["light_level"][0])
+        elif means.get("light") is not None:
+            light_level = math.log1p(max(0.0, float(means["light"][0]))) / math.log1p(FULL_LIGHT_LUX)
+        if light_level is not None:
+            light_level = max(0.0, min(1.0, light_level))
+            change = light_level - environment["light_level"]
+            if abs(change) > 0.3:
+                perception.add_perception("light_change", {"direction": "brighter" if change > 0 else "darker",
+                                                           "level": light_level}, 0.9)
+            environment["light_level"] = light_level
+        
+        if means.get("sound") is not None:
+            environment["sound_level"] = max(0.0, min(1.0, float(means["sound"][0])))
+        if means.get("proximity") is not None:
+            environment["user_presence"] = float(means["proximity"][0]) < 0.5
+        if means.get("temperature") is not None:
+            environment["temperature"] = float(means["temperature"][0])
+        
+        if accel is not None or means.get("gyroscope") is not None:
+            shaking = float(np.linalg.norm(accel, axis=1).std()) if accel is not None and len(accel) > 1 else 0.0
+            turning = float(np.linalg.norm(means["gyroscope"])) if means.get("gyroscope") is not None else 0.0
+            moving = shaking > MOTION_THRESHOLD or turning > ROTATION_THRESHOLD
+            if moving and not self.motion_detected:
+                # One perception when motion starts, not one per sample
+                perception.add_perception("motion", {"detected": True, "source": "sensors",
+                                                     "intensity": max(shaking, turning)}, 0.9)
+            self.motion_detected = moving
+            environment["motion_detected"] = moving
+        return True
+    
+    def series(self, name: str, seconds: float = 600.0, resolution: float = None) -> Optional[Dict[str, Any]]:
+        """One sensor's samples or bucket means over the last seconds, for charts"""
+        if resolution is not None and resolution not in RESOLUTIONS:
+            raise ValueError(f"resolution must be one of {RESOLUTIONS}")
+        with self._lock:
+            stream = self.streams.get(name)
+            if stream is None:
+                return None
+            timestamps, values = stream.window(seconds, self.clock.time(), resolution)
+        return {"sensor": name, "resolution": resolution, "timestamps": timestamps.tolist(), "values": values.tolist()}
+    
+    def get_stats(self) -> Dict[str, Any]:
+        now = self.clock.time()
+        with self._lock:
+            sensors = {}
+            for name, stream in self.streams.items():
+                recent = stream.window(10.0, now)[0]
+                sensors[name] = {
+                    "samples": stream.total_samples,
+                    "rate_hz": len(recent) / 10.0,
+                    "last_sample_age": now - stream.raw.last_timestamp() if len(stream.raw) else None
+                }
+            return {"batches": self.batches_received, "sensors": sensors, "resolutions": list(RESOLUTIONS)}
@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+Spatial Index - Uniform grid over Wight's sandbox plane
+Answers radius, bounding-box and nearest-neighbour queries and finds free
+space for new structures without scanning every object. The grid refines
+itself as objects pile up, so queries stay fast at 100k objects.
+"""
+
+import math
+import heapq
+import numpy as np
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class SpatialGrid:
+    """Uniform hash grid of object centres with per-object extents
+    
+    Each cell keeps a dict of the objects whose centre falls in it. When the
+    average occupancy of non-empty cells exceeds max_cell_load the cell size
+    is halved and the grid rebuilt, so the amortized cost stays O(1) per
+    insert and queries only visit a handful of objects per cell.
+    """
+    
+    def __init__(self, cell_size: float = 2.0, max_cell_load: int = 32, min_cell_size: float = 0.05):
+        self.cell_size = cell_size
+        self.base_cell_size = cell_size  # compact() never coarsens past the starting size
+        self.max_cell_load = max_cell_load
+        self.min_cell_size = min_cell_size
+        
+        self.cells: Dict[Tuple[int, int], Dict[int, Tuple[float, float]]] = {}
+        self.entries: Dict[int, Tuple[float, float, float]] = {}  # id -> (x, y, radius)
+        self.max_radius = 0.0  # Largest extent ever inserted; bounds overlap searches
+        self.extent = [0, 0, 0, 0]  # Occupied cell bounds (min_cx, min_cy, max_cx, max_cy); never shrinks
+    
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+    
+    def _add_to_cell(self, obj_id: int, x: float, y: float):
+        cell = self._cell(x, y)
+        self.cells.setdefault(cell, {})[obj_id] = (x, y)
+        extent = self.extent
+        if len(self.entries) == 1 and len(self.cells) == 1:
+            extent[:] = [cell[0], cell[1], cell[0], cell[1]]
+        else:
+            extent[0], extent[1] = min(extent[0], cell[0]), min(extent[1], cell[1])
+            extent[2], extent[3] = max(extent[2], cell[0]), max(extent[3], cell[1])
+    
+    def __len__(self) -> int:
+        return len(self.entries)
+    
+    def __contains__(self, obj_id: int) -> bool:
+        return obj_id in self.entries
+    
+    def insert(self, obj_id: int, x: float, y: float, radius: float = 0.0):
+        if obj_id in self.entries:
+            self.remove(obj_id)
+        
+        self.entries[obj_id] = (x, y, radius)
+        self._add_to_cell(obj_id, x, y)
+        self.max_radius = max(self.max_radius, radius)
+        
+        if (len(self.entries) > self.max_cell_load * len(self.cells)
+                and self.cell_size / 2 >= self.min_cell_size):
+            self._rebuild(self.cell_size / 2)
+    
+    def insert_many(self, obj_ids: List[int], xs: List[float], ys: List[float], radii: List[float]):
+        """Insert new objects in one pass
+        
+        The final cell size is chosen before any object is bucketed, so a
+        large batch refines the grid at most once instead of rebuilding it
+        on every halving.
+        """
+        for obj_id in obj_ids:
+            if obj_id in self.entries:
+                self.remove(obj_id)
+        if not obj_ids:
+            return
+        self.entries.update(zip(obj_ids, zip(xs, ys, radii)))
+        self.max_radius = max(self.max_radius, max(radii))
+        
+        cell_size = self.cell_size
+        if len(self.entries) > self.max_cell_load * len(self.cells):
+            points = np.array([(x, y) for x, y, _ in self.entries.values()])
+            while (len(self.entries) > self.max_cell_load * self._occupied_cells(points, cell_size)
+                   and cell_size / 2 >= self.min_cell_size):
+                cell_size /= 2
+        
+        if cell_size != self.cell_size:
+            self.cell_size = cell_size
+            self.cells = {}
+            self.extent = [0, 0, 0, 0]
+            obj_ids = list(self.entries)
+            xs = [x for x, _, _ in self.entries.values()]
+            ys = [y for _, y, _ in self.entries.values()]
+        self._add_many_to_cells(obj_ids, xs, ys)
+    
+    def _add_many_to_cells(self, obj_ids: List[int], xs: List[float], ys: List[float]):
+        was_empty = not self.cells
+        cxs = np.floor(np.asarray(xs, dtype=np.float64) / self.cell_size).astype(np.int64)
+        cys = np.floor(np.asarray(ys, dtype=np.float64) / self.cell_size).astype(np.int64)
+        cells = self.cells
+        for obj_id, cell, x, y in zip(obj_ids, zip(cxs.tolist(), cys.tolist()), xs, ys):
+            members = cells.get(cell)
+            if members is None:
+                members = cells[cell] = {}
+            members[obj_id] = (x, y)
+        
+        bounds = [int(cxs.min()), int(cys.min()), int(cxs.max()), int(cys.max())]
+        extent = self.extent
+        if was_empty:
+            extent[:] = bounds
+        else:
+            extent[0], extent[1] = min(extent[0], bounds[0]), min(extent[1], bounds[1])
+            extent[2], extent[3] = max(extent[2], bounds[2]), max(extent[3], bounds[3])
+    
+    @staticmethod
+    def _occupied_cells(points: np.ndarray, cell_size: float) -> int:
+        cells = np.floor(points / cell_size).astype(np.int64)
+        return len(np.unique(cells[:, 0] * (1 << 32) + (cells[:, 1] & 0xFFFFFFFF)))
+    
+    def move(self, obj_id: int, x: float, y: float):
+        entry = self.entries.get(obj_id)
+        if entry is None:
+            return
+        old_cell, new_cell = self._cell(entry[0], entry[1]), self._cell(x, y)
+        self.entries[obj_id] = (x, y, entry[2])
+        if old_cell != new_cell:
+            self._discard_from_cell(old_cell, obj_id)
+            self._add_to_cell(obj_id, x, y)
+        else:
+            self.cells[new_cell][obj_id] = (x, y)
+    
+    def remove(self, obj_id: int):
+        entry = self.entries.pop(obj_id, None)
+        if entry is not None:
+            self._discard_from_cell(self._cell(entry[0], entry[1]), obj_id)
+    
+    def _discard_from_cell(self, cell: Tuple[int, int], obj_id: int):
+        members = self.cells.get(cell)
+        if members is not None:
+            members.pop(obj_id, None)
+            if not members:
+                del self.cells[cell]
+    
+    def clear(self):
+        self.cells.clear()
+        self.entries.clear()
+        self.max_radius = 0.0
+        self.extent = [0, 0, 0, 0]
+    
+    def compact(self):
+        """Tighten what removals leave stale: max_radius, the extent, and cells refined for objects now gone
+        
+        O(n) in the number of objects, so it belongs in idle-time
+        maintenance. The grid only coarsens while the doubled cells would
+        stay at most half loaded, so the next insert does not refine it again.
+        """
+        cell_size = self.cell_size
+        if self.entries:
+            points = np.array([(x, y) for x, y, _ in self.entries.values()])
+            while (cell_size * 2 <= self.base_cell_size
+                   and len(self.entries) * 2 <= self.max_cell_load * self._occupied_cells(points, cell_size * 2)):
+                cell_size *= 2
+        else:
+            cell_size = self.base_cell_size
+        self.max_radius = max((radius for _, _, radius in self.entries.values()), default=0.0)
+        self._rebuild(cell_size)
+    
+    def _rebuild(self, cell_size: float):
+        self.cell_size = cell_size
+        self.cells = {}
+        for obj_id, (x, y, _) in self.entries.items():
+            self.cells.setdefault(self._cell(x, y), {})[obj_id] = (x, y)
+        
+        xs = [cx for cx, _ in self.cells]
+        ys = [cy for _, cy in self.cells]
+        self.extent = [min(xs), min(ys), max(xs), max(ys)] if self.cells else [0, 0, 0, 0]
+    
+    def _cells_in_box(self, min_x: float, min_y: float, max_x: float, max_y: float) -> Iterable[Dict[int, Tuple[float, float]]]:
+        min_cx, min_cy = self._cell(min_x, min_y)
+        max_cx, max_cy = self._cell(max_x, max_y)
+        
+        # Sparse worlds: walking occupied cells is cheaper than a huge box
+        if (max_cx - min_cx + 1) * (max_cy - min_cy + 1) > len(self.cells):
+            for (cx, cy), members in self.cells.items():
+                if min_cx <= cx <= max_cx and min_cy <= cy <= max_cy:
+                    yield members
+            return
+        
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                members = self.cells.get((cx, cy))
+                if members:
+                    yield members
+    
+    def query_radius(self, x: float, y: float, radius: float) -> List[int]:
+        """Objects whose centre lies within radius of (x, y)"""
+        radius_sq = radius * radius
+        return [
+            obj_id
+            for members in self._cells_in_box(x - radius, y - radius, x + radius, y + radius)
+            for obj_id, (ox, oy) in members.items()
+            if (ox - x) ** 2 + (oy - y) ** 2 <= radius_sq
+        ]
+    
+    def query_bbox(self, min_x: float, min_y: float, max_x: float, max_y: float) -> List[int]:
+        """Objects whose centre lies inside the box"""
+        return [
+            obj_id
+            for members in self._cells_in_box(min_x, min_y, max_x, max_y)
+            for obj_id, (ox, oy) in members.items()
+            if min_x <= ox <= max_x and min_y <= oy <= max_y
+        ]
+    
+    def nearest(self, x: float, y: float, k: int = 1, max_distance: float = None) -> List[Tuple[int, float]]:
+        """Up to k (object id, distance) pairs nearest to (x, y), closest first"""
+        if not self.entries or k <= 0:
+            return []
+        
+        cx, cy = self._cell(x, y)
+        min_cx, min_cy, max_cx, max_cy = self.extent
+        # Rings closer than the occupied extent are empty; rings past it add nothing
+        first_ring = max(min_cx - cx, cx - max_cx, min_cy - cy, cy - max_cy, 0)
+        last_ring = max(cx - min_cx, max_cx - cx, cy - min_cy, max_cy - cy, 0)
+        
+        found = []
+        visited = 0
+        budget = 4 * len(self.cells) + 64
+        for ring in range(first_ring, last_ring + 1):
+            visited += 8 * ring or 1
+            if visited > budget:
+                # Sparse world: ranking every object is cheaper than more rings
+                found = heapq.nsmallest(k, ((math.hypot(ox - x, oy - y), obj_id)
+                                            for obj_id, (ox, oy, _) in self.entries.items()))
+                break
+            
+            for cell in self._ring_cells(cx, cy, ring):
+                members = self.cells.get(cell)
+                if members:
+                    found.extend((math.hypot(ox - x, oy - y), obj_id) for obj_id, (ox, oy) in members.items())
+            
+            # Objects in later rings are at least ring * cell_size away
+            reach = ring * self.cell_size
+            if len(found) >= k:
+                found.sort()
+                del found[k:]
+                if found[-1][0] <= reach:
+                    break
+            if max_distance is not None and reach > max_distance:
+                break
+        found.sort()
+        
+        return [(obj_id, distance) for distance, obj_id in found[:k]
+                if max_distance is None or distance <= max_distance]
+    
+    @staticmethod
+    def _ring_cells(cx: int, cy: int, ring: int) -> Iterable[Tuple[int, int]]:
+        if ring == 0:
+            yield (cx, cy)
+            return
+        for dx in range(-ring, ring + 1):
+            yield (cx + dx, cy - ring)
+            yield (cx + dx, cy + ring)
+        for dy in range(-ring + 1, ring):
+            yield (cx - ring, cy + dy)
+            yield (cx + ring, cy + dy)
+    
+    def is_free(self, x: float, y: float, radius: float, ignore: Optional[set] = None) -> bool:
+        """Whether a disc at (x, y) overlaps no indexed object's extent"""
+        reach = radius + self.max_radius
+        for members in self._cells_in_box(x - reach, y - reach, x + reach, y + reach):
+            for obj_id, (ox, oy) in members.items():
+                if ignore and obj_id in ignore:
+                    continue
+                limit = radius + self.entries[obj_id][2]
+                if (ox - x) ** 2 + (oy - y) ** 2 < limit * limit:
+                    return False
+        return True
+    
+    def find_free_position(self, footprint: List[Tuple[float, float, float]], near: Tuple[float, float] = (0.0, 0.0),
+                           step: float = None, max_rings: int = 64) -> Tuple[float, float]:
+        """Anchor where every (dx, dy, radius) part of a footprint is free
+        
+        Candidates are tried in rings of growing distance from near, so new
+        structures settle as close to it as possible. Falls back to near if
+        no free anchor is found within max_rings.
+        """
+        if step is None:
+            step = max(1.0, max(radius for _, _, radius in footprint) * 2)
+        
+        for ring in range(max_rings):
+            distance = ring * step
+            samples = 1 if ring == 0 else 8 * ring
+            for i in range(samples):
+                angle = 2 * math.pi * i / samples
+                ax = near[0] + math.cos(angle) * distance
+                ay = near[1] + math.sin(angle) * distance
+                if all(self.is_free(ax + dx, ay + dy, radius) for dx, dy, radius in footprint):
+                    return (ax, ay)
+        
+        return near
@@ -13,7 +13,10 @@ Starts Wight's complete consciousness with all advanced capabilities:
 """
 
 import sys
+import json
 import time
+import asyncio
+import functools
 import subprocess
 import threading
 import signal
@@ -21,10 +24,10 @@ from pathlib import Path
 
 # Import all enhanced systems
 try:
-    from wight_core import Wight
     from voice_system import get_voice_system
     from visual_processing import get_visual_system
     from godot_bridge import GodotBridge
+    from wight_runtime import WightRuntime
     CORE_AVAILABLE = True
 except ImportError as e:
     CORE_AVAILABLE = False
@@ -119,9 +122,11 @@ def start_enhanced_wight_consciousness():
     print("\n🧠 Starting Wight's Enhanced Consciousness...")
     
     try:
-        # Create enhanced Wight instance
-        wight = Wight()
+        # Create Godot bridge for 3D sandbox; it owns the Wight instance
+        bridge = GodotBridge()
+        wight = bridge.wight_agent
         print("✅ Enhanced Wight consciousness initialized")
+        print("🌉 Godot bridge established for 3D sandbox")
         
         # Initialize voice system
         voice_system = get_voice_system()
@@ -131,7 +136,7 @@ def start_enhanced_wight_consciousness():
             
             # Test emotional speech
             wight_emotion = wight.emotions.get_dominant_emotion()
-            emotion_intensity = wight.emotions.emotions.get(wight_emotion, 0.5)
+            emotion_intensity = wight.emotions.expressive_intensity(wight_emotion)
             
             voice_system.speak_with_emotion(
                 "Hello! I am Wight, enhanced with advanced AI capabilities. I can see, hear, think, feel, and create in ways I never could before!",
@@ -147,10 +152,6 @@ def start_enhanced_wight_consciousness():
             visual_system.start_visual_processing()
             print("👁️ Enhanced visual processing activated")
         
-        # Create Godot bridge for 3D sandbox
-        bridge = GodotBridge()
-        print("🌉 Godot bridge established for 3D sandbox")
-        
         # Main consciousness loop
         print("🚀 Starting enhanced consciousness loop...")
         return run_enhanced_consciousness_loop(wight, voice_system, visual_system, bridge)
@@ -167,54 +168,25 @@ def run_enhanced_consciousness_loop(wight, voice_system, visual_system, bridge):
     """Main enhanced consciousness loop"""
     print("🔄 Enhanced consciousness loop active...")
     
-    last_embodiment_check = time.time()
-    last_visual_summary = time.time()
-    last_learning_update = time.time()
+    # Every subsystem declares its period and CPU budget; all run on one
+    # event loop that owns Wight, and user messages always go first
+    runtime = WightRuntime(bridge)
+    runtime.add_timer("embodiment", 10.0, functools.partial(process_embodiment_desires, wight),
+                      budget=0.005)
+    if visual_system:
+        runtime.add_timer("visual_summary", 5.0,
+                          functools.partial(process_visual_input, runtime, wight, visual_system))
+    runtime.add_timer("learning", 30.0, functools.partial(update_advanced_learning, wight),
+                      budget=0.01)
+    if voice_system:
+        runtime.add_timer("voice", 0.25,
+                          functools.partial(process_enhanced_voice_interaction, runtime, wight, voice_system))
     
     try:
-        while True:
-            current_time = time.time()
-            
-            # Run core consciousness loop
-            mind_result = wight.mind_loop()
-            
-            # Enhanced embodiment processing
-            if current_time - last_embodiment_check > 10.0:  # Every 10 seconds
-                process_embodiment_desires(wight)
-                last_embodiment_check = current_time
-            
-            # Visual processing integration
-            if visual_system and current_time - last_visual_summary > 5.0:  # Every 5 seconds
-                process_visual_input(wight, visual_system)
-                last_visual_summary = current_time
-            
-            # Advanced learning integration
-            if current_time - last_learning_update > 30.0:  # Every 30 seconds
-                update_advanced_learning(wight)
-                last_learning_update = current_time
-            
-            # Enhanced voice processing
-            if voice_system:
-                process_enhanced_voice_interaction(wight, voice_system)
-            
-            # Send consciousness state to Godot
-            bridge.update_consciousness_state({
-                "emotions": wight.emotions.emotions,
-                "embodiment_level": wight.embodied_awareness.embodiment_level,
-                "consciousness_level": wight.identity["consciousness_level"],
-                "thoughts": mind_result.get("thoughts", []),
-                "sandbox_actions": mind_result.get("sandbox_actions", [])
-            })
-            
-            # Process Godot messages
-            bridge.handle_godot_message()
-            
-            # Small delay for system stability
-            time.sleep(0.1)
-            
+        asyncio.run(runtime.run())
     except KeyboardInterrupt:
         print("\n🌙 Enhanced consciousness going to sleep...")
-        return True
+    return True
 
 def process_embodiment_desires(wight):
     """Process Wight's desires for embodiment and avatar creation"""
@@ -240,7 +212,7 @@ def process_embodiment_desires(wight):
                 # Create embodiment memory
                 wight.memory.append({
                     "data": f"I have designed my avatar form! It will be a {body_design['form_type']} that reflects my {body_design['dominant_emotion']} nature.",
-                    "timestamp": time.time(),
+                    "timestamp": wight.clock.time(),
                     "type": "embodiment",
                     "body_design": body_design
                 })
@@ -253,15 +225,15 @@ def process_embodiment_desires(wight):
     except Exception as e:
         print(f"⚠️ Embodiment processing error: {e}")
 
-def process_visual_input(wight, visual_system):
+async def process_visual_input(runtime, wight, visual_system):
     """Process visual input and integrate with consciousness"""
     try:
         # Check for new visual input
         visual_status = visual_system.get_visual_status()
         
         if visual_status["current_frame_available"]:
-            # Capture and process current frame
-            frame_result = visual_system.capture_single_frame()
+            # Capture and process current frame off the event loop
+            frame_result = await runtime.run_blocking(visual_system.capture_single_frame)
             
             if frame_result and frame_result.get("detections"):
                 detections = frame_result["detections"]
@@ -296,7 +268,7 @@ def process_visual_input(wight, visual_system):
                     combined_thought = " ".join(visual_thoughts)
                     wight.memory.append({
                         "data": combined_thought,
-                        "timestamp": time.time(),
+                        "timestamp": wight.clock.time(),
                         "type": "visual_perception",
                         "detections": detections
                     })
@@ -304,78 +276,83 @@ def process_visual_input(wight, visual_system):
     except Exception as e:
         print(f"⚠️ Visual processing error: {e}")
 
-def process_enhanced_voice_interaction(wight, voice_system):
+async def process_enhanced_voice_interaction(runtime, wight, voice_system):
     """Process enhanced voice interactions"""
     try:
         # Check voice output requests from Wight
-        voice_system.check_voice_output_request()
+        await runtime.run_blocking(voice_system.check_voice_output_request)
         
         # Process any new voice input
         voice_input_file = Path("data/voice_input.json")
-        if voice_input_file.exists():
-            import json
-            
-            with open(voice_input_file, "r") as f:
-                voice_data = json.load(f)
-            
-            if not voice_data.get("processed", False):
-                # Process the voice input through enhanced reasoning
-                if "data" in voice_data:
-                    speech_data = voice_data["data"]
-                    text = speech_data.get("text", "")
+        voice_data = await runtime.run_blocking(read_voice_input_file, voice_input_file)
+        
+        if voice_data and not voice_data.get("processed", False):
+            # Process the voice input through enhanced reasoning
+            if "data" in voice_data:
+                speech_data = voice_data["data"]
+                text = speech_data.get("text", "")
+                
+                if text:
+                    # Generate enhanced response using TensorFlow reasoning
+                    context = {
+                        "emotions": dict(wight.emotions.emotions),
+                        "embodiment_level": wight.embodied_awareness.embodiment_level,
+                        "relevant_memories": wight.memory[-5:] if wight.memory else []
+                    }
+                    
+                    response_data = wight.tensorflow_reasoning.generate_response(text, context)
+                    response_text = response_data["text"]
+                    
+                    # Determine emotional response
+                    user_emotion = speech_data.get("emotion_analysis", {}).get("emotion", "neutral")
+                    wight_emotion = wight.emotions.get_dominant_emotion()
+                    emotion_intensity = wight.emotions.expressive_intensity(wight_emotion)
                     
-                    if text:
-                        # Generate enhanced response using TensorFlow reasoning
-                        context = {
-                            "emotions": wight.emotions.emotions,
-                            "embodiment_level": wight.embodied_awareness.embodiment_level,
-                            "relevant_memories": wight.memory[-5:] if wight.memory else []
-                        }
-                        
-                        response_data = wight.tensorflow_reasoning.generate_response(text, context)
-                        response_text = response_data["text"]
-                        
-                        # Determine emotional response
-                        user_emotion = speech_data.get("emotion_analysis", {}).get("emotion", "neutral")
-                        wight_emotion = wight.emotions.get_dominant_emotion()
-                        emotion_intensity = wight.emotions.emotions.get(wight_emotion, 0.5)
-                        
-                        # Request emotional speech output
-                        voice_system.request_speech(
-                            response_text,
-                            wight_emotion,
-                            emotion_intensity,
-                            wight.identity["consciousness_level"]
-                        )
-                        
-                        # Process conversation context
-                        voice_system.process_conversation_context(
-                            speech_data, response_text, wight_emotion, emotion_intensity
-                        )
-                        
-                        # Add to memory
-                        wight.memory.append({
-                            "data": f"Voice conversation: User said '{text}', I responded '{response_text}'",
-                            "timestamp": time.time(),
-                            "type": "voice_interaction",
-                            "user_emotion": user_emotion,
-                            "wight_emotion": wight_emotion
-                        })
-                        
-                        # Mark as processed
-                        voice_data["processed"] = True
-                        with open(voice_input_file, "w") as f:
-                            json.dump(voice_data, f, indent=2)
+                    # Request emotional speech output
+                    await runtime.run_blocking(
+                        voice_system.request_speech,
+                        response_text,
+                        wight_emotion,
+                        emotion_intensity,
+                        wight.identity["consciousness_level"]
+                    )
+                    
+                    # Process conversation context
+                    await runtime.run_blocking(
+                        voice_system.process_conversation_context,
+                        speech_data, response_text, wight_emotion, emotion_intensity
+                    )
+                    
+                    # Add to memory
+                    wight.memory.append({
+                        "data": f"Voice conversation: User said '{text}', I responded '{response_text}'",
+                        "timestamp": wight.clock.time(),
+                        "type": "voice_interaction",
+                        "user_emotion": user_emotion,
+                        "wight_emotion": wight_emotion
+                    })
+                    
+                    # Mark as processed
+                    voice_data["processed"] = True
+                    await runtime.write_json(str(voice_input_file), voice_data)
                 
     except Exception as e:
         print(f"⚠️ Voice interaction error: {e}")
 
+def read_voice_input_file(voice_input_file: Path):
+    """Read the pending voice input file, if any"""
+    if not voice_input_file.exists():
+        return None
+    
+    with open(voice_input_file, "r") as f:
+        return json.load(f)
+
 def update_advanced_learning(wight):
     """Update advanced learning systems"""
     try:
         # Update consciousness level based on experiences
         experience_factor = len(wight.memory) / 1000.0  # Normalize
-        interaction_factor = (time.time() - wight.last_interaction) / 3600.0  # Hours since interaction
+        interaction_factor = (wight.clock.time() - wight.last_interaction) / 3600.0  # Hours since interaction
         
         # Consciousness grows with experience but needs interaction
         new_consciousness_level = min(1.0, experience_factor * (1.0 - interaction_factor * 0.1))
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Full-size patterns from the bulk create path and the sandbox budget"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pattern_generators import MAX_PATTERN_POINTS
+from wight_core import Wight, SandboxSystem
+
+
+def test_full_size_pattern_survives_mind_loop():
+    wight = Wight(learning=None)
+    for i in range(20):
+        wight.sandbox.create_object("cube", f"Cube{i}")
+    wight.interact("create a phyllotaxis pattern with 50k points")
+    pattern = set(wight.sandbox.tag_index["pattern_phyllotaxis"])
+    assert len(pattern) == MAX_PATTERN_POINTS
+
+    wight.mind_loop()
+    assert pattern <= set(wight.sandbox.objects)
+    assert len(wight.sandbox.objects) >= MAX_PATTERN_POINTS + 20
+
+
+def test_older_objects_are_archived_before_a_new_pattern():
+    sandbox = SandboxSystem()
+    older = sandbox.create_artistic_pattern("poisson", count=MAX_PATTERN_POINTS)
+    sandbox.touch_objects(older)
+    sandbox.create_artistic_pattern("spiral", count=20000)
+    newest = sandbox.create_artistic_pattern("phyllotaxis", count=MAX_PATTERN_POINTS)
+    sandbox.touch_objects(newest)
+    assert len(sandbox.objects) > sandbox.object_budget
+
+    for _ in sandbox.budget_eviction_steps():
+        pass
+    assert set(newest) <= set(sandbox.objects)
+    assert len(sandbox.objects) == int(sandbox.object_budget * sandbox.budget_low_water)
+
+
+@pytest.mark.parametrize("message, count", [
+    ("create a phyllotaxis pattern with 50k points", MAX_PATTERN_POINTS),
+    ("draw a spiral of 1,200 dots", 1200),
+    ("I'm 30 and it's 2024, draw a spiral", None),
+    ("draw 3 spirals of 500", None),
+    ("draw 3 spirals with 500 points each", 500),
+    ("make a wave, 2 minutes of work, 40 elements", 40)
+])
+def test_pattern_count_ignores_unrelated_numbers(message, count):
+    assert Wight(learning=None)._extract_count_from_message(message) == count
+
+
+def test_unrelated_numbers_leave_the_pattern_its_natural_size():
+    wight = Wight(learning=None)
+    wight.interact("i'm 30 and it's 2024, create a spiral pattern")
+    assert len(wight.sandbox.tag_index["pattern_spiral"]) == 12
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""Hibernating and waking hosted Wight instances"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from wight_host import WightShard
+
+
+def test_hibernate_and_wake_after_sensor_ingest(tmp_path):
+    shard = WightShard(0, str(tmp_path))
+    wight = shard.get("sensing")
+    now = wight.clock.time()
+    kept = wight.sensors.ingest_batch({"sensors": {
+        "light": {"timestamps": [now - 0.2, now - 0.1], "values": [300.0, 320.0]},
+        "accelerometer": {"timestamps": [now - 0.1], "values": [0.0, 9.8, 0.1]}
+    }})
+    assert kept == 3
+
+    assert shard.hibernate("sensing")
+    assert "sensing" not in shard.instances
+
+    woken = shard.get("sensing")
+    assert shard.thawed == 1
+    assert woken.sensors.get_stats()["sensors"]["light"]["samples"] == 2
+    # The lock is recreated, so the woken instance still ingests
+    assert woken.sensors.ingest_batch({"sensors": {"light": {"timestamps": [now], "values": [340.0]}}}) == 1
+    assert woken.sensors.update_perception(woken.perception)
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""Coalescing queued sandbox actions, including archive round trips"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sandbox_actions import coalesce_actions
+from wight_core import SandboxSystem
+
+
+def action_types(actions):
+    return [action["type"] for action in actions]
+
+
+def test_create_destroy_restore_in_one_window_keeps_the_object():
+    sandbox = SandboxSystem(object_budget=None)
+    obj_id = sandbox.create_object("cube", "Keeper")
+    sandbox.archive_object(obj_id)
+    sandbox.restore_object(obj_id)
+
+    actions = coalesce_actions(sandbox.pending_actions)
+    assert action_types(actions) == ["create_object", "destroy_object", "create_object"]
+    assert actions[-1]["object_data"]["name"] == "Keeper"
+
+
+def test_restore_of_an_object_from_an_earlier_window_keeps_both_actions():
+    sandbox = SandboxSystem(object_budget=None)
+    obj_id = sandbox.create_object("cube", "Keeper")
+    sandbox.pending_actions.clear()
+    sandbox.archive_object(obj_id)
+    sandbox.restore_object(obj_id)
+
+    assert action_types(coalesce_actions(sandbox.pending_actions)) == ["destroy_object", "create_object"]
+
+
+def test_created_and_archived_in_one_window_vanishes():
+    sandbox = SandboxSystem(object_budget=None)
+    sandbox.archive_object(sandbox.create_object("cube", "Fleeting"))
+    assert coalesce_actions(sandbox.pending_actions) == []
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""Archiving, reloading and restoring sandbox objects"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from wight_core import SandboxSystem
+
+
+def saved_sandbox():
+    """A sandbox's saved objects and archive, with the newest objects archived"""
+    sandbox = SandboxSystem(object_budget=None)
+    obj_ids = [sandbox.create_object("cube", f"Cube{i}") for i in range(10)]
+    for obj_id in obj_ids[-3:]:
+        sandbox.archive_object(obj_id)
+    return obj_ids, sandbox.objects, sandbox.archive.export()
+
+
+def test_reload_never_reuses_archived_ids():
+    obj_ids, objects, archive = saved_sandbox()
+    sandbox = SandboxSystem(object_budget=None)
+    sandbox.load_objects(objects)
+    sandbox.load_archive(archive)
+
+    new_id = sandbox.create_object("sphere", "Fresh")
+    assert new_id not in sandbox.archive
+    assert new_id > max(obj_ids)
+
+    assert sandbox.restore_object(obj_ids[-1]) == obj_ids[-1]
+    assert sandbox.objects[new_id]["name"] == "Fresh"
+    assert sandbox.get_sandbox_stats()["object_types"] == {"cube": 8, "sphere": 1}
+
+
+def test_restore_gives_clashing_object_a_fresh_id():
+    obj_ids, objects, archive = saved_sandbox()
+    sandbox = SandboxSystem(object_budget=None)
+    sandbox.load_objects(objects)
+    sandbox.archive.load(archive)  # As older saves did, without reserving archived ids
+    sandbox.object_id_counter = 7
+    clashing = sandbox.create_object("sphere", "Clash")
+    assert clashing in sandbox.archive
+
+    restored = sandbox.restore_object(clashing)
+    assert restored is not None and restored != clashing
+    assert sandbox.objects[clashing]["name"] == "Clash"
+    assert sandbox.objects[restored]["name"] == "Cube7"
+    assert sandbox.objects[restored]["id"] == restored
+    assert sandbox.get_sandbox_stats()["object_types"] == {"cube": 8, "sphere": 1}
+    assert set(sandbox.spatial_index.entries) == set(sandbox.objects)
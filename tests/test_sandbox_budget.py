@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Archiving sandbox objects past the object budget"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sandbox_archive import SandboxArchive
+from wight_clock import SimulatedClock
+from wight_core import SandboxSystem, EVICTION_SLICE
+
+
+def crowded_sandbox(budget: int, count: int, clock=None) -> SandboxSystem:
+    sandbox = SandboxSystem(clock=clock, object_budget=budget)
+    for i in range(count):
+        sandbox.create_object("cube", f"Cube{i}")
+    return sandbox
+
+
+def test_enforce_budget_archives_one_slice_per_call():
+    sandbox = crowded_sandbox(1000, 3000)
+    evicted = sandbox.enforce_budget(max_evictions=EVICTION_SLICE)
+    assert len(evicted) == EVICTION_SLICE
+    assert len(sandbox.objects) == 3000 - EVICTION_SLICE
+
+    for _ in sandbox.budget_eviction_steps():
+        pass
+    assert len(sandbox.objects) == 900
+    assert len(sandbox.archive) == 2100
+
+
+def test_full_archive_keeps_objects_live():
+    sandbox = crowded_sandbox(100, 400)
+    sandbox.archive = SandboxArchive(max_entries=50)
+    for _ in sandbox.budget_eviction_steps():
+        pass
+    assert len(sandbox.archive) == 50
+    assert len(sandbox.objects) == 350
+
+    names = {obj["name"] for obj in sandbox.objects.values()}
+    names.update(summary["name"] for summary in sandbox.archive.summaries.values())
+    assert len(names) == 400
+
+
+def test_objects_touched_while_paused_are_not_archived():
+    sandbox = crowded_sandbox(10, 12, clock=SimulatedClock())
+    sandbox.budget_low_water = 0.5
+    steps = sandbox.budget_eviction_steps(slice_size=1)
+    first = next(archived for archived in steps if archived)
+
+    # The clock has not moved, so only the touch itself can tell the objects apart
+    sandbox.touch_objects(list(sandbox.objects))
+    for _ in steps:
+        pass
+    assert len(sandbox.objects) == 11
+    assert list(sandbox.archive.summaries) == first
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""Validating device sensor batches before they are stored"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sensor_ingest import SensorIngest
+
+
+@pytest.mark.parametrize("batch", [
+    ["not", "a", "batch"],
+    {"sensors": {"light": [300.0]}},
+    {"sensors": {"light": {"timestamps": [1.0], "values": "not base64!"}}},
+    {"sent_at": "soon", "sensors": {}}
+])
+def test_malformed_batches_raise_value_error(batch):
+    with pytest.raises(ValueError):
+        SensorIngest().ingest_batch(batch)
+
+
+def test_width_change_leaves_no_partial_batch():
+    sensors = SensorIngest()
+    now = sensors.clock.time()
+    assert sensors.ingest_batch({"sensors": {"gyro": {"timestamps": [now - 0.2], "values": [0.1, 0.2, 0.3]}}}) == 1
+
+    with pytest.raises(ValueError):
+        sensors.ingest_batch({"sensors": {
+            "light": {"timestamps": [now - 0.1], "values": [300.0]},
+            "gyro": {"timestamps": [now - 0.1], "values": [0.1, 0.2]}
+        }})
+    assert "light" not in sensors.streams
+    assert sensors.batches_received == 1
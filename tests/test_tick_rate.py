@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""Idle behavior that does not depend on how often mind_loop runs"""
+
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from wight_core import Wight, events_over_ticks
+
+
+def idle_activities(wight: Wight, calls: int, ticks: float) -> int:
+    return sum(len(wight._autonomous_behavior(ticks)["thoughts"]) for _ in range(calls))
+
+
+def test_events_over_ticks_keeps_the_reference_rate():
+    rng = random.Random(7)
+    short_ticks = sum(events_over_ticks(1.0, 1.0, rng) for _ in range(15 * 2000))
+    long_ticks = sum(events_over_ticks(1.0, 15.0, rng) for _ in range(2000))
+    assert abs(short_ticks / 2000 - 15) < 0.5
+    assert abs(long_ticks / 2000 - 15) < 0.5
+
+
+def test_stretched_idle_ticks_run_as_many_activities():
+    wight = Wight(learning=None, rng=random.Random(11))
+    trials = 200
+    short_ticks = sum(idle_activities(wight, 15, 1.0) for _ in range(trials)) / trials  # 15 x 2 s
+    long_ticks = sum(idle_activities(wight, 1, 15.0) for _ in range(trials)) / trials  # 1 x 30 s
+    assert abs(short_ticks - 15) < 1.0
+    assert abs(long_ticks - 15) < 1.0
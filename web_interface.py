@@ -12,22 +12,38 @@ from http.server import HTTPServer, BaseHTTPRequestHandler
 import urllib.parse
 import webbrowser
 import socket
+from wight_actor import thaw
+
+def parse_view(text: str):
+    """Parse a "min_x,min_y,max_x,max_y" view rectangle; None if absent or malformed"""
+    try:
+        view = tuple(float(value) for value in text.split(','))
+    except ValueError:
+        return None
+    return view if len(view) == 4 else None
 
 class WightWebHandler(BaseHTTPRequestHandler):
     """HTTP request handler for Wight web interface"""
     
     def do_GET(self):
         """Handle GET requests"""
+        web_server.last_request_time = time.time()
+        parsed = urllib.parse.urlparse(self.path)
+        query = urllib.parse.parse_qs(parsed.query)
         if self.path == '/' or self.path == '/index.html':
             self.serve_main_page()
         elif self.path == '/api/status':
             self.serve_api_status()
         elif self.path == '/api/messages':
             self.serve_api_messages()
-        elif self.path == '/api/sandbox':
-            self.serve_api_sandbox()
+        elif parsed.path == '/api/sandbox':
+            self.serve_api_sandbox(query)
+        elif parsed.path == '/api/sandbox/updates':
+            self.serve_api_sandbox_updates(query)
         elif self.path == '/api/intelligence':
             self.serve_api_intelligence()
+        elif parsed.path == '/api/sensors':
+            self.serve_api_sensors(query)
         elif self.path.startswith('/static/'):
             self.serve_static_file()
         else:
@@ -35,10 +51,15 @@ class WightWebHandler(BaseHTTPRequestHandler):
     
     def do_POST(self):
         """Handle POST requests"""
+        web_server.last_request_time = time.time()
         if self.path == '/api/send_message':
             self.handle_send_message()
         elif self.path == '/api/voice_toggle':
             self.handle_voice_toggle()
+        elif self.path == '/api/sandbox/view':
+            self.handle_sandbox_view()
+        elif self.path == '/api/sensors/batch':
+            self.handle_sensor_batch()
         else:
             self.send_error(404)
     
@@ -63,6 +84,18 @@ class WightWebHandler(BaseHTTPRequestHandler):
                 "voice_available": False  # Will be updated by voice system if available
             }
             
+            actor = web_server.wight_actor
+            if actor is not None:
+                snapshot = actor.snapshot()
+                status_data.update({
+                    "active": True,
+                    "dominant_emotion": snapshot["dominant_emotion"],
+                    "emotions": thaw(snapshot["emotions"]),
+                    "memory_count": snapshot["memory_count"],
+                    "sandbox": thaw(snapshot["sandbox"]),
+                    "state_version": snapshot["version"]
+                })
+            
             # Try to get voice status
             try:
                 voice_status_file = Path("data/voice_status.json")
@@ -102,10 +135,11 @@ class WightWebHandler(BaseHTTPRequestHandler):
         except Exception as e:
             self.send_json_response({"messages": []})
     
-    def serve_api_sandbox(self):
-        """Serve sandbox object data"""
+    def serve_api_sandbox(self, query: dict):
+        """Serve sandbox object data, limited to ?view=min_x,min_y,max_x,max_y when given"""
         try:
             sandbox_data = {"objects": []}
+            view = parse_view(query.get('view', [''])[0])
             
             memories_file = Path("data/memories.json")
             if memories_file.exists():
@@ -114,11 +148,15 @@ class WightWebHandler(BaseHTTPRequestHandler):
                     sandbox_objects = memories_data.get("sandbox_objects", {})
                     
                     for obj_id, obj_data in sandbox_objects.items():
+                        position = obj_data.get("position", {"x": 0, "y": 0})
+                        if view and not (view[0] <= position.get("x", 0) <= view[2]
+                                         and view[1] <= position.get("y", 0) <= view[3]):
+                            continue
                         sandbox_data["objects"].append({
                             "id": obj_id,
                             "name": obj_data.get("name", "Unknown"),
                             "type": obj_data.get("type", "cube"),
-                            "position": obj_data.get("position", {"x": 0, "y": 0}),
+                            "position": position,
                             "color": obj_data.get("color", {"r": 0.5, "g": 0.5, "b": 0.5}),
                             "created_at": obj_data.get("created_at", time.time())
                         })
@@ -127,6 +165,44 @@ class WightWebHandler(BaseHTTPRequestHandler):
         except Exception as e:
             self.send_json_response({"objects": []})
     
+    def serve_api_sandbox_updates(self, query: dict):
+        """Serve the sandbox actions queued for one streaming client since its last poll"""
+        streamer = web_server.sandbox_streamer
+        if streamer is None:
+            self.send_json_response({"streaming": False, "actions": []})
+            return
+        
+        client_id = query.get('client', [''])[0]
+        self.send_json_response({
+            "streaming": True,
+            "actions": streamer.poll(client_id),
+            "timestamp": time.time()
+        })
+    
+    def serve_api_sensors(self, query: dict):
+        """Serve sensor ingest stats, or one sensor's series with ?sensor=name&seconds=600&resolution=10"""
+        sensors = web_server.sensor_ingest
+        if sensors is None:
+            self.send_json_response({"ingesting": False})
+            return
+        
+        name = query.get('sensor', [''])[0]
+        if not name:
+            self.send_json_response(dict(sensors.get_stats(), ingesting=True))
+            return
+        
+        try:
+            seconds = float(query.get('seconds', ['600'])[0])
+            resolution = query.get('resolution', [''])[0]
+            series = sensors.series(name, seconds, float(resolution) if resolution else None)
+        except ValueError as e:
+            self.send_json_response({"error": str(e)}, 400)
+            return
+        if series is None:
+            self.send_json_response({"error": f"No samples from sensor '{name}'"}, 404)
+            return
+        self.send_json_response(series)
+    
     def serve_api_intelligence(self):
         """Serve Wight's intelligence and learning status"""
         try:
@@ -142,13 +218,17 @@ class WightWebHandler(BaseHTTPRequestHandler):
             
             # Try to get intelligence status
             try:
-                from wight_core import Wight
-                from learning_core import learning_core
+                actor = web_server.wight_actor
+                if actor is not None:
+                    # The running Wight's own learner, as of its last published snapshot
+                    status = thaw(actor.snapshot()["learning"])
+                else:
+                    from learning_core import learning_core
+                    status = learning_core.get_learning_status()
                 
-                # Get learning status if available
-                status = learning_core.get_learning_status()
-                intelligence_data.update(status)
-                intelligence_data["learning_available"] = True
+                if status is not None:
+                    intelligence_data.update(status)
+                    intelligence_data["learning_available"] = True
                 
             except ImportError:
                 pass
@@ -186,6 +266,10 @@ class WightWebHandler(BaseHTTPRequestHandler):
             with open("data/input.json", 'w') as f:
                 json.dump(input_data, f, indent=2)
             
+            # Let a running Wight runtime pick the message up immediately
+            if web_server.message_listener:
+                web_server.message_listener()
+            
             # Wait briefly for response
             response = self.wait_for_response(input_data["id"])
             
@@ -194,6 +278,53 @@ class WightWebHandler(BaseHTTPRequestHandler):
         except Exception as e:
             self.send_json_response({"error": str(e)}, 500)
     
+    def handle_sandbox_view(self):
+        """Subscribe a streaming client to the sandbox chunks around its view"""
+        try:
+            streamer = web_server.sandbox_streamer
+            if streamer is None:
+                self.send_json_response({"streaming": False})
+                return
+            
+            content_length = int(self.headers['Content-Length'])
+            data = json.loads(self.rfile.read(content_length).decode())
+            
+            client_id = str(data.get("client_id", "")).strip()
+            if not client_id:
+                self.send_json_response({"error": "Missing client_id"}, 400)
+                return
+            
+            view = data.get("view")
+            if view:
+                view = tuple(float(view[key]) for key in ("min_x", "min_y", "max_x", "max_y"))
+            streamer.request_view(client_id, view or None)
+            
+            self.send_json_response({"streaming": True, "chunk_size": streamer.chunk_size})
+            
+        except Exception as e:
+            self.send_json_response({"error": str(e)}, 500)
+    
+    def handle_sensor_batch(self):
+        """Ingest a batch of timestamped device sensor samples"""
+        try:
+            sensors = web_server.sensor_ingest
+            if sensors is None:
+                self.send_json_response({"ingesting": False})
+                return
+            
+            content_length = int(self.headers['Content-Length'])
+            batch = json.loads(self.rfile.read(content_length).decode())
+            try:
+                kept = sensors.ingest_batch(batch)
+            except ValueError as e:
+                self.send_json_response({"error": str(e)}, 400)
+                return
+            
+            self.send_json_response({"ingesting": True, "samples": kept})
+        
+        except Exception as e:
+            self.send_json_response({"error": str(e)}, 500)
+    
     def handle_voice_toggle(self):
         """Handle voice system toggle"""
         try:
@@ -644,32 +775,36 @@ class WightWebHandler(BaseHTTPRequestHandler):
             voiceEnabled = !voiceEnabled;
         }
         
+        // Sandbox streaming: this page only watches the chunks around its view
+        const sandboxClientId = 'web_' + Math.random().toString(36).slice(2);
+        const sandboxView = {min_x: -16, min_y: -16, max_x: 16, max_y: 16};
+        let sandboxObjects = {};
+        let sandboxPollTimer = null;
+        
         // Load sandbox data
         async function loadSandbox() {
             try {
-                const response = await fetch('/api/sandbox');
-                const data = await response.json();
-                
-                const sandboxView = document.getElementById('sandbox-view');
-                sandboxView.innerHTML = '';
+                const response = await fetch('/api/sandbox/view', {
+                    method: 'POST',
+                    headers: {'Content-Type': 'application/json'},
+                    body: JSON.stringify({client_id: sandboxClientId, view: sandboxView})
+                });
+                const subscription = await response.json();
                 
-                if (data.objects.length === 0) {
-                    sandboxView.innerHTML = '<div class="thinking">Wight\'s sandbox is empty - a blank canvas for creativity</div>';
+                if (subscription.streaming) {
+                    if (!sandboxPollTimer) {
+                        sandboxPollTimer = setInterval(pollSandbox, 2000);
+                    }
+                    pollSandbox();
                     return;
                 }
                 
-                data.objects.forEach(obj => {
-                    const objDiv = document.createElement('div');
-                    objDiv.className = 'object-card';
-                    objDiv.innerHTML = `
-                        <div class="object-name">${obj.name}</div>
-                        <div class="object-details">
-                            Type: ${obj.type} | 
-                            Position: (${obj.position.x.toFixed(1)}, ${obj.position.y.toFixed(1)})
-                        </div>
-                    `;
-                    sandboxView.appendChild(objDiv);
-                });
+                // No running Wight to stream from; read the saved world instead
+                const view = [sandboxView.min_x, sandboxView.min_y, sandboxView.max_x, sandboxView.max_y].join(',');
+                const saved = await (await fetch('/api/sandbox?view=' + view)).json();
+                sandboxObjects = {};
+                saved.objects.forEach(obj => { sandboxObjects[obj.id] = obj; });
+                renderSandbox();
                 
             } catch (error) {
                 document.getElementById('sandbox-view').innerHTML = 
@@ -677,6 +812,90 @@ class WightWebHandler(BaseHTTPRequestHandler):
             }
         }
         
+        // Apply the actions streamed for our chunks since the last poll
+        async function pollSandbox() {
+            if (currentTab !== 'sandbox') {
+                clearInterval(sandboxPollTimer);
+                sandboxPollTimer = null;
+                return;
+            }
+            try {
+                const response = await fetch('/api/sandbox/updates?client=' + sandboxClientId);
+                const data = await response.json();
+                data.actions.forEach(applySandboxAction);
+                if (data.actions.length > 0) {
+                    renderSandbox();
+                }
+            } catch (error) {
+                console.log('Could not poll sandbox updates');
+            }
+        }
+        
+        function applySandboxAction(action) {
+            switch (action.type) {
+                case 'reset_sandbox':
+                    sandboxObjects = {};
+                    break;
+                case 'create_object':
+                    sandboxObjects[action.object_id] = action.object_data;
+                    break;
+                case 'create_batch':
+                    action.object_ids.forEach((id, i) => {
+                        sandboxObjects[id] = {
+                            id: id,
+                            name: action.names[i],
+                            type: action.type_names[action.types[i]],
+                            position: {x: action.positions.x[i], y: action.positions.y[i]}
+                        };
+                    });
+                    break;
+                case 'move_object':
+                    if (sandboxObjects[action.object_id]) {
+                        sandboxObjects[action.object_id].position = action.new_position;
+                    }
+                    break;
+                case 'update_objects':
+                    if (action.positions) {
+                        action.object_ids.forEach((id, i) => {
+                            if (sandboxObjects[id]) {
+                                sandboxObjects[id].position = {x: action.positions.x[i], y: action.positions.y[i]};
+                            }
+                        });
+                    }
+                    break;
+                case 'destroy_object':
+                    delete sandboxObjects[action.object_id];
+                    break;
+                case 'forget_objects':
+                    action.object_ids.forEach(id => { delete sandboxObjects[id]; });
+                    break;
+            }
+        }
+        
+        function renderSandbox() {
+            const container = document.getElementById('sandbox-view');
+            container.innerHTML = '';
+            
+            const objects = Object.values(sandboxObjects);
+            if (objects.length === 0) {
+                container.innerHTML = '<div class="thinking">Nothing here yet - a blank canvas for creativity</div>';
+                return;
+            }
+            
+            objects.forEach(obj => {
+                const objDiv = document.createElement('div');
+                objDiv.className = 'object-card';
+                objDiv.innerHTML = `
+                    <div class="object-name">${obj.name}</div>
+                    <div class="object-details">
+                        Type: ${obj.type} | 
+                        Position: (${obj.position.x.toFixed(1)}, ${obj.position.y.toFixed(1)})
+                    </div>
+                `;
+                container.appendChild(objDiv);
+            });
+        }
+        
         // Check status periodically
         async function checkStatus() {
             try {
@@ -814,6 +1033,11 @@ class WightWebServer:
         self.port = port
         self.server = None
         self.server_thread = None
+        self.message_listener = None  # Called when a message is queued for Wight
+        self.last_request_time = 0.0  # Lets the runtime tell whether a client is connected
+        self.sandbox_streamer = None  # Set by a running Wight to stream sandbox chunks to clients
+        self.sensor_ingest = None  # Set by a running Wight to accept device sensor batches
+        self.wight_actor = None  # Set by a running Wight; the web thread reads its snapshots
         
     def start(self):
         """Start the web server"""
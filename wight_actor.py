@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Wight Actor - Single-owner access to a Wight's state
+One thread owns the Wight. Every other thread hands it work through a
+mailbox and gets a future back, and reads state from immutable snapshots
+the owner republishes after each change, so readers never lock or wait
+on the mind loop and nothing else mutates Wight behind its back.
+"""
+
+import queue
+import threading
+from concurrent.futures import Future
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+def freeze(value: Any) -> Any:
+    """Read-only deep copy of plain dict/list data"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Plain dicts and lists again, for JSON encoding"""
+    if isinstance(value, MappingProxyType):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+    return value
+
+
+def build_snapshot(wight, version: int) -> MappingProxyType:
+    """The parts of a Wight other threads may read, copied and frozen"""
+    dominant = wight.emotions.get_dominant_emotion()
+    return freeze({
+        "version": version,
+        "taken_at": wight.clock.time(),
+        "emotions": dict(wight.emotions.emotions),
+        "dominant_emotion": dominant,
+        "emotional_state": wight.emotions.get_emotional_state_description(),
+        "memory_count": len(wight.memory),
+        "learned_facts": dict(wight.learned_facts),
+        "last_interaction": wight.last_interaction,
+        "last_interact_report": wight.last_interact_report,
+        "environment": dict(wight.perception.environment_state),
+        "sandbox": wight.sandbox.get_sandbox_stats(),
+        "learning": wight.learning.get_learning_status() if wight.learning is not None else None
+    })
+
+
+class WightActor:
+    """Owns a Wight and runs all work on it one mailbox message at a time
+    
+    ask() and tell() may be called from any thread. The owner drains the
+    mailbox with drain(): either a WightRuntime on its event loop (see
+    bind), or the actor's own thread after start(). Work submitted from the
+    owner thread runs immediately. snapshot() returns the latest frozen
+    view of Wight's state; it is replaced, never modified, after each batch
+    of work.
+    """
+    
+    def __init__(self, wight):
+        self.wight = wight
+        self.mailbox: "queue.SimpleQueue" = queue.SimpleQueue()
+        self.owner: Optional[int] = None  # Thread id of the owner
+        self.messages_handled = 0
+        self._notify: Optional[Callable[[], None]] = None
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self._version = 0
+        self._snapshot = build_snapshot(wight, self._version)
+    
+    def bind(self, notify: Callable[[], None] = None):
+        """Make the calling thread the owner; notify is called from senders when mail arrives"""
+        self.owner = threading.get_ident()
+        self._notify = notify
+    
+    def ask(self, func: Callable, *args, **kwargs) -> Future:
+        """Run func(*args, **kwargs) on the owner; the future resolves to its result
+        
+        Results from the mailbox are delivered after the snapshot has been
+        republished, so a sender that waited on the future reads a snapshot
+        that already includes its change.
+        """
+        future = Future()
+        if threading.get_ident() == self.owner:
+            self._settle(future, *self._run(func, args, kwargs))
+            return future
+        self.mailbox.put((func, args, kwargs, future))
+        if self._notify is not None:
+            self._notify()
+        return future
+    
+    def tell(self, func: Callable, *args, **kwargs):
+        """Like ask, without waiting for or reporting the result"""
+        if threading.get_ident() == self.owner:
+            self._settle(None, *self._run(func, args, kwargs))
+            return
+        self.mailbox.put((func, args, kwargs, None))
+        if self._notify is not None:
+            self._notify()
+    
+    def drain(self, limit: int = None) -> int:
+        """Handle queued messages on the owner thread, then republish the snapshot"""
+        messages = []
+        while limit is None or len(messages) < limit:
+            try:
+                messages.append(self.mailbox.get_nowait())
+            except queue.Empty:
+                break
+        return self._handle(messages)
+    
+    def _handle(self, messages: List[Tuple]) -> int:
+        outcomes = []
+        for func, args, kwargs, future in messages:
+            if future is not None and not future.set_running_or_notify_cancel():
+                continue
+            outcomes.append((future,) + self._run(func, args, kwargs))
+        if outcomes:
+            self.publish()
+            for outcome in outcomes:
+                self._settle(*outcome)
+        return len(outcomes)
+    
+    def _run(self, func: Callable, args: tuple, kwargs: Dict) -> Tuple[Any, Optional[Exception]]:
+        self.messages_handled += 1
+        try:
+            return func(*args, **kwargs), None
+        except Exception as e:
+            return None, e
+    
+    def _settle(self, future: Optional[Future], result: Any, error: Optional[Exception]):
+        if future is None:
+            if error is not None:
+                print(f"⚠️ Wight actor message error: {error}")
+        elif error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+    
+    def publish(self):
+        """Replace the snapshot with the current state; call on the owner after changing Wight"""
+        self._version += 1
+        self._snapshot = build_snapshot(self.wight, self._version)
+    
+    def snapshot(self) -> MappingProxyType:
+        """The latest published state; safe to read from any thread without locking"""
+        return self._snapshot
+    
+    def start(self):
+        """Own the Wight from a dedicated thread, for hosts without a WightRuntime"""
+        if self._thread is not None:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._serve, name="wight-actor", daemon=True)
+        self._thread.start()
+    
+    def stop(self, timeout: float = 5.0):
+        if self._thread is None:
+            return
+        self._running = False
+        self.mailbox.put((lambda: None, (), {}, None))  # Wake the thread so it sees the flag
+        self._thread.join(timeout)
+        self._thread = None
+    
+    def _serve(self):
+        self.bind()
+        while self._running:
+            messages = [self.mailbox.get()]
+            while True:
+                try:
+                    messages.append(self.mailbox.get_nowait())
+                except queue.Empty:
+                    break
+            self._handle(messages)
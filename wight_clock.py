@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Wight Clock - Injectable time sources for Wight's subsystems
+Every subsystem reads time through a clock object with a time() method, so
+simulations can swap in a virtual clock and fast-forward days of life.
+"""
+
+import time
+
+
+class SystemClock:
+    """Wall-clock time (the default for every subsystem)"""
+    
+    def time(self) -> float:
+        return time.time()
+
+
+class SimulatedClock:
+    """Virtual clock that only moves when advanced"""
+    
+    def __init__(self, start: float = 1700000000.0):
+        self.now = start
+    
+    def time(self) -> float:
+        return self.now
+    
+    def advance(self, seconds: float) -> float:
+        self.now += seconds
+        return self.now
+
+
+# Shared default; stateless and picklable so hibernated Wights keep working
+SYSTEM_CLOCK = SystemClock()
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Wight Host - Many Wight instances sharded across worker processes
+Each customer gets their own Wight with isolated learning state. Instances
+are routed to a fixed pool of shard processes by instance id, and idle
+instances are hibernated to disk so that a single machine can keep
+hundreds of lightly used Wights available.
+"""
+
+import os
+import re
+import gzip
+import time
+import zlib
+import pickle
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from wight_core import Wight, LEARNING_AVAILABLE
+
+if LEARNING_AVAILABLE:
+    from learning_core import LearningCore
+
+# Instance ids double as hibernation file names
+INSTANCE_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+
+class WightShard:
+    """The Wight instances owned by one worker process"""
+    
+    def __init__(self, shard_index: int, data_dir: str, idle_timeout: float = 600.0,
+                 max_resident: int = 256):
+        self.shard_index = shard_index
+        self.data_dir = Path(data_dir)
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        self.idle_timeout = idle_timeout
+        self.max_resident = max_resident
+        
+        self.instances: Dict[str, Wight] = {}
+        self.last_used: Dict[str, float] = {}
+        
+        self.created = 0
+        self.thawed = 0
+        self.hibernated = 0
+    
+    def _hibernation_path(self, instance_id: str) -> Path:
+        return self.data_dir / f"{instance_id}.wight.gz"
+    
+    def get(self, instance_id: str) -> Wight:
+        """Return a resident instance, waking or creating it as needed"""
+        wight = self.instances.get(instance_id)
+        if wight is None:
+            path = self._hibernation_path(instance_id)
+            if path.exists():
+                with gzip.open(path, "rb") as f:
+                    wight = pickle.load(f)
+                self.thawed += 1
+            else:
+                wight = Wight(learning=LearningCore() if LEARNING_AVAILABLE else None)
+                self.created += 1
+            
+            self.instances[instance_id] = wight
+            self._enforce_resident_limit(keep=instance_id)
+        
+        self.last_used[instance_id] = time.time()
+        return wight
+    
+    def hibernate(self, instance_id: str) -> bool:
+        """Write an instance to disk and release it from memory"""
+        wight = self.instances.pop(instance_id, None)
+        self.last_used.pop(instance_id, None)
+        if wight is None:
+            return False
+        
+        path = self._hibernation_path(instance_id)
+        temp_path = path.with_suffix(".tmp")
+        with gzip.open(temp_path, "wb", compresslevel=6) as f:
+            pickle.dump(wight, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+        
+        self.hibernated += 1
+        return True
+    
+    def hibernate_idle(self) -> List[str]:
+        """Hibernate every instance that has not been used within idle_timeout"""
+        cutoff = time.time() - self.idle_timeout
+        idle = [instance_id for instance_id, used in self.last_used.items() if used < cutoff]
+        for instance_id in idle:
+            self.hibernate(instance_id)
+        return idle
+    
+    def _enforce_resident_limit(self, keep: str):
+        """Hibernate least recently used instances beyond max_resident"""
+        while len(self.instances) > self.max_resident:
+            candidates = [i for i in self.instances if i != keep]
+            if not candidates:
+                break
+            self.hibernate(min(candidates, key=lambda i: self.last_used.get(i, 0.0)))
+    
+    def interact(self, instance_id: str, message: str) -> str:
+        return self.get(instance_id).interact(message)
+    
+    def get_status(self, instance_id: str) -> Dict[str, Any]:
+        wight = self.get(instance_id)
+        return {
+            "instance_id": instance_id,
+            "shard": self.shard_index,
+            "dominant_emotion": wight.emotions.get_dominant_emotion(),
+            "emotions": dict(wight.emotions.emotions),
+            "memories": len(wight.memory),
+            "sandbox_objects": len(wight.sandbox.objects),
+            "intelligence": wight.get_intelligence_status()
+        }
+    
+    def tick(self) -> Dict[str, Dict[str, Any]]:
+        """Run one mind loop for every resident instance, then hibernate idle ones
+        
+        Mind loops integrate over elapsed time, so the host can tick rarely.
+        Only thoughts and sandbox actions are returned to keep IPC small.
+        """
+        results = {}
+        for instance_id, wight in list(self.instances.items()):
+            try:
+                mind_result = wight.mind_loop()
+            except Exception as e:
+                print(f"⚠️ Mind loop error in {instance_id}: {e}")
+                continue
+            if mind_result["thoughts"] or mind_result["sandbox_actions"]:
+                results[instance_id] = {
+                    "thoughts": mind_result["thoughts"],
+                    "sandbox_actions": mind_result["sandbox_actions"]
+                }
+        
+        self.hibernate_idle()
+        return results
+    
+    def hibernate_all(self) -> int:
+        count = 0
+        for instance_id in list(self.instances):
+            count += self.hibernate(instance_id)
+        return count
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "shard": self.shard_index,
+            "pid": os.getpid(),
+            "resident": len(self.instances),
+            "created": self.created,
+            "thawed": self.thawed,
+            "hibernated": self.hibernated
+        }
+
+
+# Shard owned by the current worker process
+_shard: Optional[WightShard] = None
+
+def _init_shard(shard_index: int, data_dir: str, idle_timeout: float, max_resident: int):
+    global _shard
+    _shard = WightShard(shard_index, data_dir, idle_timeout, max_resident)
+
+def _call_shard(method: str, *args):
+    return getattr(_shard, method)(*args)
+
+
+class WightHost:
+    """Routes requests for many Wight instances to a fixed pool of shard processes
+    
+    Each shard is a single-worker process pool, so an instance only ever
+    lives in one process and its requests are handled in order. Every call
+    returns a concurrent.futures.Future.
+    """
+    
+    def __init__(self, num_shards: int = None, data_dir: str = "data/instances",
+                 idle_timeout: float = 600.0, max_resident_per_shard: int = 256):
+        self.num_shards = num_shards or os.cpu_count() or 1
+        self.data_dir = data_dir
+        self.shards = [
+            ProcessPoolExecutor(max_workers=1, initializer=_init_shard,
+                                initargs=(index, data_dir, idle_timeout, max_resident_per_shard))
+            for index in range(self.num_shards)
+        ]
+        
+        print(f"🏠 Wight host started with {self.num_shards} shards")
+    
+    def shard_for(self, instance_id: str) -> int:
+        """Stable shard index for an instance id"""
+        if not INSTANCE_ID_PATTERN.match(instance_id):
+            raise ValueError(f"Invalid Wight instance id: {instance_id!r}")
+        return zlib.crc32(instance_id.encode()) % self.num_shards
+    
+    def _submit(self, instance_id: str, method: str, *args) -> Future:
+        return self.shards[self.shard_for(instance_id)].submit(_call_shard, method, instance_id, *args)
+    
+    def interact(self, instance_id: str, message: str) -> Future:
+        return self._submit(instance_id, "interact", message)
+    
+    def get_status(self, instance_id: str) -> Future:
+        return self._submit(instance_id, "get_status")
+    
+    def hibernate(self, instance_id: str) -> Future:
+        return self._submit(instance_id, "hibernate")
+    
+    def tick_all(self) -> Dict[str, Dict[str, Any]]:
+        """Run mind loops on every shard in parallel and merge their results"""
+        futures = [shard.submit(_call_shard, "tick") for shard in self.shards]
+        results = {}
+        for future in futures:
+            results.update(future.result())
+        return results
+    
+    def get_stats(self) -> List[Dict[str, Any]]:
+        futures = [shard.submit(_call_shard, "get_stats") for shard in self.shards]
+        return [future.result() for future in futures]
+    
+    def shutdown(self):
+        """Hibernate every resident instance and stop the shard processes"""
+        futures = [shard.submit(_call_shard, "hibernate_all") for shard in self.shards]
+        total = sum(future.result() for future in futures)
+        for shard in self.shards:
+            shard.shutdown()
+        print(f"🏠 Wight host stopped, {total} instances hibernated")
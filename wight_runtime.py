@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""
+Wight Runtime - Asyncio event loop for Wight's consciousness
+Runs input handling, mind loop ticks, voice I/O and periodic subsystems as
+independent tasks on a single event loop that owns Wight's state
+"""
+
+import asyncio
+import inspect
+import json
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List
+
+from wight_scheduler import BudgetScheduler, MaintenanceScheduler, PRIORITY_HIGH, PRIORITY_NORMAL
+
+
+class RuntimeTimer:
+    """A periodic async or blocking job driven by its own task"""
+    
+    def __init__(self, name: str, period: float, callback: Callable, blocking: bool = False):
+        self.name = name
+        self.period = period
+        self.callback = callback
+        self.blocking = blocking
+        self.runs = 0
+        self.last_run = None
+
+
+class WightRuntime:
+    """Drives a GodotBridge's Wight from a single asyncio event loop
+    
+    Everything that touches Wight's state runs on the loop thread, which
+    owns the bridge's WightActor: other threads send work through its
+    mailbox and read the snapshots published after each tick. File,
+    camera and speech I/O is pushed to a small thread pool so a slow step
+    never delays the others, and idle tasks sleep instead of spinning.
+    Synchronous subsystems, including the mind loop, share a budgeted
+    scheduler that yields to pending user input between jobs. While no
+    client is connected the mind loop interval stretches towards
+    max_idle_interval, and it snaps back as soon as a message arrives.
+    Housekeeping (deferred learning and reflection, index compaction and
+    saving memories) only runs once Wight has gone maintenance_idle seconds
+    without an interaction, and stops at the next step when input arrives.
+    """
+    
+    def __init__(self, bridge, voice_system=None, mind_interval: float = 2.0,
+                 input_poll_interval: float = 0.1, idle_poll_interval: float = 1.0,
+                 max_workers: int = 4, tick_budget: float = 0.05, mind_budget: float = 0.02,
+                 max_idle_interval: float = 30.0, client_timeout: float = 120.0,
+                 maintenance_idle: float = 10.0):
+        self.bridge = bridge
+        self.wight = bridge.wight_agent
+        self.actor = bridge.actor
+        self.voice_system = voice_system
+        self.mind_interval = mind_interval
+        self.max_idle_interval = max(mind_interval, max_idle_interval)
+        self.client_timeout = client_timeout
+        self.last_client_activity = time.time()
+        self.client_activity_sources: List[Callable[[], float]] = []  # Return last-seen timestamps
+        self.input_poll_interval = input_poll_interval
+        self.idle_poll_interval = idle_poll_interval
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="wight-io")
+        self.timers: List[RuntimeTimer] = []
+        self.scheduler = BudgetScheduler(tick_budget=tick_budget)
+        self.mind_job = self.scheduler.register("mind_loop", self._mind_tick, mind_interval,
+                                                mind_budget, PRIORITY_HIGH)
+        
+        # Archiving down to the sandbox budget is sliced so a huge scene never stalls a tick
+        self.wight.budget_scheduled = True
+        self.add_timer("sandbox_budget", mind_interval, self.wight.sandbox.budget_eviction_steps, budget=0.01)
+        
+        self.maintenance = MaintenanceScheduler(self._idle_for, idle_after=maintenance_idle)
+        self.memories_dirty = False
+        self.wight.idle_maintenance = True
+        self.add_maintenance("learning", self.wight.catch_up_learning_steps, 5.0)
+        self.add_maintenance("sandbox_indexes", self.wight.sandbox.compact_indexes, 120.0)
+        self.add_maintenance("save_memories", self._save_memories, 30.0)
+        
+        self.loop = None
+        self._tasks = []
+        self._wake_event = None
+        self._mail_event = None
+        self._stop_event = None
+        self._input_waiting = threading.Event()
+        
+        self.add_timer("godot_files", mind_interval, self._read_godot_files)
+        if voice_system:
+            self.add_timer("voice_output", 0.5, voice_system.check_voice_output_request, blocking=True)
+    
+    def add_timer(self, name: str, period: float, callback: Callable, blocking: bool = False,
+                  budget: float = 0.01, priority: int = PRIORITY_NORMAL):
+        """Run callback every period seconds
+        
+        Plain callables and generator functions run on the loop under the
+        scheduler's budget (generators are sliced), so they may touch
+        Wight's state. Coroutine functions are awaited on their own task.
+        Callables marked blocking run in the executor and must not touch it.
+        """
+        if not blocking and not inspect.iscoroutinefunction(callback):
+            return self.scheduler.register(name, callback, period, budget, priority)
+        
+        timer = RuntimeTimer(name, period, callback, blocking)
+        self.timers.append(timer)
+        if self.loop is not None:
+            self.loop.call_soon_threadsafe(self._start_timer, timer)
+        return timer
+    
+    def add_maintenance(self, name: str, callback: Callable, period: float, budget: float = 0.01):
+        """Run callback every period seconds, but only while Wight is idle
+        
+        Generator functions are stepped and paused as soon as input arrives;
+        plain callables run whole, so keep them short.
+        """
+        return self.maintenance.register(name, callback, period, budget)
+    
+    def _idle_for(self) -> float:
+        return self.wight.clock.time() - self.wight.last_interaction
+    
+    async def run_blocking(self, func: Callable, *args) -> Any:
+        """Run blocking work in the executor without stalling the loop"""
+        return await self.loop.run_in_executor(self.executor, func, *args)
+    
+    async def write_json(self, path: str, data: dict):
+        """Serialize on the loop (state is only consistent here) and write off it"""
+        serialized = json.dumps(data, indent=2)
+        await self.run_blocking(_write_text_file, path, serialized)
+    
+    def write_json_soon(self, path: str, data: dict):
+        """Like write_json for a Godot payload, for synchronous jobs that cannot await"""
+        serialized = self.bridge.serialize_payload(path, data)
+        self.loop.run_in_executor(self.executor, _write_text_file, path, serialized)
+    
+    def wake(self):
+        """Wake the input task immediately (safe to call from any thread)"""
+        self._input_waiting.set()
+        if self.loop is not None:
+            self.loop.call_soon_threadsafe(self._on_wake)
+    
+    def _notify_mail(self):
+        """Called by the actor from sender threads when a message is queued"""
+        if self.loop is not None:
+            self.loop.call_soon_threadsafe(self._mail_event.set)
+    
+    def _on_wake(self):
+        self._wake_event.set()
+        self.note_client_activity()
+    
+    def note_client_activity(self):
+        """Record client activity and snap the mind loop back to its base interval"""
+        self.last_client_activity = time.time()
+        if self.mind_job.period != self.mind_interval:
+            self.mind_job.period = self.mind_interval
+            self.mind_job.next_due = self.scheduler.clock()
+    
+    def client_connected(self) -> bool:
+        """Whether any client has been active within client_timeout"""
+        last_seen = self.last_client_activity
+        for source in self.client_activity_sources:
+            last_seen = max(last_seen, source() or 0.0)
+        return time.time() - last_seen < self.client_timeout
+    
+    def stop(self):
+        """Ask the runtime to shut down (safe to call from any thread)"""
+        if self.loop is not None:
+            self.loop.call_soon_threadsafe(self._stop_event.set)
+    
+    async def run(self):
+        """Run all tasks until stop() is called or the loop is cancelled"""
+        self.loop = asyncio.get_running_loop()
+        self._wake_event = asyncio.Event()
+        self._mail_event = asyncio.Event()
+        self._stop_event = asyncio.Event()
+        self.actor.bind(self._notify_mail)
+        self._tasks = [
+            asyncio.create_task(self._input_task(), name="wight-input"),
+            asyncio.create_task(self._mailbox_task(), name="wight-mailbox"),
+            asyncio.create_task(self._scheduler_task(), name="wight-scheduler"),
+            asyncio.create_task(self._maintenance_task(), name="wight-maintenance")
+        ]
+        for timer in self.timers:
+            self._start_timer(timer)
+        
+        print(f"⚡ Wight runtime started with {len(self._tasks)} tasks")
+        
+        try:
+            await self._stop_event.wait()
+        finally:
+            for task in self._tasks:
+                task.cancel()
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+            self.executor.shutdown(wait=False)
+            self.actor.drain()  # Queued work still runs, on this thread, before the loop goes
+            if self.memories_dirty:
+                self.memories_dirty = False
+                self.bridge.save_memories()
+            self.loop = None
+    
+    def _start_timer(self, timer: RuntimeTimer):
+        self._tasks.append(asyncio.create_task(self._timer_task(timer), name=f"wight-{timer.name}"))
+    
+    async def _sleep_or_wake(self, timeout: float):
+        """Sleep for timeout seconds unless woken early"""
+        try:
+            await asyncio.wait_for(self._wake_event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        self._wake_event.clear()
+    
+    async def _input_task(self):
+        """Handle Godot and voice input, backing off while nothing arrives"""
+        interval = self.input_poll_interval
+        
+        while True:
+            try:
+                handled = await self._poll_godot_input()
+                if self.voice_system:
+                    handled = await self._poll_voice_input() or handled
+            except Exception as e:
+                print(f"❌ Error handling input: {e}")
+                handled = False
+            
+            self._input_waiting.clear()
+            if handled:
+                self.actor.publish()
+                interval = self.input_poll_interval
+            else:
+                interval = min(self.idle_poll_interval, interval * 1.5)
+            
+            await self._sleep_or_wake(interval)
+    
+    async def _mailbox_task(self):
+        """Run work other threads sent to the actor, one message at a time between other tasks"""
+        while True:
+            await self._mail_event.wait()
+            self._mail_event.clear()
+            while self.actor.drain(limit=1):
+                await asyncio.sleep(0)
+    
+    async def _poll_godot_input(self) -> bool:
+        data = await self.run_blocking(self.bridge.read_godot_message)
+        if data is None:
+            return False
+        
+        self.note_client_activity()
+        response, timestamp, message_id, memories_changed = self.bridge.respond_to_message(data)
+        payload = self.bridge.build_response_payload(response, timestamp, message_id)
+        await self.run_blocking(self.bridge.write_response, payload)
+        
+        if memories_changed:
+            self.memories_dirty = True  # Saved in the next idle window
+        
+        return True
+    
+    async def _poll_voice_input(self) -> bool:
+        voice_data = await self.run_blocking(self.bridge.read_voice_input)
+        if voice_data is None:
+            return False
+        
+        self.note_client_activity()
+        payload = self.bridge.respond_to_voice_input(voice_data)
+        if payload:
+            await self.write_json(self.bridge.voice_output_file, payload)
+        
+        return True
+    
+    async def _scheduler_task(self):
+        """Run due subsystems, yielding to the input task whenever a message waits"""
+        while True:
+            report = self.scheduler.run_due(preempt=self._input_waiting.is_set)
+            
+            if report["preempted"] or report["deferred"] or report["sliced"]:
+                # Let input and I/O tasks run, then pick up the remaining work
+                await asyncio.sleep(self.scheduler.tick_budget)
+            else:
+                await asyncio.sleep(min(self.scheduler.time_until_next(), self.idle_poll_interval))
+    
+    async def _maintenance_task(self):
+        """Run housekeeping a slice at a time in idle windows, backing off while input is handled"""
+        while True:
+            report = self.maintenance.run_idle(preempt=self._input_waiting.is_set)
+            if report["preempted"]:
+                await asyncio.sleep(self.input_poll_interval)
+            elif report["paused"]:
+                await asyncio.sleep(0)  # Let input and the mind loop in between slices
+            else:
+                await asyncio.sleep(min(self.maintenance.time_until_work(), self.idle_poll_interval))
+    
+    def _save_memories(self):
+        """Persist what messages changed since the last save; serialized here, written off the loop"""
+        if not self.memories_dirty:
+            return
+        self.memories_dirty = False
+        serialized = self.bridge.build_memory_data()
+        self.loop.run_in_executor(self.executor, self.bridge.write_memories, serialized)
+    
+    async def _read_godot_files(self):
+        """Read the view and sensor files Godot writes off the loop, then apply them on it"""
+        view = await self.run_blocking(self.bridge.load_godot_view)
+        if view is not None:
+            self.bridge.apply_godot_view(view)
+        
+        batch = await self.run_blocking(self.bridge.load_sensor_batch)
+        if batch is not None:
+            self.bridge.ingest_sensor_batch(batch)
+    
+    def _mind_tick(self):
+        """Tick Wight's mind loop and forward the results to Godot"""
+        mind_result = self.wight.mind_loop()
+        for path, payload in self.bridge.collect_mind_outputs(mind_result):
+            self.write_json_soon(path, payload)
+        self.actor.publish()
+        
+        # Tickless idle: Wight's dynamics are elapsed-time correct, so with
+        # nobody watching the loop can stretch out to save power
+        if self.client_connected():
+            self.mind_job.period = self.mind_interval
+        else:
+            self.mind_job.period = min(self.max_idle_interval, self.mind_job.period * 1.5)
+    
+    async def _timer_task(self, timer: RuntimeTimer):
+        while True:
+            await asyncio.sleep(timer.period)
+            try:
+                if timer.blocking:
+                    await self.run_blocking(timer.callback)
+                else:
+                    result = timer.callback()
+                    if inspect.isawaitable(result):
+                        await result
+            except Exception as e:
+                print(f"⚠️ {timer.name} error: {e}")
+            
+            timer.runs += 1
+            timer.last_run = time.time()
+
+
+def _write_text_file(path: str, text: str):
+    try:
+        with open(path, 'w') as f:
+            f.write(text)
+    except Exception as e:
+        print(f"❌ Error writing {path}: {e}")
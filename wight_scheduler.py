@@ -0,0 +1,425 @@
+#!/usr/bin/env python3
+"""
+Wight Scheduler - Per-tick time budgets for Wight's subsystems
+Each subsystem declares how often it wants to run and how much CPU it may
+use. Over-budget work is deferred or sliced so that user-facing handling
+always comes first and an overloaded host degrades gracefully. Housekeeping
+waits for idle windows and steps aside the moment a message arrives.
+"""
+
+import time
+import inspect
+from typing import Any, Callable, Dict, List, Optional
+
+# Priority for user-facing work; never deferred and always run first
+PRIORITY_CRITICAL = 0
+PRIORITY_HIGH = 1
+PRIORITY_NORMAL = 5
+PRIORITY_LOW = 10
+
+
+class ScheduledJob:
+    """A subsystem registered with the scheduler"""
+    
+    def __init__(self, name: str, callback: Callable, period: float, budget: float,
+                 priority: int = PRIORITY_NORMAL, sliced: bool = False):
+        self.name = name
+        self.callback = callback
+        self.period = period
+        self.budget = budget
+        self.priority = priority
+        self.sliced = sliced
+        
+        self.next_due = 0.0
+        self.backoff = 1.0  # Period multiplier after overruns
+        self.avg_cost = 0.0  # Exponential moving average of run cost (seconds)
+        self.runs = 0
+        self.overruns = 0
+        self.deferrals = 0
+        self.consecutive_deferrals = 0
+        self.active_slice = None  # Generator for a sliced job in progress
+    
+    @property
+    def critical(self) -> bool:
+        return self.priority <= PRIORITY_CRITICAL
+    
+    def record_cost(self, cost: float):
+        """Track run cost and stretch the period while the job runs over budget"""
+        self.avg_cost = cost if self.runs == 0 else self.avg_cost * 0.8 + cost * 0.2
+        self.runs += 1
+        
+        if cost > self.budget:
+            self.overruns += 1
+            self.backoff = min(BudgetScheduler.MAX_BACKOFF, self.backoff * 2.0)
+        else:
+            self.backoff = max(1.0, self.backoff * 0.5)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "period": self.period,
+            "effective_period": self.period * self.backoff,
+            "budget": self.budget,
+            "priority": self.priority,
+            "avg_cost": self.avg_cost,
+            "runs": self.runs,
+            "overruns": self.overruns,
+            "deferrals": self.deferrals,
+            "in_progress": self.active_slice is not None
+        }
+
+
+class BudgetScheduler:
+    """Runs due subsystems in priority order within a per-tick CPU budget
+    
+    Critical jobs (user-facing message handling) always run first and ignore
+    the budget. Other jobs are deferred to a later tick when the remaining
+    budget cannot cover their typical cost, and jobs that run over their own
+    budget have their period stretched until they recover. Sliced jobs are
+    generator functions; they are resumed across ticks, one slice at a time,
+    until their budget for the tick is spent.
+    """
+    
+    MAX_BACKOFF = 8.0
+    MAX_CONSECUTIVE_DEFERRALS = 10  # Run a starving job even if the tick is over budget
+    
+    def __init__(self, tick_budget: float = 0.05, clock: Callable[[], float] = time.monotonic,
+                 cost_clock: Callable[[], float] = time.perf_counter):
+        self.tick_budget = tick_budget
+        self.clock = clock
+        self.cost_clock = cost_clock
+        self.jobs: List[ScheduledJob] = []
+        
+        self.ticks = 0
+        self.overloaded_ticks = 0
+        self.preemptions = 0
+    
+    def register(self, name: str, callback: Callable, period: float, budget: float,
+                 priority: int = PRIORITY_NORMAL, sliced: bool = None) -> ScheduledJob:
+        """Register a subsystem; generator functions are sliced automatically"""
+        if sliced is None:
+            sliced = inspect.isgeneratorfunction(callback)
+        
+        job = ScheduledJob(name, callback, period, budget, priority, sliced)
+        job.next_due = self.clock() + period
+        self.jobs.append(job)
+        return job
+    
+    def unregister(self, name: str):
+        self.jobs = [job for job in self.jobs if job.name != name]
+    
+    def time_until_next(self) -> float:
+        """Seconds until the next job is due (0 if work is waiting)"""
+        if not self.jobs:
+            return float("inf")
+        return max(0.0, min(job.next_due for job in self.jobs) - self.clock())
+    
+    def run_due(self, preempt: Optional[Callable[[], bool]] = None) -> Dict[str, List[str]]:
+        """Run one scheduler tick and report what ran, what was deferred and what was sliced
+        
+        preempt is polled between jobs; when it returns True the tick ends
+        early so the caller can service user input first.
+        """
+        now = self.clock()
+        tick_start = self.cost_clock()
+        report = {"ran": [], "deferred": [], "sliced": [], "preempted": False}
+        
+        due = [job for job in self.jobs if job.next_due <= now or job.active_slice is not None]
+        due.sort(key=lambda job: (job.priority, job.next_due))
+        
+        for job in due:
+            if not job.critical and preempt is not None and preempt():
+                report["preempted"] = True
+                self.preemptions += 1
+                break
+            
+            remaining = self.tick_budget - (self.cost_clock() - tick_start)
+            if (not job.critical
+                    and remaining < job.avg_cost
+                    and job.consecutive_deferrals < self.MAX_CONSECUTIVE_DEFERRALS):
+                job.deferrals += 1
+                job.consecutive_deferrals += 1
+                report["deferred"].append(job.name)
+                continue
+            
+            job.consecutive_deferrals = 0
+            if job.sliced:
+                finished = self._run_slices(job, remaining)
+                report["sliced" if not finished else "ran"].append(job.name)
+            else:
+                self._run_job(job)
+                report["ran"].append(job.name)
+        
+        self.ticks += 1
+        if report["deferred"] or self.cost_clock() - tick_start > self.tick_budget:
+            self.overloaded_ticks += 1
+        
+        return report
+    
+    def _run_job(self, job: ScheduledJob):
+        started = self.cost_clock()
+        try:
+            job.callback()
+        except Exception as e:
+            print(f"⚠️ {job.name} error: {e}")
+        job.record_cost(self.cost_clock() - started)
+        job.next_due = self.clock() + job.period * job.backoff
+    
+    def _run_slices(self, job: ScheduledJob, remaining: float) -> bool:
+        """Advance a sliced job within its budget; returns True once it completes"""
+        slice_budget = job.budget if job.critical else max(0.0, min(job.budget, remaining))
+        started = self.cost_clock()
+        
+        try:
+            if job.active_slice is None:
+                job.active_slice = job.callback()
+            
+            while True:
+                next(job.active_slice)
+                if self.cost_clock() - started >= slice_budget:
+                    # Out of budget for this tick; resume on the next one
+                    job.avg_cost = job.avg_cost * 0.8 + (self.cost_clock() - started) * 0.2
+                    return False
+        except StopIteration:
+            pass
+        except Exception as e:
+            print(f"⚠️ {job.name} error: {e}")
+        
+        job.active_slice = None
+        job.runs += 1
+        job.next_due = self.clock() + job.period * job.backoff
+        return True
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Scheduler health for monitoring"""
+        return {
+            "tick_budget": self.tick_budget,
+            "ticks": self.ticks,
+            "overloaded_ticks": self.overloaded_ticks,
+            "preemptions": self.preemptions,
+            "jobs": {job.name: job.get_stats() for job in self.jobs}
+        }
+
+
+class MaintenanceJob(ScheduledJob):
+    """A housekeeping job; its longest step bounds how long a new message can wait on it"""
+    
+    def __init__(self, name: str, callback: Callable, period: float, budget: float, sliced: bool):
+        super().__init__(name, callback, period, budget, PRIORITY_LOW, sliced)
+        self.longest_step = 0.0
+        self.interruptions = 0
+    
+    def record_step(self, cost: float):
+        self.longest_step = max(self.longest_step, cost)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        stats = super().get_stats()
+        stats.update(longest_step=self.longest_step, interruptions=self.interruptions)
+        return stats
+
+
+class MaintenanceScheduler:
+    """Runs housekeeping only while Wight is idle, stopping as soon as it is needed
+    
+    Jobs are due every period seconds but start only once idle_for()
+    reports at least idle_after seconds without interaction. Generator jobs
+    run a step at a time and stop at the first step boundary after preempt()
+    turns True or interaction resumes, then carry on from there in the next
+    idle window, so they should re-read any state they rely on after each
+    yield. Plain callables run whole and should be short. One run_idle call
+    spends at most slice_budget before handing control back.
+    """
+    
+    def __init__(self, idle_for: Callable[[], float], idle_after: float = 10.0, slice_budget: float = 0.01,
+                 clock: Callable[[], float] = time.monotonic, cost_clock: Callable[[], float] = time.perf_counter):
+        self.idle_for = idle_for
+        self.idle_after = idle_after
+        self.slice_budget = slice_budget
+        self.clock = clock
+        self.cost_clock = cost_clock
+        self.jobs: List[MaintenanceJob] = []
+        self.preemptions = 0
+    
+    def register(self, name: str, callback: Callable, period: float, budget: float = 0.01,
+                 sliced: bool = None) -> MaintenanceJob:
+        """Register a housekeeping job; generator functions are run a step at a time"""
+        if sliced is None:
+            sliced = inspect.isgeneratorfunction(callback)
+        
+        job = MaintenanceJob(name, callback, period, budget, sliced)
+        job.next_due = self.clock() + period
+        self.jobs.append(job)
+        return job
+    
+    def unregister(self, name: str):
+        self.jobs = [job for job in self.jobs if job.name != name]
+    
+    def is_idle(self) -> bool:
+        return self.idle_for() >= self.idle_after
+    
+    def time_until_work(self) -> float:
+        """Seconds until a job could next run: it must be due and Wight idle (inf with no jobs)"""
+        if not self.jobs:
+            return float("inf")
+        if any(job.active_slice is not None for job in self.jobs):
+            due_in = 0.0
+        else:
+            due_in = max(0.0, min(job.next_due for job in self.jobs) - self.clock())
+        return max(due_in, self.idle_after - self.idle_for())
+    
+    def run_idle(self, preempt: Optional[Callable[[], bool]] = None) -> Dict[str, Any]:
+        """Advance due jobs for up to slice_budget while Wight is idle
+        
+        Reports the jobs that finished, the ones left part-way and whether
+        the window ended because preempt() fired or interaction resumed.
+        """
+        report = {"idle": self.is_idle(), "ran": [], "paused": [], "preempted": False}
+        if not report["idle"]:
+            return report
+        
+        def interrupted() -> bool:
+            return (preempt is not None and preempt()) or not self.is_idle()
+        
+        now = self.clock()
+        deadline = self.cost_clock() + self.slice_budget
+        due = [job for job in self.jobs if job.active_slice is not None or job.next_due <= now]
+        due.sort(key=lambda job: (job.active_slice is None, job.next_due))  # Finish paused work first
+        
+        for job in due:
+            if interrupted():
+                report["preempted"] = True
+                self.preemptions += 1
+                break
+            if self.cost_clock() >= deadline:
+                break
+            
+            if job.sliced:
+                finished = self._step(job, deadline, interrupted)
+            else:
+                self._run_whole(job)
+                finished = True
+            report["ran" if finished else "paused"].append(job.name)
+        
+        return report
+    
+    def _run_whole(self, job: MaintenanceJob):
+        started = self.cost_clock()
+        try:
+            job.callback()
+        except Exception as e:
+            print(f"⚠️ {job.name} error: {e}")
+        cost = self.cost_clock() - started
+        job.record_step(cost)
+        job.avg_cost = cost if job.runs == 0 else job.avg_cost * 0.8 + cost * 0.2
+        job.runs += 1
+        job.next_due = self.clock() + job.period
+    
+    def _step(self, job: MaintenanceJob, deadline: float, interrupted: Callable[[], bool]) -> bool:
+        """Advance a generator job until it finishes, the slice ends or it is interrupted; True once done"""
+        try:
+            if job.active_slice is None:
+                job.active_slice = job.callback()
+            
+            while True:
+                started = self.cost_clock()
+                try:
+                    next(job.active_slice)
+                finally:
+                    job.record_step(self.cost_clock() - started)
+                if interrupted():
+                    job.interruptions += 1
+                    return False
+                if self.cost_clock() >= deadline:
+                    return False
+        except StopIteration:
+            pass
+        except Exception as e:
+            print(f"⚠️ {job.name} error: {e}")
+        
+        job.active_slice = None
+        job.runs += 1
+        job.next_due = self.clock() + job.period
+        return True
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "idle_after": self.idle_after,
+            "idle_for": self.idle_for(),
+            "preemptions": self.preemptions,
+            "jobs": {job.name: job.get_stats() for job in self.jobs}
+        }
+
+
+class StageCosts:
+    """Exponential moving average of the cost of each named stage of a request"""
+    
+    def __init__(self, cost_clock: Callable[[], float] = time.perf_counter, smoothing: float = 0.2):
+        self.cost_clock = cost_clock
+        self.smoothing = smoothing
+        self.averages: Dict[str, float] = {}
+    
+    def estimate(self, name: str) -> float:
+        """Typical cost of a stage in seconds; unseen stages are assumed free until measured"""
+        return self.averages.get(name, 0.0)
+    
+    def record(self, name: str, cost: float):
+        average = self.averages.get(name)
+        self.averages[name] = cost if average is None else average * (1 - self.smoothing) + cost * self.smoothing
+    
+    def decay(self, name: str):
+        """Shrink the estimate of a stage that was not run, so it is retried once load eases"""
+        if name in self.averages:
+            self.averages[name] *= 1 - self.smoothing
+
+
+class StageDeadline:
+    """One request's latency budget, spent stage by stage
+    
+    Required stages always run. Optional ones run only while their typical
+    cost still fits in what is left; the rest are skipped or deferred by the
+    caller and show up in report(). A budget of None never refuses a stage.
+    """
+    
+    def __init__(self, costs: StageCosts, budget: Optional[float]):
+        self.costs = costs
+        self.budget = budget
+        self.started = costs.cost_clock()
+        self.ran: List[str] = []
+        self.skipped: List[str] = []
+        self.deferred: List[str] = []
+    
+    def remaining(self) -> float:
+        if self.budget is None:
+            return float("inf")
+        return self.budget - (self.costs.cost_clock() - self.started)
+    
+    def affordable(self, name: str) -> bool:
+        return self.costs.estimate(name) <= self.remaining()
+    
+    def by_cost(self, names: List[str]) -> List[str]:
+        """Stages cheapest first, so as many as possible fit"""
+        return sorted(names, key=self.costs.estimate)
+    
+    def run(self, name: str, callback: Callable, *args, **kwargs) -> Any:
+        started = self.costs.cost_clock()
+        try:
+            return callback(*args, **kwargs)
+        finally:
+            self.costs.record(name, self.costs.cost_clock() - started)
+            self.ran.append(name)
+    
+    def skip(self, name: str):
+        self.skipped.append(name)
+        self.costs.decay(name)
+    
+    def defer(self, name: str):
+        self.deferred.append(name)
+        self.costs.decay(name)
+    
+    def report(self) -> Dict[str, Any]:
+        return {
+            "budget": self.budget,
+            "elapsed": self.costs.cost_clock() - self.started,
+            "ran": list(self.ran),
+            "skipped": list(self.skipped),
+            "deferred": list(self.deferred)
+        }
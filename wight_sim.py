@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Wight Simulation - Deterministic accelerated-time runs for benchmarking
+Drives a Wight with a virtual clock and a seeded random generator, so days
+of autonomous life and scripted interactions run as fast as the CPU allows
+and the same seed always produces the same Wight.
+"""
+
+import io
+import sys
+import json
+import time
+import random
+import hashlib
+import argparse
+import resource
+import contextlib
+from typing import Any, Dict, List
+
+from wight_clock import SimulatedClock
+from wight_core import Wight, LEARNING_AVAILABLE
+
+if LEARNING_AVAILABLE:
+    from learning_core import LearningCore
+
+# Used when no script file is given; cycled every interaction interval
+DEFAULT_SCRIPT = [
+    "Hello Wight, my name is Sam",
+    "How are you feeling today?",
+    "Create a tower",
+    "Can you make a spiral pattern?",
+    "What do you remember about me?",
+    "Teach me something about consciousness",
+    "Build a bridge",
+    "What is in your sandbox world?"
+]
+
+
+class WightSimulation:
+    """Runs a Wight on simulated time and records how it grows"""
+    
+    def __init__(self, seed: int = 0, tick_seconds: float = 2.0, sample_seconds: float = 3600.0):
+        self.seed = seed
+        self.tick_seconds = tick_seconds
+        self.sample_seconds = sample_seconds
+        
+        self.clock = SimulatedClock()
+        self.rng = random.Random(seed)
+        learning = LearningCore(self.clock) if LEARNING_AVAILABLE else None
+        # No reply latency budget: wall-clock costs must not change a deterministic run
+        self.wight = Wight(learning=learning, clock=self.clock, rng=self.rng, interact_budget=None)
+        
+        self.ticks = 0
+        self.interactions = 0
+        self.samples: List[Dict[str, Any]] = []
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Size of Wight's growing state at the current simulated time"""
+        wight = self.wight
+        sample = {
+            "sim_seconds": self.clock.time() - self.start_time,
+            "memories": len(wight.memory),
+            "sandbox_objects": len(wight.sandbox.objects),
+            "pending_actions": len(wight.sandbox.pending_actions),
+            "emotional_history": len(wight.emotions.emotional_history),
+            "perceptions": len(wight.perception.perceptions),
+            "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        }
+        if wight.learning is not None:
+            sample["concepts"] = len(wight.learning.concept_network.concepts)
+            sample["intelligence_level"] = wight.learning.intelligence_growth.intelligence_level
+        return sample
+    
+    def run(self, sim_seconds: float, script: List[str], interaction_interval: float,
+            verbose: bool = False) -> Dict[str, Any]:
+        """Simulate sim_seconds of life, sending a scripted message every interaction_interval"""
+        self.start_time = self.clock.time()
+        self.samples = [self.snapshot()]
+        next_sample = self.sample_seconds
+        next_interaction = interaction_interval if script else float("inf")
+        
+        output = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+        wall_start = time.perf_counter()
+        
+        with output:
+            elapsed = 0.0
+            while elapsed < sim_seconds:
+                self.clock.advance(self.tick_seconds)
+                elapsed += self.tick_seconds
+                self.wight.mind_loop(elapsed=self.tick_seconds)
+                self.ticks += 1
+                
+                if elapsed >= next_interaction:
+                    self.wight.interact(script[self.interactions % len(script)])
+                    self.interactions += 1
+                    next_interaction += interaction_interval
+                
+                if elapsed >= next_sample:
+                    self.samples.append(self.snapshot())
+                    next_sample += self.sample_seconds
+        
+        wall_seconds = time.perf_counter() - wall_start
+        final = self.snapshot()
+        initial = self.samples[0]
+        
+        return {
+            "seed": self.seed,
+            "sim_seconds": elapsed,
+            "wall_seconds": wall_seconds,
+            "ticks": self.ticks,
+            "ticks_per_second": self.ticks / wall_seconds if wall_seconds > 0 else float("inf"),
+            "speedup": elapsed / wall_seconds if wall_seconds > 0 else float("inf"),
+            "interactions": self.interactions,
+            "growth": {key: final[key] - initial[key] for key in final if key != "sim_seconds"},
+            "final": final,
+            "state_digest": self.state_digest()
+        }
+    
+    def state_digest(self) -> str:
+        """Hash of Wight's persistent state; equal seeds must give equal digests"""
+        wight = self.wight
+        state = {
+            "memory": wight.memory,
+            "learned_facts": wight.learned_facts,
+            "emotions": dict(wight.emotions.emotions),
+            "sandbox": wight.sandbox.objects
+        }
+        if wight.learning is not None:
+            state["learning"] = wight.learning.save_learning_state()
+        encoded = json.dumps(state, sort_keys=True, default=str).encode()
+        return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+def load_script(path: str) -> List[str]:
+    """Load scripted messages from a JSON list or a text file with one message per line"""
+    with open(path, 'r') as f:
+        content = f.read()
+    if path.endswith(".json"):
+        return [str(message) for message in json.loads(content)]
+    return [line.strip() for line in content.splitlines() if line.strip()]
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run Wight on simulated time")
+    parser.add_argument("--days", type=float, default=1.0, help="simulated days to run")
+    parser.add_argument("--tick", type=float, default=2.0, help="simulated seconds per mind loop")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--script", help="JSON list or text file of messages to send")
+    parser.add_argument("--interaction-interval", type=float, default=1800.0,
+                        help="simulated seconds between scripted messages (0 disables them)")
+    parser.add_argument("--sample-interval", type=float, default=3600.0,
+                        help="simulated seconds between growth samples")
+    parser.add_argument("--json", action="store_true", help="print the full report as JSON")
+    parser.add_argument("--verbose", action="store_true", help="show Wight's own output")
+    args = parser.parse_args(argv)
+    
+    script = load_script(args.script) if args.script else DEFAULT_SCRIPT
+    if args.interaction_interval <= 0:
+        script = []
+    
+    simulation = WightSimulation(args.seed, args.tick, args.sample_interval)
+    report = simulation.run(args.days * 86400.0, script, args.interaction_interval, args.verbose)
+    
+    if args.json:
+        report["samples"] = simulation.samples
+        print(json.dumps(report, indent=2))
+        return 0
+    
+    print(f"🧪 Simulated {report['sim_seconds']/86400:.2f} days in {report['wall_seconds']:.1f}s "
+          f"({report['speedup']:.0f}x real time)")
+    print(f"⏱️ {report['ticks']} ticks, {report['ticks_per_second']:.0f} ticks/sec, "
+          f"{report['interactions']} interactions")
+    for key, value in report["growth"].items():
+        print(f"📈 {key}: {report['final'][key]} ({value:+})")
+    print(f"🔑 State digest: {report['state_digest']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())